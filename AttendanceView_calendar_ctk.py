@@ -3,6 +3,12 @@ import tkinter as tk
 from datetime import date, datetime
 import calendar as pycal
 from tkinter import messagebox 
+from concurrent.futures import ThreadPoolExecutor
+from attendance_writer import AttendanceWriter, WRITER_SAVING, WRITER_SAVED, WRITER_FAILED
+from perf_metrics import timed, increment
+
+SAVE_STATUS_POLL_MS = 200 # 저장 상태 표시 갱신 주기
+RESIZE_DEBOUNCE_MS = 80 # 창 크기 조절이 멈춘 뒤 레이블 줄바꿈 폭을 갱신하기까지의 대기 시간
 
 class AttendanceCalendarCTK(ctk.CTkFrame):
         
@@ -62,6 +68,17 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         self.attendance_records = {} 
         self.selected_date_str = today.strftime("%Y-%m-%d")
         self.current_highlighted_card = None 
+        self.day_cells = [] # 42개(6주 x 7일) 날짜 셀 위젯 풀 - 한 번 만들고 재사용
+        # 이전/다음 달 뷰 모델을 미리 계산하는 작업 스레드 (결과는 DataManager의 월간 뷰 LRU 캐시에 저장)
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-prefetch")
+        self._prefetch_job = None
+        # Excel 저장 전담 작업 스레드 (저장 요청은 합쳐지고, Tk 스레드는 기록을 기다리지 않음)
+        self.writer = AttendanceWriter(data_manager)
+        self._save_status_job = None
+        # 기록 레이블 줄바꿈 폭 (셀 너비 기준) - <Configure> 이벤트에서만 다시 계산
+        self._wraplength = None
+        self._pending_grid_width = None
+        self._resize_job = None
 
         # -----------------------------------------------------------------------
         # --- 2. 달력 격자 레이아웃 설정 (세로 확장 문제 해결의 핵심) ---
@@ -125,6 +142,16 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         self.input_form_frame = ctk.CTkFrame(self, corner_radius=0)
         self.input_form_frame.grid(row=0, column=0, padx=0, pady=0, sticky="nsew") 
         self.input_form_frame.grid_rowconfigure(99, weight=1) # 하단에 빈 공간 확보
+        self.input_form_frame.grid_rowconfigure(0, weight=1)
+        self.input_form_frame.grid_columnconfigure(0, weight=1)
+
+        # 입력 폼 내용 컨테이너 (_build_input_form): 0행 상단 고정 / 1행 스크롤 영역(확장) / 2행 버튼 고정
+        self.input_frame_container = ctk.CTkFrame(self.input_form_frame, fg_color="transparent")
+        self.input_frame_container.grid(row=0, column=0, sticky="nsew")
+        self.input_frame_container.grid_columnconfigure(0, weight=1)
+        self.input_frame_container.grid_rowconfigure(0, weight=0)
+        self.input_frame_container.grid_rowconfigure(1, weight=1)
+        self.input_frame_container.grid_rowconfigure(2, weight=0)
 
         # 3. 달력 프레임 (오른쪽, column=1)
         self.calendar_frame = ctk.CTkFrame(self, corner_radius=0)
@@ -197,6 +224,8 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
 
         for r in range(7): self.grid_container.rowconfigure(r, weight=1)
         for c in range(7): self.grid_container.columnconfigure(c, weight=1)
+        # 크기 변경 시 (디바운스 후) 기존 레이블의 줄바꿈 폭만 갱신합니다.
+        self.grid_container.bind("<Configure>", self._on_grid_configure, add="+")
 
 
         
@@ -236,6 +265,7 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         scroll_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=2)
         
         self.entry_vars = {} 
+        self.entry_widgets = [] # _set_input_form_state에서 일괄 활성/비활성
         
         for i, emp in enumerate(self.employees):
             emp_frame = ctk.CTkFrame(scroll_frame)
@@ -247,7 +277,9 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
             
             check_in_var = ctk.StringVar()
             self.entry_vars[f"{emp}_in"] = check_in_var
-            ctk.CTkEntry(emp_frame, textvariable=check_in_var, width=120, placeholder_text="HH:MM/Status").grid(row=0, column=1, padx=(10,5), pady=2, sticky="e")
+            entry = ctk.CTkEntry(emp_frame, textvariable=check_in_var, width=120, placeholder_text="HH:MM/Status")
+            entry.grid(row=0, column=1, padx=(10,5), pady=2, sticky="e")
+            self.entry_widgets.append(entry)
             
             emp_frame.grid_columnconfigure(0, weight=1)
             emp_frame.grid_columnconfigure(1, weight=0)
@@ -267,71 +299,74 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
                      font=ctk.CTkFont(size=10), text_color="#FFD700",wraplength=350, justify="left").pack(anchor="w", padx=5, pady=(0,0)) # ⭐ 수정 7: 하단 패딩을 (0,0)으로 제거
 
 
-    # -------------------------------------------------------
-    # ⭐ 1. 폰트와 버튼 높이 정의 (클래스 내부 또는 메서드 상단) ⭐
-    # AttendanceCalendarCTK 클래스의 __init__ 메서드 내부에 정의하는 것이 가장 좋습니다.
-    self.BUTTON_FONT = ctk.CTkFont(family="Malgun Gothic", size=8, weight="bold")
-    self.BUTTON_HEIGHT = 30 # 버튼 높이를 45px로 설정했습니다.
-    # -------------------------------------------------------
+        # -------------------------------------------------------
+        # ⭐ 1. 폰트와 버튼 높이 정의 (클래스 내부 또는 메서드 상단) ⭐
+        # AttendanceCalendarCTK 클래스의 __init__ 메서드 내부에 정의하는 것이 가장 좋습니다.
+        self.BUTTON_FONT = ctk.CTkFont(family="Malgun Gothic", size=8, weight="bold")
+        self.BUTTON_HEIGHT = 30 # 버튼 높이를 45px로 설정했습니다.
+        # -------------------------------------------------------
     
-    # ------------------- 하단 고정 영역 -------------------
-    # ⭐ 2. 버튼을 하단에 고정하는 프레임 추가 ⭐
-    btn_fixed_frame = ctk.CTkFrame(self.input_frame_container, fg_color="transparent")
-    # ⭐ 수정 8: 하단 패딩을 10에서 5로 최소화
-    btn_fixed_frame.grid(row=2, column=0, sticky="sew", padx=10, pady=5)
-    btn_fixed_frame.grid_columnconfigure(0, weight=1)
-    btn_fixed_frame.grid_columnconfigure(1, weight=1)
+        # ------------------- 하단 고정 영역 -------------------
+        # ⭐ 2. 버튼을 하단에 고정하는 프레임 추가 ⭐
+        btn_fixed_frame = ctk.CTkFrame(self.input_frame_container, fg_color="transparent")
+        # ⭐ 수정 8: 하단 패딩을 10에서 5로 최소화
+        btn_fixed_frame.grid(row=2, column=0, sticky="sew", padx=10, pady=5)
+        btn_fixed_frame.grid_columnconfigure(0, weight=1)
+        btn_fixed_frame.grid_columnconfigure(1, weight=1)
     
-    # 💾 Save Record (저장 버튼)
-    ctk.CTkButton(
-        btn_fixed_frame, 
-        text="Save Record", 
-        command=self._save_attendance,
-        # ⭐ 높이 및 폰트 적용 ⭐ (8칸 들여쓰기)
-        height=self.BUTTON_HEIGHT, 
-        font=self.BUTTON_FONT
-    ).grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        # 💾 Save Record (저장 버튼)
+        self.save_btn = ctk.CTkButton(
+            btn_fixed_frame, 
+            text="Save Record", 
+            command=self._save_attendance,
+            # ⭐ 높이 및 폰트 적용 ⭐ (8칸 들여쓰기)
+            height=self.BUTTON_HEIGHT, 
+            font=self.BUTTON_FONT
+        )
+        self.save_btn.grid(row=0, column=0, sticky="ew", padx=(0, 5))
     
-    # 🗑 Delete Record (삭제 버튼)
-    ctk.CTkButton(
-        btn_fixed_frame, 
-        text="Delete Record", 
-        fg_color="red", 
-        hover_color="#990000", 
-        command=self._delete_attendance,
-        # ⭐ 높이 및 폰트 적용 ⭐ (8칸 들여쓰기)
-        height=self.BUTTON_HEIGHT,
-        font=self.BUTTON_FONT
-    ).grid(row=0, column=1, sticky="ew", padx=(5, 0))
+        # 🗑 Delete Record (삭제 버튼)
+        self.delete_btn = ctk.CTkButton(
+            btn_fixed_frame, 
+            text="Delete Record", 
+            fg_color="red", 
+            hover_color="#990000", 
+            command=self._delete_attendance,
+            # ⭐ 높이 및 폰트 적용 ⭐ (8칸 들여쓰기)
+            height=self.BUTTON_HEIGHT,
+            font=self.BUTTON_FONT
+        )
+        self.delete_btn.grid(row=0, column=1, sticky="ew", padx=(5, 0))
+
+        # 💾 저장 상태 표시 (저장은 AttendanceWriter 작업 스레드에서 실행됨)
+        self.save_status_label = ctk.CTkLabel(btn_fixed_frame, text="", font=self.BUTTON_FONT, text_color="gray")
+        self.save_status_label.grid(row=1, column=0, columnspan=2, sticky="e", pady=(2, 0))
 
 
-    // AttendanceView_calendar_ctk.py 파일 내 _update_input_form 메서드 내부
+    # AttendanceView_calendar_ctk.py 파일 내 _update_input_form 메서드 내부
 
+    @timed("calendar_ctk.update_form")
     def _update_input_form(self):
         
         current_std_time = self.data_manager.settings.get("attendance_time")
         self.std_time_label.configure(text=f"Standard Check-in: {current_std_time}")
         
-        print(f"[DEBUG:update_form] Searching for data on: {self.selected_date_str}") 
-
         self.selected_date_label.configure(text=self.selected_date_str)
         
         # 데이터 로드 (이전 단계에서 성공 확인됨)
         day_map = self.data_manager.attendance_data.get(self.selected_date_str, {})
         
-        print(f"[DEBUG:update_form] Retrieved data (day_map): {day_map}")
-        
         # ⭐ 핵심 수정: 데이터를 입력 폼에 채우는 로직입니다. ⭐
         # 1. 데이터가 존재할 경우: 로드된 데이터로 폼 채우기
         if day_map:
-            for key, var in self.entry_vars.items():
-                # entry_vars의 key는 직원 이름이며, day_map에서 해당 직원의 근태 상태를 가져옵니다.
+            for emp in self.employees:
+                # entry_vars의 key는 '{직원명}_in'이며, day_map에서 해당 직원의 근태 상태를 가져옵니다.
                 # 데이터가 없으면 'WO' (근무 외)를 기본값으로 설정합니다.
-                status_str = day_map.get(key, "WO") 
-                var.set(status_str)
+                status_str = day_map.get(emp, "WO") 
+                self.entry_vars[f"{emp}_in"].set(status_str)
             
             # MEMO 필드 채우기
-            memo = day_map.get("MEMO", "")
+            memo = day_map.get("__MEMO__", "")
             self.memo_textbox.delete("1.0", "end")
             self.memo_textbox.insert("1.0", memo)
         
@@ -348,12 +383,16 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         # 폼의 상태를 초기화 (필요하다면)
         self._set_input_form_state("normal")
 
+    def _set_input_form_state(self, state):
+        """입력칸, 메모, 저장/삭제 버튼을 한 번에 "normal" 또는 "disabled"로 바꿉니다."""
+        for widget in (*self.entry_widgets, self.memo_textbox, self.save_btn, self.delete_btn):
+            widget.configure(state=state)
+
 
     def _save_attendance(self):
         date_str = self.selected_date_str
-        new_day_map = {}
-        
-        current_std_time = self.data_manager.settings.get("attendance_time")
+        current_map = self.data_manager.attendance_data.get(date_str, {})
+        day_changes = {}
 
         try:
             std_time = datetime.strptime(self.attendance_standard_time, '%H:%M').time()
@@ -364,10 +403,15 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         for emp in self.employees:
             check_in_input = self.entry_vars[f"{emp}_in"].get().strip().upper()
             
-            if not check_in_input: continue 
+            if not check_in_input:
+                day_changes[emp] = None # 빈 입력 = 해당 직원 기록 삭제
+                continue
+
+            if check_in_input == str(current_map.get(emp, "")).upper():
+                continue # 기존 기록 그대로 (예: 'ATT(8:30)')
 
             if check_in_input in ["WO", "PEL", "ANL", "HAL", "SIL", "SPL", "EVL"]:
-                new_day_map[emp] = check_in_input
+                day_changes[emp] = check_in_input
             
             else:
                 try:
@@ -375,97 +419,69 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
                     formatted_time = check_in_input.lstrip('0') 
                     
                     if input_time <= std_time:
-                        new_day_map[emp] = f"ATT({formatted_time})"
+                        day_changes[emp] = f"ATT({formatted_time})"
                     else:
-                        new_day_map[emp] = f"LATE({formatted_time})"
+                        day_changes[emp] = f"LATE({formatted_time})"
                         
                 except ValueError:
                     messagebox.showwarning("Warning", f"Input value '{check_in_input}' for {emp} is invalid. (Must be HH:MM, WO, PEL, ANL, HAL, SIL, SPL, or EVL)")
                     continue
         
-        memo = self.memo_textbox.get("1.0", "end").strip()
-        if memo:
-            new_day_map["MEMO"] = memo
-            
-        if not new_day_map or (len(new_day_map) == 1 and "MEMO" in new_day_map):
-            self.data_manager.delete_attendance_record(date_str)
-        else:
-            self.data_manager.save_attendance_record(date_str, new_day_map)
+        day_changes["__MEMO__"] = self.memo_textbox.get("1.0", "end").strip() or None
 
-        self.refresh_records()
-        self._draw_calendar()
-        self._update_input_form() 
-        messagebox.showinfo("Save Complete", f"{date_str} record has been saved.")
+        # 메모리 반영은 즉시, Excel 기록은 AttendanceWriter 작업 스레드에서 진행
+        self.data_manager.apply_attendance_changes({date_str: day_changes})
+        self._on_save_requested()
         
     def _delete_attendance(self):
         date_str = self.selected_date_str
         
-        if not self.attendance_records.get(date_str):
+        if not self.data_manager.attendance_data.get(date_str):
              messagebox.showinfo("Info", f"No record found for {date_str}.")
              return
              
         if messagebox.askyesno("Confirm", f"Are you sure you want to delete all attendance records and memo for {date_str} and update the Excel file?"):
             try:
-                self.data_manager.delete_attendance_record(date_str)
-                
-                self.refresh_records()
-                self._draw_calendar()
-                self._update_input_form() 
-                    
-                messagebox.showinfo("Delete Complete", f"{date_str} record has been deleted.")
+                self.data_manager.delete_all_attendance(date_str)
+                self._on_save_requested()
             except Exception as e:
                 messagebox.showerror("Error", f"An error occurred while deleting the record: {e}")
 
-    # ------------------ 달력/UI 상호작용 ------------------
-    def _determine_day_status(self, day_map):
-        statuses = [str(v).upper() for k,v in day_map.items() if k!="MEMO"]
-
-        # ⭐ 지각/출석 우선순위 (가장 높음) ⭐
-        if any('LATE' in s for s in statuses): return "LATE"
-        if any('ATT' in s for s in statuses): return "ATT"
-        
-        # ⭐ 휴가/외근 우선순위 (나머지 상태) ⭐
-        # EVL, SPL, SIL, HAL, ANL, PEL, WO 순으로 우선순위를 설정 (필요에 따라 순서 조정 가능)
-        if any('EVL' in s for s in statuses): return "EVL"
-        if any('SPL' in s for s in statuses): return "SPL"
-        if any('SIL' in s for s in statuses): return "SIL"
-        if any('HAL' in s for s in statuses): return "HAL"
-        if any('ANL' in s for s in statuses): return "ANL"
-        if any('PEL' in s for s in statuses): return "PEL"
-        if any('WO' in s for s in statuses): return "WO"
-        # 기존 CV, PV는 삭제되었습니다.
-
-        return "NONE"
-
-    def _get_status_from_string(self, status_str):
-        if not isinstance(status_str, str): return None
-        raw = status_str.upper()
-        if raw.startswith('ATT(') or raw == 'ATT': return 'ATT'
-        if raw.startswith('LATE(') or raw == 'LATE' : return 'LATE'
-        if raw == 'WO': return 'WO'
-        # 기존: CV, PV 삭제
-        # if raw == 'PV': return 'PV'
-        # if raw == 'CV': return 'CV'
-        
-        # ⭐ 새 상태 추가 ⭐
-        if raw == 'PEL': return 'PEL'
-        if raw == 'ANL': return 'ANL'
-        if raw == 'HAL': return 'HAL'
-        if raw == 'SIL': return 'SIL'
-        if raw == 'SPL': return 'SPL'
-        if raw == 'EVL': return 'EVL'
-        
-        return None
-
+    def _on_save_requested(self):
+        """저장 요청 직후 화면을 갱신하고 저장 상태 표시 폴링을 시작합니다."""
+        self.refresh_records()
+        self._draw_calendar()
+        self._update_input_form()
+        if self._save_status_job is None:
+            self._poll_save_status()
+
+    def _poll_save_status(self):
+        """[Tk 스레드] AttendanceWriter 상태를 읽어 'Saving… / Saved' 표시를 갱신합니다. 저장 중이면 다시 예약합니다."""
+        self._save_status_job = None
+        status, last_saved_at, last_error = self.writer.state()
+
+        if status == WRITER_SAVING:
+            self.save_status_label.configure(text="Saving…", text_color="#FFC107")
+            self._save_status_job = self.after(SAVE_STATUS_POLL_MS, self._poll_save_status)
+        elif status == WRITER_SAVED:
+            saved_at = datetime.fromtimestamp(last_saved_at).strftime("%H:%M:%S")
+            self.save_status_label.configure(text=f"Saved {saved_at}", text_color="#8BC34A")
+        elif status == WRITER_FAILED:
+            self.save_status_label.configure(text="Save failed", text_color="#F44336")
+            messagebox.showerror("Error", f"Failed to save attendance.xlsx: {last_error}")
 
-    
+    # ------------------ 달력/UI 상호작용 ------------------
+    @timed("calendar_ctk.draw")
     def _draw_calendar(self):
 
-        """달력 그리드에 날짜와 출석 정보를 그립니다."""
+        """달력 그리드에 날짜와 출석 정보를 그립니다. (위젯 풀을 재사용하여 텍스트/색상/표시 여부만 갱신)"""
 
-        for widget in self.grid_container.winfo_children():
-            widget.destroy()
-        
+        if not self.day_cells:
+            self._build_day_cells()
+
+        # 이전 선택 하이라이트 해제 (재사용되는 카드이므로 색상을 직접 복원)
+        if self.current_highlighted_card is not None and hasattr(self.current_highlighted_card, '_original_bg'):
+            self.current_highlighted_card.configure(fg_color=self.current_highlighted_card._original_bg)
         self.current_highlighted_card = None
 
         self.title_label.configure(
@@ -474,223 +490,203 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
             justify="center"
         )
 
-        records = self.attendance_records
+        # 상태 판정/공휴일/표시 문자열은 DataManager의 월간 뷰 모델에서 (캐시되어) 가져옵니다.
+        view = self.data_manager.month_view(self.year, self.month)
         today_str = date.today().strftime("%Y-%m-%d")
-
-        raw_holidays = self.data_manager.settings.get("holidays", {})
-        holiday_map = {}
-        if isinstance(raw_holidays, dict):
-            for h_str, h_name in raw_holidays.items():
-                try:
-                    d = datetime.strptime(h_str.strip(), '%Y-%m-%d').date()
-                    holiday_map[d.strftime('%Y-%m-%d')] = h_name
-                except ValueError:
-                    pass
-
-        cal = pycal.Calendar(firstweekday=pycal.SUNDAY)
-        month_weeks = cal.monthdayscalendar(self.year, self.month)
+        wraplength = self._get_wraplength()
 
         for r in range(6):
-            week = month_weeks[r] if r < len(month_weeks) else [0] * 7
+            week = view.weeks[r] if r < len(view.weeks) else ()
 
-            for c, day in enumerate(week):
-                cell = ctk.CTkFrame(self.grid_container, fg_color=self.CELL_BG, corner_radius=0)
-                cell.grid_columnconfigure(0, weight=1)
-                cell.grid_rowconfigure(0, weight=1)
-                cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
+            for c in range(7):
+                day_cell = self.day_cells[r * 7 + c]
+                day_view = week[c] if week and week[c].in_month else None
 
-                if day == 0:
+                # 내용이 같으면 (저장 후 다른 날짜 등) 위젯을 건드리지 않습니다. (줄바꿈 폭은 _apply_resize가 따로 갱신)
+                signature = (day_view, day_view is not None and day_view.date_str == today_str)
+                if signature == day_cell.signature:
                     continue
+                day_cell.signature = signature
 
-                day_str = f"{self.year}-{self.month:02d}-{day:02d}"
-                day_map = records.get(day_str, {})
-                status = self._determine_day_status(day_map)
-
-                cell_bg = self.CELL_BG
-                if c == 0:
-                    cell_bg = self.SUNDAY_COLOR
-                elif c == 6:
-                    cell_bg = self.SATURDAY_COLOR
-
-                holiday_name = holiday_map.get(day_str)
-                is_holiday = holiday_name is not None
-                if is_holiday:
-                    cell_bg = self.HOLIDAY_BG
-
-                if day_str == today_str:
-                    cell_bg = self.TODAY_BG
-
-                card = ctk.CTkFrame(
-                    cell,
-                    corner_radius=8,
-                    fg_color=cell_bg,
-                    border_color="#444444",
-                    border_width=1 if status != "NONE" else 0
-                )
-                card.grid_columnconfigure(0, weight=1)
-                card.grid(row=0, column=0, sticky="nsew")
-
-                date_lbl = ctk.CTkLabel(
-                    card,
-                    text=str(day),
-                    anchor="nw",
-                    font=self.DATE_FONT,
-                    text_color=self.STATUS_COLORS["TEXT"]
-                )
-                date_lbl.grid(row=0, column=0, sticky="new", padx=6, pady=(6, 0))
-
-                current_row = 1
-
-                if is_holiday:
-                    h_lbl = ctk.CTkLabel(
-                        card,
-                        text=f"🎉 {holiday_name}",
-                        anchor="w",
-                        font=self.HOLIDAY_FONT,
-                        text_color="#FFFFFF"
-                    )
-                    h_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=(0, 2))
-                    current_row += 1
-
-                for emp, status_str in day_map.items():
-                    if emp == "__MEMO__":
-                        continue
-
-                    core_status = self._get_status_from_string(status_str)
-                    line_color = self.STATUS_COLORS.get(core_status, self.STATUS_COLORS["TEXT"])
-                    line_text = f"{emp}: {status_str}"
-
-                    lbl = ctk.CTkLabel(
-                        card,
-                        text=line_text,
-                        anchor="w",
-                        font=self.CALENDAR_FONT,
-                        text_color=line_color,
-                        wraplength=self._get_wraplength()    # ★ 수정됨
-                    )
-                    lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=(0, 1))
-                    current_row += 1
-
-                if not day_map or (len(day_map) == 1 and "__MEMO__" in day_map):
-                    empty_lbl = ctk.CTkLabel(
-                        card,
-                        text="(no data)",
-                        anchor="w",
-                        font=ctk.CTkFont(size=9),
-                        text_color="#AAAAAA"
-                    )
-                    empty_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=1)
-                    current_row += 1
-
-                if current_row > 1:
-                    card.grid_rowconfigure(current_row, weight=1)
-
-                click_handler = lambda e, d=day_str, c=card, b=cell_bg: self._on_day_click(d, c, b)
-                card.bind("<Button-1>", click_handler)
-
-                for child in card.winfo_children():
-                    child.bind("<Button-1>", click_handler)
-
-                cell.bind("<Button-1>", click_handler)
+                if day_view is None:
+                    day_cell.date_str = None
+                    day_cell.card.grid_remove()
+                    continue
 
-    def _get_wraplength(self):
-        return self.grid_container.winfo_width() // 7 - 12
+                self._update_day_cell(day_cell, day_view, c, today_str, wraplength)
+
+        # 화면이 그려진 뒤(idle) 인접 월을 백그라운드에서 준비합니다.
+        if self._prefetch_job is None:
+            self._prefetch_job = self.after_idle(self._prefetch_adjacent_months)
 
-    def _create_day_cell(self, parent, r, c, day, day_str, day_map, today_str, holiday_map):
+    def _prefetch_adjacent_months(self):
+        self._prefetch_job = None
+        prev_year, prev_month = (self.year - 1, 12) if self.month == 1 else (self.year, self.month - 1)
+        next_year, next_month = (self.year + 1, 1) if self.month == 12 else (self.year, self.month + 1)
+        self._prefetch_executor.submit(
+            self.data_manager.prefetch_month_views, [(next_year, next_month), (prev_year, prev_month)]
+        )
+
+    def _build_day_cells(self):
+        """날짜 셀(frame + card + 날짜/공휴일/빈 기록 레이블) 42개를 한 번만 생성합니다."""
+        for index in range(42):
+            r, c = divmod(index, 7)
+            cell = ctk.CTkFrame(self.grid_container, fg_color=self.CELL_BG, corner_radius=0)
+            cell.grid_columnconfigure(0, weight=1)
+            cell.grid_rowconfigure(0, weight=1)
+            cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
+
+            card = ctk.CTkFrame(cell, corner_radius=8, fg_color=self.CELL_BG, border_color="#444444", border_width=0)
+            card.grid_columnconfigure(0, weight=1)
+            card.grid(row=0, column=0, sticky="nsew")
+
+            date_lbl = ctk.CTkLabel(
+                card,
+                text="",
+                anchor="nw",
+                font=self.DATE_FONT,
+                text_color=self.STATUS_COLORS["TEXT"]
+            )
+            date_lbl.grid(row=0, column=0, sticky="new", padx=6, pady=(6, 0))
 
+            holiday_lbl = ctk.CTkLabel(
+                card,
+                text="",
+                anchor="w",
+                font=self.HOLIDAY_FONT,
+                text_color="#FFFFFF"
+            )
+            empty_lbl = ctk.CTkLabel(
+                card,
+                text="(no data)",
+                anchor="w",
+                font=ctk.CTkFont(size=9),
+                text_color="#AAAAAA"
+            )
+
+            day_cell = _DayCell(cell, card, date_lbl, holiday_lbl, empty_lbl)
+            click_handler = lambda e, dc=day_cell: self._on_day_cell_click(dc)
+            day_cell.click_handler = click_handler
+            for widget in (cell, card, date_lbl, holiday_lbl, empty_lbl):
+                widget.bind("<Button-1>", click_handler)
+
+            self.day_cells.append(day_cell)
+
+    def _update_day_cell(self, day_cell, day_view, c, today_str, wraplength):
+        """재사용 셀 하나를 day_view 내용으로 다시 설정합니다. 기록 레이블은 부족할 때만 새로 만듭니다."""
         cell_bg = self.CELL_BG
         if c == 0:
             cell_bg = self.SUNDAY_COLOR
         elif c == 6:
             cell_bg = self.SATURDAY_COLOR
 
-        holiday_name = holiday_map.get(day_str)
+        holiday_name = day_view.holiday_name
         is_holiday = holiday_name is not None
         if is_holiday:
             cell_bg = self.HOLIDAY_BG
 
-        if day_str == today_str:
+        if day_view.date_str == today_str:
             cell_bg = self.TODAY_BG
 
-        cell = ctk.CTkFrame(parent, fg_color=self.CELL_BG, corner_radius=0)
-        cell.grid_columnconfigure(0, weight=1)
-        cell.grid_rowconfigure(0, weight=1)
-        cell.grid(row=r, column=c, sticky="nsew", padx=2, pady=2)
-
-        card = ctk.CTkFrame(
-            cell,
-            corner_radius=8,
-            fg_color=cell_bg,
-            border_color="#444444",
-            border_width=1
-        )
-        card.grid_columnconfigure(0, weight=1)
-        card.grid(row=0, column=0, sticky="nsew")
-
-        date_lbl = ctk.CTkLabel(
-            card,
-            text=str(day),
-            anchor="nw",
-            font=self.DATE_FONT,
-            text_color=self.STATUS_COLORS["TEXT"]
-        )
-        date_lbl.grid(row=0, column=0, sticky="new", padx=6, pady=(6, 0))
+        day_cell.date_str = day_view.date_str
+        day_cell.bg = cell_bg
+
+        card = day_cell.card
+        card.configure(fg_color=cell_bg, border_width=1 if day_view.dominant_status != "NONE" else 0)
+        card.grid()
+        day_cell.date_lbl.configure(text=str(day_view.day))
 
         current_row = 1
 
         if is_holiday:
-            h_lbl = ctk.CTkLabel(
-                card,
-                text=f"🎉 {holiday_name}",
-                anchor="w",
-                font=self.HOLIDAY_FONT,
-                text_color="#FFFFFF"
-            )
-            h_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=(0, 2))
+            day_cell.holiday_lbl.configure(text=f"🎉 {holiday_name}")
+            day_cell.holiday_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=(0, 2))
             current_row += 1
-
-        for emp, status_str in day_map.items():
-            if emp == "__MEMO__":
-                continue
-
-            core_status = self._get_status_from_string(status_str)
-            line_color = self.STATUS_COLORS.get(core_status, self.STATUS_COLORS["TEXT"])
-            line_text = f"{emp}: {status_str}"
-
-            lbl = ctk.CTkLabel(
-                card,
-                text=line_text,
-                anchor="w",
-                font=self.CALENDAR_FONT,
-                text_color=line_color,
-                wraplength=self._get_wraplength()     # ★ 수정됨
+        else:
+            day_cell.holiday_lbl.grid_remove()
+
+        for i, rec in enumerate(day_view.records):
+            if i == len(day_cell.record_labels):
+                lbl = ctk.CTkLabel(card, text="", anchor="w", font=self.CALENDAR_FONT)
+                lbl.bind("<Button-1>", day_cell.click_handler)
+                day_cell.record_labels.append(lbl)
+
+            lbl = day_cell.record_labels[i]
+            lbl.configure(
+                text=f"{rec.employee}: {rec.record}",
+                text_color=self.STATUS_COLORS.get(rec.status, self.STATUS_COLORS["TEXT"]),
+                wraplength=wraplength
             )
-            lbl.grid(row=current_row, column=0, sticky="nw", padx=6, pady=(0, 1))
+            lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=(0, 1))
             current_row += 1
 
-        if not day_map or (len(day_map) == 1 and "__MEMO__" in day_map):
-            empty_lbl = ctk.CTkLabel(
-                card,
-                text="(no data)",
-                anchor="w",
-                font=ctk.CTkFont(size=9),
-                text_color="#AAAAAA"
-            )
-            empty_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=1)
+        for lbl in day_cell.record_labels[len(day_view.records):]:
+            lbl.grid_remove()
+
+        if not day_view.records:
+            day_cell.empty_lbl.grid(row=current_row, column=0, sticky="ew", padx=6, pady=1)
             current_row += 1
+        else:
+            day_cell.empty_lbl.grid_remove()
 
-        if current_row > 1:
+        # 남는 세로 공간을 마지막 행 아래로 보냅니다. (이전 그리기의 filler 행은 초기화)
+        if day_cell.filler_row != current_row:
+            if day_cell.filler_row is not None:
+                card.grid_rowconfigure(day_cell.filler_row, weight=0)
             card.grid_rowconfigure(current_row, weight=1)
+            day_cell.filler_row = current_row
+
+    def _on_day_cell_click(self, day_cell):
+        if day_cell.date_str is None: # 이번 달이 아닌 빈 칸
+            return
+        self._on_day_click(day_cell.date_str, day_cell.card, day_cell.bg)
+
+    def destroy(self):
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+            self._prefetch_job = None
+        if self._save_status_job is not None:
+            self.after_cancel(self._save_status_job)
+            self._save_status_job = None
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+            self._resize_job = None
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        # 창을 닫을 때 대기 중인 저장을 끝까지 기록 (이후 저장은 다시 동기 방식)
+        self.writer.close()
+        super().destroy()
 
-        click_handler = lambda e, d=day_str, c=card, b=cell_bg: self._on_day_click(d, c, b)
-        card.bind("<Button-1>", click_handler)
-        for child in card.winfo_children():
-            child.bind("<Button-1>", click_handler)
-        cell.bind("<Button-1>", click_handler)
-
-
+    def _get_wraplength(self):
+        """캐시된 줄바꿈 폭을 반환합니다. 아직 <Configure>를 받지 못했을 때만 winfo_width()를 한 번 조회합니다."""
+        if self._wraplength is None:
+            width = self.grid_container.winfo_width()
+            if width <= 1:
+                return 0 # 아직 화면에 배치되지 않음 (줄바꿈 없음, 첫 <Configure>에서 갱신)
+            self._wraplength = self._wraplength_for(width)
+        return self._wraplength
+
+    @staticmethod
+    def _wraplength_for(grid_width):
+        return max(grid_width // 7 - 12, 0)
+
+    def _on_grid_configure(self, event):
+        """grid_container 크기 변경 이벤트. 드래그 중 연속으로 들어오는 이벤트는 마지막 하나만 처리합니다."""
+        self._pending_grid_width = event.width
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        """셀 너비를 한 번만 계산하여 기존 기록 레이블의 wraplength를 제자리에서 갱신합니다. (달력 다시 그리기 없음)"""
+        self._resize_job = None
+        wraplength = self._wraplength_for(self._pending_grid_width)
+        if wraplength == self._wraplength:
+            return
+        self._wraplength = wraplength
+        for day_cell in self.day_cells:
+            for lbl in day_cell.record_labels:
+                lbl.configure(wraplength=wraplength)
 
-                    
     def _go_to_today(self):
         """현재 날짜로 달력을 이동하고, 해당 날짜를 선택합니다."""
         today = date.today()
@@ -700,6 +696,15 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         self._draw_calendar()
         self._update_input_form()
 
+    def show_date(self, date_str):
+        """지정한 날짜('YYYY-MM-DD')의 달로 이동하고 해당 날짜를 선택합니다. (연간 히트맵 클릭 등에서 호출)"""
+        target = datetime.strptime(date_str, "%Y-%m-%d").date()
+        self.year = target.year
+        self.month = target.month
+        self.selected_date_str = date_str
+        self._draw_calendar()
+        self._update_input_form()
+
     def _prev_month(self):
         self.month -= 1
         if self.month < 1: self.month = 12; self.year -= 1
@@ -732,8 +737,23 @@ class AttendanceCalendarCTK(ctk.CTkFrame):
         # 2. 입력 폼 업데이트 (필수 데이터 처리)
         # ⭐ 이 부분이 핵심입니다. 클릭 시마다 항상 실행되어야 합니다. ⭐
         self.selected_date_str = day_str
-
-# ⭐ 디버깅 코드 추가: 선택된 날짜 확인 ⭐
-        print(f"[DEBUG:on_day_click] Selected Date: {self.selected_date_str}") # ⭐ 이 줄은 반드시 '#' 주석이 아닌 코드로 유지 ⭐
-
-        self._update_input_form() # 이 함수가 호출되면 왼쪽 입력창이 갱신됩니다.
\ No newline at end of file
+        increment("calendar_ctk.day_click")
+
+        self._update_input_form() # 이 함수가 호출되면 왼쪽 입력창이 갱신됩니다.
+
+
+class _DayCell:
+    """AttendanceCalendarCTK의 재사용 날짜 셀 하나 (위젯 + 현재 표시 중인 날짜/배경색)."""
+
+    def __init__(self, cell, card, date_lbl, holiday_lbl, empty_lbl):
+        self.cell = cell
+        self.card = card
+        self.date_lbl = date_lbl
+        self.holiday_lbl = holiday_lbl
+        self.empty_lbl = empty_lbl
+        self.record_labels = [] # 기록 한 줄당 레이블 (필요할 때만 늘어남)
+        self.click_handler = None
+        self.filler_row = None
+        self.signature = None # 마지막으로 그린 내용 (같으면 다시 설정하지 않음)
+        self.date_str = None
+        self.bg = None
@@ -0,0 +1,473 @@
+# app_pages/attendance_entry.py
+# 근태 기록 입력 페이지 (직원별 입력 폼 + 월간 달력). app.py의 st.navigation에서 실행됩니다.
+
+import streamlit as st
+from datetime import datetime as dt_class, date
+import re
+
+from calendar_component import calendar_grid
+from perf_metrics import timed
+
+# ----------------------------------------------------
+# 1. CONSTANTS and SETUP
+# ----------------------------------------------------
+
+STATUS_COLORS = {
+    "ATT": "#4FC3F7", "LATE": "#F44336", "WO": "#FFFFFF", 
+    "PEL": "#FFC107", "ANL": "#00BCD4", "HAL": "#8BC34A", 
+    "SIL": "#9C27B0", "SPL": "#FF5722", "EVL": "#607D8B",
+    "NONE": "#1E1E1E" 
+}
+
+CALENDAR_WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+RECORD_FONT_COLORS = {"ATT": "green", "LATE": "red"}
+
+# Define all attendance status types
+ALL_ATTENDANCE_TYPES = ["hh:mm", "WO", "PEL", "ANL", "HAL", "SIL", "SPL", "EVL"]
+
+# Manual for each TYPE (English)
+TYPE_MANUAL = {
+    "hh:mm": "Time Input (e.g., 09:00):",
+    "WO": "Work Out ",
+    "PEL": "Personal Leave",
+    "ANL": "Annual Leave ",
+    "HAL": "Half-day Leave ",
+    "SIL": "Sick Leave ",
+    "SPL": "Special Leave ",
+    "EVL": "Event Leave"
+}
+
+# Initialized by app.py before this page runs
+dm = st.session_state['dm']
+
+# ----------------------------------------------------
+# 2. CALLBACKS
+# ----------------------------------------------------
+
+def save_multi_attendance():
+    """Batch saves attendance records (time or TYPE) and memo for each employee using DataManager."""
+    selected_date = st.session_state.get('selected_date')
+    if not selected_date:
+        st.error("No date has been selected.")
+        return
+
+    employees = dm.get_employee_list()
+    data_to_save = {}
+    
+    # ----------------------------------------------------------------------
+    # ⭐ Core Fix: Extract value and determine status from a single input field (emp_input_i) ⭐
+    # ----------------------------------------------------------------------
+    for i, emp in enumerate(employees):
+        input_key = f'emp_input_{i}'
+        raw_input = (st.session_state.get(input_key) or "").strip().upper()
+        final_record = None
+        
+        if not raw_input:
+            continue 
+
+        # 1. Check HH:MM format (Time Input)
+        if re.match(r"^\d{1,2}:\d{2}$", raw_input):
+            time_input = raw_input
+            
+# Retain ATTRIBUTE ERROR fix logic implemented inline in the previous step
+            try:
+                # 1. Load standard time from settings (standard_time_str variable unified)
+                standard_time_str = dm.settings.get('attendance_time', '09:00')
+                today_date = date.today().strftime("%Y-%m-%d")
+                
+                # Parse input time
+                # ⭐ Modification: Use dt_class.strptime instead of datetime ⭐
+                input_dt = dt_class.strptime(
+                    f"{today_date} {time_input}",
+                    "%Y-%m-%d %H:%M" 
+                )
+                
+                # Parse standard time
+                # ⭐ Modification: Use dt_class.strptime and standard_time_str variable ⭐
+                standard_dt = dt_class.strptime(
+                    f"{today_date} {standard_time_str}", 
+                    "%Y-%m-%d %H:%M"
+                )
+
+                if input_dt <= standard_dt:
+                    status = "ATT"
+                else:
+                    status = "LATE"
+                    
+                # final_record example: "ATT(09:00)" or "LATE(09:15)"
+                final_record = f"{status}({time_input})"
+            
+            # Defensive logic against time format errors and system errors (Optional)
+            except ValueError:
+                final_record = f"ERROR(Format:{time_input})"
+            except Exception:
+                final_record = f"ERROR(System)"
+
+                return
+            
+        # 2. Check TYPE format (WO, ANL, etc.)
+        elif raw_input in ALL_ATTENDANCE_TYPES[1:]: # Exclude hh:mm
+            # final_record example: "WO" or "ANL"
+            final_record = raw_input
+            
+        # 3. Invalid Input
+        else:
+            st.error(f"❌ Input value '{raw_input}' for {emp} is not a valid time (HH:MM) or TYPE. Stopping save.")
+            return
+
+        if final_record:
+            # ⭐ Modification: Store the final status/time to be saved in final_record to data_to_save ⭐
+            data_to_save[emp] = final_record
+    
+    # ----------------------------------------------------
+    # 2. Memory Update and Final Save Trigger (Core Modified Section)
+    # ----------------------------------------------------
+    
+    memo_key = f'memo_{selected_date}'
+    memo_text = st.session_state.get(memo_key, "").strip() # Remove whitespace
+    
+    current_day_data = dm.attendance_data.get(selected_date, {})
+    old_memo_text = current_day_data.get('__MEMO__', "")
+
+    # Check if record and memo have changed
+    memo_changed = (old_memo_text != memo_text)
+    record_changed = bool(data_to_save) # If data_to_save has anything, the record changed
+    
+    if record_changed or memo_changed: # If data to save (attendance/memo) has changed
+        
+        # 2-1. Initialize data for that date (if necessary)
+        if selected_date not in dm.attendance_data:
+            dm.attendance_data[selected_date] = {}
+            
+        # 2-2. Update Memo (Memory)
+        if memo_text:
+            dm.attendance_data[selected_date]['__MEMO__'] = memo_text
+        elif '__MEMO__' in dm.attendance_data[selected_date]:
+            del dm.attendance_data[selected_date]['__MEMO__']
+            
+        # 2-3. Update Attendance Record (Memory) - Directly update instead of dm.save_attendance_record
+        for emp, record in data_to_save.items():
+            dm.attendance_data[selected_date][emp] = record
+            
+        # 2-4. Force save Excel file (Run only once after memory update is complete)
+        dm.save_internal_data() 
+            
+        # Shown by the entry form after the full rerun that redraws the calendar with the new records
+        st.session_state['entry_notice'] = f"Attendance records ({len(data_to_save)} items) and memo for {selected_date} successfully saved."
+        st.session_state['calendar_stale'] = True
+    else:
+        st.warning(f"No attendance records or memo content to save.")
+        
+    # st.rerun() # Keep removed state as before
+
+
+
+
+
+def delete_multi_attendance():
+    """Deletes all attendance records and memo for the selected date."""
+    selected_date = st.session_state.get('selected_date')
+    if not selected_date:
+        st.error("No date has been selected.")
+        return
+    
+    # Delete all records for the date from DataManager
+    dm.delete_all_attendance(selected_date)
+    
+    # ⭐ Delete Memo (Directly manipulate dm.attendance_data)
+    if selected_date in dm.attendance_data and '__MEMO__' in dm.attendance_data[selected_date]:
+        del dm.attendance_data[selected_date]['__MEMO__']
+    
+    st.session_state['entry_notice'] = f"🗑️ All attendance records and memo for {selected_date} have been deleted."
+    st.session_state['calendar_stale'] = True
+    # ⭐ Remove st.rerun() call. (Fixes no-op warning within callback function)
+    # st.rerun()
+
+# ----------------------------------------------------
+# 3. HELPER FUNCTIONS
+# ----------------------------------------------------
+
+def change_month(offset):
+    """Moves the calendar to the previous/next month."""
+    st.session_state['current_month'] += offset
+    if st.session_state['current_month'] > 12:
+        st.session_state['current_month'] = 1
+        st.session_state['current_year'] += 1
+    elif st.session_state['current_month'] < 1:
+        st.session_state['current_month'] = 12
+        st.session_state['current_year'] -= 1
+    st.session_state['selected_date'] = None
+    #st.rerun() 
+
+def select_date(day):
+    """Selects the clicked date and loads the input field data.""" 
+    if day:
+        date_str = f"{st.session_state['current_year']}-{st.session_state['current_month']:02d}-{day:02d}"
+        st.session_state['selected_date'] = date_str
+        
+        # ⭐ Logic to update input field values when a date is selected ⭐
+        if dm:
+            day_map = dm.attendance_data.get(date_str, {})
+            employees = dm.get_employee_list()
+
+            for i, emp in enumerate(employees):
+                input_key = f'emp_input_{i}'
+                current_record = day_map.get(emp)
+                
+                # Extract HH:MM from ATT(HH:MM) or LATE(HH:MM)
+                if '(' in str(current_record) and ')' in str(current_record):
+                    value = current_record.split('(')[-1].strip(')')
+                elif isinstance(current_record, str):
+                    # TYPE such as WO, ANL, etc.
+                    value = current_record.strip()
+                else:
+                    value = "" # Empty string if no record
+
+                # Set form field value by directly updating Streamlit's Session State
+                st.session_state[input_key] = value
+
+            # Update memo input field value
+            memo_key = f'memo_{date_str}'
+            # ⭐ Modification: Retrieve memo directly using the '__MEMO__' key from dm.attendance_data instead of dm.get_memo. ⭐
+            current_memo = dm.attendance_data.get(date_str, {}).get('__MEMO__', "")
+            
+            st.session_state[memo_key] = current_memo        
+    else:
+        st.session_state['selected_date'] = None
+
+def on_calendar_event():
+    """Handles a click in the calendar grid component (day selection or month navigation)."""
+    event = st.session_state.get('calendar_grid')
+    if not event:
+        return
+    
+    previous_selection = st.session_state.get('selected_date')
+    if event.get('action') == 'nav':
+        change_month(int(event.get('offset', 0)))
+    elif event.get('action') == 'select':
+        day_dt = dt_class.strptime(event['date'], "%Y-%m-%d")
+        st.session_state['current_year'] = day_dt.year
+        st.session_state['current_month'] = day_dt.month
+        select_date(day_dt.day)
+    
+    # Month navigation alone only reruns the calendar fragment; a changed selection also changes the entry form
+    if st.session_state.get('selected_date') != previous_selection:
+        st.session_state['entry_form_stale'] = True
+
+@timed("calendar_web.build_cells")
+def build_calendar_cells(year, month):
+    """Builds the per-day payload (background color, record lines) sent to the calendar grid component."""
+    # Statuses, display strings and summaries are precomputed (and cached) by DataManager.month_view
+    view = dm.month_view(year, month)
+    selected_date = st.session_state.get('selected_date')
+    cells = []
+    
+    for week in view.weeks:
+        for day in week:
+            if not day.in_month:
+                cells.append({'date': day.date_str, 'day': day.day, 'in_month': False})
+                continue
+            
+            cells.append({
+                'date': day.date_str,
+                'day': day.day,
+                'in_month': True,
+                'bg': STATUS_COLORS[day.summary_status],
+                'selected': day.date_str == selected_date,
+                # ATT: Green, LATE: Red, other TYPEs (WO, PEL, ANL, etc.): Yellow
+                'lines': [
+                    {'name': rec.employee, 'text': rec.display, 'color': RECORD_FONT_COLORS.get(rec.status, 'yellow')}
+                    for rec in day.records
+                ],
+            })
+    
+    return cells
+
+def get_current_record(emp_name):
+    """Gets the employee's record for the selected date."""
+    date_str = st.session_state.get('selected_date')
+    if not date_str or not dm:
+        return None
+    
+    return dm.attendance_data.get(date_str, {}).get(emp_name)
+
+def save_attendance():
+    # This function is superseded by save_multi_attendance, but the existing code is retained.
+    if not dm or not st.session_state['selected_date']:
+        st.warning("Please select a date or ensure Data Manager (dm) is ready.")
+        return
+
+    selected_date = st.session_state['selected_date']
+    emp_name = st.session_state['emp_selector']
+    status = st.session_state['status_radio']
+    time_str = st.session_state['check_in_time']
+    
+    if emp_name == "Select an Employee":
+        st.error("You must select an employee to record for.")
+        return
+        
+    if status in ['ATT', 'LATE'] and (not time_str or len(time_str.split(':')) != 2 or not time_str.replace(':', '').isdigit()):
+        st.error("Attendance/Late status requires a valid time input. (e.g., 09:00)")
+        return
+        
+    dm.save_attendance_record(selected_date, emp_name, status, time_str)
+    
+    st.success(f"Record for {emp_name} on {selected_date} successfully saved.")
+    st.rerun() 
+    
+# ----------------------------------------------------
+# PAGE UI: Attendance Record (Implementation in AttendanceView_calendar_ctk.py)
+# ----------------------------------------------------
+# CSS for vertical expansion of the calendar column (does not affect the entire page)
+st.markdown(
+    """
+    <style>
+    	/* Expand col_calendar area to maximum height */
+    	div[data-testid="column"]:nth-child(2) {
+    		min-height: 85vh;
+    	}
+    </style>
+    """,
+    unsafe_allow_html=True
+)
+
+# ----------------------------------------------------
+# Divide main layout into 2 columns (Input Form | Calendar)
+# ----------------------------------------------------
+col_input_form, col_calendar = st.columns([2, 8])
+
+
+# ====================================================
+# LEFT COLUMN (col_input_form): Place Attendance Input Form
+# ====================================================
+# Each panel is a fragment: typing in a field (or clicking in the calendar) reruns only the panel
+# it belongs to. A save/delete or a new date selection affects both panels and triggers one full rerun.
+@st.fragment
+def render_entry_form():
+    if st.session_state.pop('calendar_stale', False):
+        st.rerun()
+    
+    st.markdown(
+        f"""
+        <center>
+        <div style="font-size:20px; font-weight:bold; margin-bottom:10px; color: yellow;"> 
+            Attendance Records <br> ({st.session_state.get('selected_date', 'Date Not Selected')})
+        </div>
+        </center>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    notice = st.session_state.pop('entry_notice', None)
+    if notice:
+        st.success(notice)
+    
+    employees = dm.get_employee_list()
+    
+    # ⭐ Main IF statement starts: The ELSE statement connected to this IF likely caused an error on line 437. ⭐
+    if st.session_state.get('selected_date'): 
+        
+        # Warning if the employee list is empty (First nested IF)
+        if not employees:
+            st.warning("⚙️ Please first register your employee list in the Settings tab..")
+        # Execution if the employee list exists (First nested ELSE)
+        else:
+            
+            # ------------------------------------------------------------------
+            # 1. Integrate Single Input Field per Employee
+            # ------------------------------------------------------------------
+            #st.markdown("##### Enter Attendance Status per Employee")
+            
+            col_header_emp, col_header_status = st.columns([1, 1], gap="small")
+            col_header_emp.markdown("**Employee Name**")
+            col_header_status.markdown("**Status/Time**") 
+
+            for i, emp in enumerate(employees):
+                col_emp, col_input = st.columns([1, 1], gap="small")
+                
+                col_emp.markdown(f"**{emp}**")
+                
+                # NOTE: This get_current_record logic pre-populates st.session_state[key] in the select_date function, 
+                # so that value is prioritized.
+                current_record = get_current_record(emp)
+                if '(' in str(current_record) and ')' in str(current_record):
+                    initial_value = current_record.split('(')[-1].strip(')')
+                else:
+                    initial_value = current_record.strip() if isinstance(current_record, str) else ""
+
+                col_input.text_input(
+                    label='_hidden_time_or_type', 
+                    key=f'emp_input_{i}',
+                    placeholder="HH:MM or TYPE input",
+                    label_visibility='collapsed',
+                    width='stretch'
+                )
+
+            
+            # ------------------------------------------------------------------
+            # 4. Display Memo Input Field
+            # ------------------------------------------------------------------
+            st.markdown("##### 📝 Daily Memo")
+            memo_key = f'memo_{st.session_state["selected_date"]}'
+            current_memo = dm.get_memo(st.session_state["selected_date"]) if hasattr(dm, 'get_memo') else ""
+            st.text_area("Memo", value=current_memo, key=memo_key, height=100, label_visibility='collapsed')
+
+
+            # ------------------------------------------------------------------
+            # 5. Add SAVE, DELETE Buttons
+            # ------------------------------------------------------------------
+            col_save, col_delete = st.columns([1, 1], gap="small")
+            
+            col_save.button("✅ SAVE ALL", on_click=save_multi_attendance, width='stretch', type="primary")
+
+            col_delete.button("❌ DELETE ALL", on_click=delete_multi_attendance, width='stretch', type="secondary")
+
+            st.markdown("---")
+            
+            # ------------------------------------------------------------------
+            # 3. Display TYPE Manual (English)
+            # ------------------------------------------------------------------
+            st.markdown("##### 📚 Attendance Type Manual")
+            manual_text = ""
+            for type_key, description in TYPE_MANUAL.items():
+                manual_text += f"**{type_key}**: {description}  \n"
+            st.markdown(manual_text)
+
+
+# ⭐ ELSE statement connected to the Main IF ⭐
+# This else: block must have the same indentation level as the if st.session_state.get('selected_date'): immediately above it.
+    else:
+        st.info("Click a date on the calendar to enter attendance records.")
+
+with col_input_form:
+    render_entry_form()
+
+
+# ====================================================
+# RIGHT COLUMN (col_calendar): Place Calendar and Navigation
+# ====================================================
+@st.fragment
+def render_calendar():
+    if st.session_state.pop('entry_form_stale', False):
+        st.rerun()
+    
+    # The whole month (navigation, title, weekday header and day cells) is rendered as a single
+    # HTML/CSS grid component. A click returns one small event that is handled by on_calendar_event
+    # before the next run, instead of rebuilding dozens of st.columns / st.button widgets.
+    current_year = st.session_state['current_year']
+    current_month = st.session_state['current_month']
+    
+    with timed("calendar_web.render"):
+        calendar_grid(
+            title=dt_class(current_year, current_month, 1).strftime("%B %Y"),
+            weekdays=CALENDAR_WEEKDAYS,
+            cells=build_calendar_cells(current_year, current_month),
+            key='calendar_grid',
+            on_change=on_calendar_event,
+            default=None
+        )
+
+with col_calendar:
+    render_calendar()
+
+# End of Right Column
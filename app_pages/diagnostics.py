@@ -0,0 +1,79 @@
+# app_pages/diagnostics.py
+# 숨김 'Diagnostics' 페이지 (/diagnostics): perf_metrics로 계측한 구간별 실행 시간/카운터를 보여주고 JSON으로 내보냅니다.
+# 네비게이션 메뉴에는 표시되지 않으며 URL로만 접근합니다.
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from perf_metrics import METRICS
+
+# ----------------------------------------------------
+# 1. HELPER FUNCTIONS
+# ----------------------------------------------------
+
+def reset_metrics():
+    """Reset button callback: clears all timings and counters for this server process."""
+    METRICS.reset()
+
+def build_timing_table(timings):
+    """One row per instrumented section, slowest total time first."""
+    rows = [
+        {
+            "Section": name,
+            "Calls": stats["count"],
+            "Errors": stats["errors"],
+            "Mean (ms)": stats["mean_ms"],
+            "p50 (ms)": stats["p50_ms"],
+            "p95 (ms)": stats["p95_ms"],
+            "Max (ms)": stats["max_ms"],
+            "Total (ms)": stats["total_ms"],
+        }
+        for name, stats in timings.items()
+    ]
+    return pd.DataFrame(rows).sort_values("Total (ms)", ascending=False).reset_index(drop=True)
+
+# ----------------------------------------------------
+# PAGE UI: Diagnostics
+# ----------------------------------------------------
+
+st.markdown("### 🩺 Diagnostics")
+st.caption("Timings and counters collected in this server process since it started (or since the last reset). Shared by all sessions.")
+
+snapshot = METRICS.snapshot()
+timings = snapshot["timings"]
+
+col_refresh, col_reset, col_export = st.columns(3)
+with col_refresh:
+    st.button("🔄 Refresh", width='stretch')
+with col_reset:
+    st.button("🧹 Reset Metrics", on_click=reset_metrics, width='stretch')
+with col_export:
+    st.download_button(
+        "⬇️ Export JSON",
+        data=METRICS.to_json(),
+        file_name=f"diagnostics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json",
+        width='stretch'
+    )
+
+st.markdown(f"**Collecting since:** {snapshot['started_at']} ({snapshot['uptime_s']:.0f} s)")
+
+if not timings:
+    st.info("No timings recorded yet. Use the app (load a page, save a record, generate a report) and refresh.")
+else:
+    st.markdown("#### ⏱️ Section Timings")
+    st.dataframe(build_timing_table(timings), hide_index=True, width='stretch')
+
+    st.markdown("#### 📊 Latency Histogram")
+    section = st.selectbox("Section", list(timings.keys()))
+    histogram = pd.Series(timings[section]["histogram"], name="Calls")
+    # sort=False keeps the bucket order (otherwise the labels are sorted as strings: "<=1000ms" before "<=100ms")
+    st.bar_chart(histogram, x_label="Duration bucket", y_label="Calls", sort=False)
+
+if snapshot["counters"]:
+    st.markdown("#### 🔢 Counters")
+    st.dataframe(
+        pd.DataFrame(list(snapshot["counters"].items()), columns=["Counter", "Value"]),
+        hide_index=True, width='stretch'
+    )
@@ -0,0 +1,109 @@
+# app_pages/exchange_rates.py
+# 환율 조회 페이지 (USD 기준). requests(환율 캐시)는 이 페이지에서만 로드됩니다.
+
+import streamlit as st
+import pandas as pd
+
+from exchange_rate_cache import get_shared_cache
+
+TARGET_CURRENCIES = [
+    "USD", "KRW", "IDR", "JPY", "EUR", 
+    "CNY", "GBP", "CAD", "AUD", "SGD"
+]
+CURRENCY_NAMES = {
+    "USD": "US Dollar", "KRW": "South Korean Won", "IDR": "Indonesian Rupiah",
+    "JPY": "Japanese Yen", "EUR": "Euro", "CNY": "Chinese Yuan",
+    "GBP": "British Pound", "CAD": "Canadian Dollar", "AUD": "Australian Dollar",
+    "SGD": "Singapore Dollar"
+}
+
+# ----------------------------------------------------
+# 1. HELPER FUNCTIONS
+# ----------------------------------------------------
+
+REFRESH_WAIT_SECONDS = 2.0 # Refresh button: wait this long for the new rates before showing the panel again
+REFRESH_POLL_SECONDS = 1.0 # While a refresh is still running, the panel re-draws itself at this interval
+
+def request_rate_refresh():
+    """
+    Refresh button callback: revalidates the shared cache even if it is still within its TTL.
+    Waits briefly so a normal refresh shows the new rates right away; a slower one is picked up by poll_exchange_panel.
+    """
+    thread = get_shared_cache().refresh_async(force=True)
+    if thread is not None:
+        thread.join(REFRESH_WAIT_SECONDS)
+
+def fetch_exchange_rates():
+    """
+    Loads rates from the shared, disk-persisted rate cache into the session state.
+    A stale snapshot is shown immediately while at most one background refresh runs for the whole process.
+    """
+    cache = get_shared_cache()
+    
+    # Only the very first start (no snapshot on disk yet) waits for the API
+    snapshot = cache.get(wait_if_empty=True)
+    
+    if snapshot:
+        rates = {
+            curr: snapshot['rates'].get(curr) 
+            for curr in TARGET_CURRENCIES if snapshot['rates'].get(curr) is not None
+        }
+        status = "Status: Last updated at " + (snapshot.get('time_last_update_utc') or 'N/A')
+        if cache.refreshing:
+            status += " (refreshing in background...)"
+        elif cache.last_error:
+            status += " (offline: showing the last saved rates)"
+        
+        st.session_state['exchange_rates'] = rates
+        st.session_state['exchange_status'] = status
+        st.session_state['exchange_time'] = snapshot.get('time_last_update_utc', '')
+    else:
+        st.session_state['exchange_rates'] = None
+        st.session_state['exchange_status'] = "Status: Network Error"
+        st.session_state['exchange_time'] = ""
+        st.error(f"Network Error: {cache.last_error}")
+        
+# ----------------------------------------------------
+# PAGE UI: Exchange Rate Inquiry (Implemented in ExchangeRateViewer.py)
+# ----------------------------------------------------
+def draw_exchange_panel():
+    st.header("💵 Real-time Exchange Rate Information (Based on USD)")
+    
+    # Served from the shared cache on every run (no API call unless the snapshot is stale)
+    fetch_exchange_rates()
+    
+    col_status, col_button = st.columns([3, 1])
+    
+    col_status.markdown(st.session_state.get('exchange_status', 'Status: Not Fetched'), unsafe_allow_html=True)
+    col_button.button("Refresh", on_click=request_rate_refresh, key="refresh_rates")
+
+    rates = st.session_state.get('exchange_rates')
+    
+    if rates:
+        rate_data = {
+            "Currency": [f"{CURRENCY_NAMES.get(c, c)} ({c})" for c in TARGET_CURRENCIES],
+            "Exchange Rate (Per 1 USD)": [rates.get(c, 0) for c in TARGET_CURRENCIES]
+        }
+        rate_df = pd.DataFrame(rate_data)
+        
+        st.dataframe(
+            rate_df.style.format({"Exchange Rate (Per 1 USD)": "{:,.2f}"}),
+            use_container_width=True,
+            hide_index=True
+        )
+
+@st.fragment(run_every=REFRESH_POLL_SECONDS)
+def poll_exchange_panel():
+    """Re-draws the panel every second while a background refresh is running."""
+    draw_exchange_panel()
+    if not get_shared_cache().refreshing:
+        st.rerun() # Refresh finished: full rerun shows the new rates and stops the polling fragment
+
+@st.fragment
+def render_exchange_panel():
+    if get_shared_cache().refreshing:
+        poll_exchange_panel()
+    else:
+        draw_exchange_panel()
+
+render_exchange_panel()
@@ -0,0 +1,137 @@
+# app_pages/month_grid_entry.py
+# 월간 일괄 입력 페이지: 한 달 전체(날짜 x 직원)를 표에서 편집하고 한 번에 저장합니다.
+
+import streamlit as st
+import calendar as pycal
+
+from data_manager import classify_attendance_inputs, ENTRY_TYPES
+
+# Initialized by app.py before this page runs
+dm = st.session_state['dm']
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# ----------------------------------------------------
+# 1. HELPER FUNCTIONS
+# ----------------------------------------------------
+
+def collect_grid_changes(original, edited, employees):
+    """
+    Compares the edited grid with the original one and validates every changed cell in one vectorized pass.
+    Returns (changes, errors): changes is {date_str: {emp or '__MEMO__': record}} for DataManager.apply_attendance_changes,
+    errors is a DataFrame of invalid cells (Date, Employee, Input).
+    """
+    original = original.fillna("").astype(str)
+    edited = edited.reindex(index=original.index, columns=original.columns).fillna("").astype(str)
+    
+    # 1. Employee cells: only changed cells are validated (legacy values left untouched are kept as they are)
+    emp_changed = (original[employees] != edited[employees]).stack()
+    emp_values = edited[employees].stack()[emp_changed]
+    emp_values.index.names = ['Date', 'Employee']
+    
+    standard_time = dm.settings.get('attendance_time', '09:00')
+    records, invalid = classify_attendance_inputs(emp_values, standard_time)
+    
+    errors = emp_values[invalid].rename('Input').reset_index()
+    
+    # 2. Memo cells: free text, stored as-is
+    memo_changed = original['Memo'] != edited['Memo']
+    memos = edited.loc[memo_changed, 'Memo'].str.strip()
+    
+    changes = {}
+    for (date_str, emp), record in records[~invalid].items():
+        changes.setdefault(date_str, {})[emp] = record
+    for date_str, memo in memos.items():
+        changes.setdefault(date_str, {})['__MEMO__'] = memo
+    
+    return changes, errors
+
+# ----------------------------------------------------
+# PAGE UI: Month Grid Entry
+# ----------------------------------------------------
+st.header("🧮 Month Grid Entry")
+st.caption(
+    "Edit a whole month for all employees at once. Enter HH:MM (classified as ATT/LATE against the standard time) "
+    f"or a TYPE ({', '.join(ENTRY_TYPES)}). "
+    "Clear a cell to delete its record. Nothing is written until you press Save."
+)
+
+notice = st.session_state.pop('grid_notice', None)
+if notice:
+    st.success(notice)
+
+employees = dm.get_employee_list()
+if not employees:
+    st.warning("⚙️ Please first register your employee list in the Settings page.")
+    st.stop()
+
+# --- Date-range application (e.g. two weeks of ANL for one or more employees, one write) ---
+with st.expander("📅 Apply a Status to a Date Range"):
+    with st.form("status_range_form"):
+        range_employees = st.multiselect("Employees", employees, key='range_employees')
+        col_status, col_start, col_end = st.columns([1, 1, 1])
+        range_status = col_status.selectbox("Status", ENTRY_TYPES, index=ENTRY_TYPES.index("ANL"), key='range_status')
+        range_start = col_start.date_input("From", key='range_start')
+        range_end = col_end.date_input("To", key='range_end')
+        col_weekends, col_holidays, col_overwrite = st.columns([1, 1, 1])
+        skip_weekends = col_weekends.checkbox("Skip weekends", value=True, key='range_skip_weekends')
+        skip_holidays = col_holidays.checkbox("Skip holidays", value=True, key='range_skip_holidays')
+        overwrite = col_overwrite.checkbox("Overwrite existing records", value=True, key='range_overwrite')
+        range_submitted = st.form_submit_button("Apply to Range", type="primary")
+    
+    if range_submitted:
+        if not range_employees:
+            st.error("Select at least one employee.")
+        else:
+            try:
+                changed, dates = dm.apply_status_range(
+                    range_employees, range_status, range_start, range_end,
+                    skip_weekends=skip_weekends, skip_holidays=skip_holidays, overwrite=overwrite
+                )
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state['grid_notice'] = (
+                    f"{range_status} applied to {len(range_employees)} employee(s) on {len(dates)} day(s) "
+                    f"({changed} record(s) changed, single write)."
+                )
+                st.rerun()
+
+col_year, col_month, col_empty = st.columns([1, 1, 4])
+grid_year = col_year.number_input("Year", min_value=2020, max_value=2050, value=st.session_state['current_year'], key='grid_year')
+grid_month = col_month.number_input("Month", min_value=1, max_value=12, value=st.session_state['current_month'], key='grid_month')
+
+original_grid = dm.get_month_entry_grid(int(grid_year), int(grid_month))
+display_grid = original_grid.copy()
+display_grid.insert(0, 'Day', [WEEKDAY_NAMES[pycal.weekday(int(grid_year), int(grid_month), int(d[-2:]))] for d in display_grid.index])
+
+column_config = {'Day': st.column_config.TextColumn("Day", disabled=True, width="small")}
+for emp in employees:
+    column_config[emp] = st.column_config.TextColumn(emp, max_chars=10)
+column_config['Memo'] = st.column_config.TextColumn("Memo", width="large")
+
+# A form keeps cell edits on the client until Save: editing does not rerun the script.
+# The editor key includes the data version, so the grid is rebuilt from the saved data after a write.
+with st.form(f"month_grid_form_{grid_year}_{grid_month}"):
+    edited_grid = st.data_editor(
+        display_grid,
+        column_config=column_config,
+        num_rows="fixed",
+        width='stretch',
+        height=38 * (len(display_grid) + 1),
+        key=f"month_grid_{grid_year}_{grid_month}_{dm.data_version}"
+    )
+    submitted = st.form_submit_button("✅ Save All Changes", type="primary")
+
+if submitted:
+    changes, errors = collect_grid_changes(original_grid, edited_grid.drop(columns=['Day']), employees)
+    
+    if not errors.empty:
+        st.error(f"❌ {len(errors)} cell(s) are not a valid time (HH:MM) or TYPE. Nothing was saved.")
+        st.dataframe(errors, hide_index=True)
+    elif not changes:
+        st.warning("No changes to save.")
+    else:
+        changed = dm.apply_attendance_changes(changes)
+        st.session_state['grid_notice'] = f"{changed} change(s) for {int(grid_year)}-{int(grid_month):02d} saved in a single write."
+        st.rerun()
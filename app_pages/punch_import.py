@@ -0,0 +1,86 @@
+# app_pages/punch_import.py
+# 출입 카드 펀치 로그 가져오기 페이지: 업로드 -> 미리보기(dry-run diff) -> 적용
+
+import streamlit as st
+
+from punch_importer import (
+    PunchLogImporter, DEFAULT_BADGE_COLUMN, DEFAULT_TIME_COLUMN, DEFAULT_TIME_FORMAT,
+    ACTION_ADD, ACTION_UPDATE, ACTION_KEEP_LEAVE
+)
+
+# Initialized by app.py before this page runs
+dm = st.session_state['dm']
+
+# ----------------------------------------------------
+# PAGE UI: Punch Log Import
+# ----------------------------------------------------
+st.header("🪪 Punch Log Import")
+st.caption(
+    "Imports the earliest badge punch per employee per day as ATT/LATE (against the standard time). "
+    "Badge IDs are mapped to employees with the 'badges' entry in settings.json. "
+    "Manually entered leave codes (ANL, SIL, ...) are never overwritten."
+)
+
+notice = st.session_state.pop('punch_notice', None)
+if notice:
+    st.success(notice)
+
+badge_map = dm.get_badge_map()
+if not badge_map:
+    st.warning('No badge IDs are configured. Add a "badges": {"badge id": "employee name"} mapping to settings.json.')
+    st.stop()
+
+uploaded = st.file_uploader("Punch log (CSV, one row per badge swipe)", type=["csv"], key='punch_log_file')
+col_badge, col_time, col_format, col_empty = st.columns([1, 1, 1, 1])
+badge_column = col_badge.text_input("Badge ID column", value=DEFAULT_BADGE_COLUMN, key='punch_badge_column')
+time_column = col_time.text_input("Timestamp column", value=DEFAULT_TIME_COLUMN, key='punch_time_column')
+time_format = col_format.text_input(
+    "Timestamp format", value=DEFAULT_TIME_FORMAT, key='punch_time_format',
+    help="'mixed' infers the format per row. A fixed format such as %Y-%m-%d %H:%M:%S is faster for large logs."
+)
+
+if uploaded is not None and st.button("Preview Import (Dry Run)", key="punch_preview_btn"):
+    importer = PunchLogImporter(
+        dm, badge_column=badge_column.strip(), time_column=time_column.strip(), time_format=time_format.strip()
+    )
+    try:
+        st.session_state['punch_diff'] = importer.build_diff(uploaded)
+        st.session_state['punch_stats'] = importer.stats
+        st.session_state['punch_data_version'] = dm.data_version
+    except ValueError as e:
+        st.error(f"Could not read the punch log: {e}")
+        st.session_state.pop('punch_diff', None)
+
+diff = st.session_state.get('punch_diff')
+if diff is not None:
+    stats = st.session_state['punch_stats']
+    counts = diff['action'].value_counts()
+    
+    st.subheader("Preview")
+    st.markdown(
+        f"{stats['rows']:,} punches read · {stats['unknown_badge_rows']:,} with unknown badges · "
+        f"{stats['invalid_time_rows']:,} with invalid timestamps"
+    )
+    if stats['unknown_badges']:
+        st.warning(f"Unknown badge IDs: {', '.join(stats['unknown_badges'][:20])}")
+    if stats['invalid_times']:
+        examples = ", ".join(f"line {line}: `{value}`" for line, value in stats['invalid_times'])
+        st.warning(
+            f"{stats['invalid_time_rows']:,} rows were skipped because their timestamp could not be read "
+            f"(check the timestamp format). Examples: {examples}"
+        )
+    
+    col_add, col_update, col_keep = st.columns(3)
+    col_add.metric("New records", int(counts.get(ACTION_ADD, 0)))
+    col_update.metric("Updated ATT/LATE", int(counts.get(ACTION_UPDATE, 0)))
+    col_keep.metric("Leave codes kept", int(counts.get(ACTION_KEEP_LEAVE, 0)))
+    st.dataframe(diff, hide_index=True, width='stretch')
+    
+    if st.session_state.get('punch_data_version') != dm.data_version:
+        st.info("Attendance data changed since this preview. Please preview again before applying.")
+    elif counts.get(ACTION_ADD, 0) or counts.get(ACTION_UPDATE, 0):
+        if st.button("✅ Apply Import", key="punch_apply_btn", type="primary"):
+            applied = PunchLogImporter(dm).apply_diff(diff)
+            st.session_state.pop('punch_diff', None)
+            st.session_state['punch_notice'] = f"{applied} attendance records imported in a single write."
+            st.rerun()
@@ -0,0 +1,83 @@
+# app_pages/settings.py
+# 시스템 설정 페이지 (직원 목록, 출근 기준 시간, 데이터 백업)
+
+import streamlit as st
+from datetime import datetime
+import re
+import shutil
+import os
+
+# Initialized by app.py before this page runs
+dm = st.session_state['dm']
+
+# ----------------------------------------------------
+# PAGE UI: Settings (Implemented in settings_view_ctk.py)
+# ----------------------------------------------------
+st.header("⚙️ System Settings and Employee Management")
+
+# 1. Employee List Management
+st.subheader("Employee List (One per line)")
+
+current_employees = "\n".join(dm.get_employee_list())
+
+employee_input = st.text_area(
+    "Enter the list of employee names and press the 'Save Settings' button:",
+    value=current_employees,
+    height=200,
+    key='employee_list_input'
+)
+
+# 2. Set Attendance Standard Time
+st.subheader("Set Attendance Standard Time")
+
+current_time = dm.settings.get('attendance_time', '09:00')
+time_input = st.text_input(
+    "Standard Time (HH:MM)",
+    value=current_time,
+    #key='attendance_time_input',
+    help="E.g., 09:00. If this time is changed, all records will be recalculated."
+)
+
+# 3. Save Settings Button
+if st.button("Save Settings and Recalculate Attendance", key="save_settings_btn", type="primary"):
+    new_employees = [e.strip() for e in employee_input.split('\n') if e.strip()]
+    new_time = time_input.strip()
+    
+    # Time format validation
+    time_pattern = re.compile(r'^(?:[0-9]|1\d|2[0-3]):[0-5]\d$')
+
+    if not time_pattern.match(new_time):
+        st.error("Invalid time format. Please enter in **H:MM or HH:MM format (e.g., 9:00 or 09:00)**.")
+        st.stop()
+        
+    new_settings = {
+        'employees': new_employees,
+        'attendance_time': new_time
+    }
+    
+    dm.update_settings_and_recalculate(new_settings)
+    st.success("Settings successfully saved, and attendance records have been recalculated if the standard time was changed.")
+    st.rerun()
+    
+st.markdown("---")
+
+# 4. Data Backup
+st.subheader("Data Backup")
+col_backup, col_info = st.columns(2)
+
+backup_path = "attendance_backups"
+if col_backup.button("Backup Current Data"):
+    try:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_dir = os.path.join(backup_path, f"backup_{timestamp}")
+        os.makedirs(backup_dir, exist_ok=True)
+        
+        # Copy settings.json and attendance.json files
+        shutil.copy("settings.json", backup_dir)
+        shutil.copy("attendance.json", backup_dir) 
+        
+        st.success(f"Data successfully backed up: {backup_dir}")
+    except Exception as e:
+        st.error(f"Error occurred during backup: {e}")
+
+col_info.info(f"Data Files: settings.json, attendance.json")
@@ -0,0 +1,283 @@
+# app_pages/statistics_reports.py
+# 통계/보고서 페이지. matplotlib, reportlab, xlsxwriter는 이 페이지가 열릴 때만 로드됩니다.
+
+import streamlit as st
+import pandas as pd
+from datetime import date
+import io
+import uuid
+
+from statistics_exporter import StatisticsExporter
+from bulk_exporter import BulkExporter, EXPORT_FORMATS, EXPORT_MIME_TYPES
+from report_jobs import ReportJobManager
+
+# Initialized by app.py before this page runs
+dm = st.session_state['dm']
+
+# StatisticsExporter is created on the first visit to this page (not at app start-up)
+if st.session_state.get('se') is None:
+    st.session_state['se'] = StatisticsExporter(dm)
+se = st.session_state['se']
+
+# ----------------------------------------------------
+# 1. HELPER FUNCTIONS (Background report jobs / bulk export)
+# ----------------------------------------------------
+
+PDF_MIME = "application/pdf"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+@st.cache_resource
+def get_report_job_manager():
+    """Process-wide background report job manager shared by all sessions (bounded worker pool)."""
+    return ReportJobManager(max_workers=2)
+
+def report_subscriber_token():
+    """Identifies this session to the job manager, so repeated clicks on the same report count as one subscriber."""
+    if 'report_subscriber' not in st.session_state:
+        st.session_state['report_subscriber'] = uuid.uuid4().hex
+    return st.session_state['report_subscriber']
+
+def snapshot_exporter():
+    """
+    StatisticsExporter over a copy of the current data for a background job.
+    The job thread then never iterates the dicts that this session's saves modify.
+    Passed as `prepare`, so the copy is only made when a click actually starts a new job.
+    """
+    return StatisticsExporter(dm.detached_copy())
+
+def submit_report_job(key, label, file_name, mime, target, suffix):
+    """Submits a StatisticsExporter job (target(exporter, path, progress)) and remembers its ID in this session."""
+    job_id = get_report_job_manager().submit(
+        key, label, file_name, mime, target, suffix,
+        subscriber=report_subscriber_token(), prepare=snapshot_exporter
+    )
+    session_jobs = st.session_state.setdefault('report_jobs', [])
+    if job_id not in session_jobs:
+        session_jobs.append(job_id)
+
+def cancel_report_job(job_id):
+    """Cancels (unsubscribes from) a job and removes it from this session's job list."""
+    get_report_job_manager().cancel(job_id, subscriber=report_subscriber_token())
+    st.session_state['report_jobs'] = [j for j in st.session_state.get('report_jobs', []) if j != job_id]
+
+def dismiss_report_job(job_id):
+    """Removes a finished job from this session's job list."""
+    st.session_state['report_jobs'] = [j for j in st.session_state.get('report_jobs', []) if j != job_id]
+
+def render_report_jobs():
+    """Draws progress, cancel and download controls for this session's report jobs. Returns True if any job is still running."""
+    manager = get_report_job_manager()
+    any_active = False
+    
+    for job_id in list(st.session_state.get('report_jobs', [])):
+        job = manager.get(job_id)
+        if job is None: # Expired and pruned by the manager
+            dismiss_report_job(job_id)
+            continue
+        
+        col_label, col_state, col_action = st.columns([2, 4, 1])
+        col_label.markdown(f"**{job.label}**")
+        
+        if not job.finished:
+            any_active = True
+            col_state.progress(job.progress, text=job.message)
+            col_action.button("Cancel", key=f"cancel_job_{job_id}", on_click=cancel_report_job, args=(job_id,), width='stretch')
+        elif job.result is not None:
+            col_state.download_button(
+                label=f"Download {job.file_name}",
+                data=job.result,
+                file_name=job.file_name,
+                mime=job.mime,
+                key=f"download_job_{job_id}",
+                width='stretch'
+            )
+            col_action.button("Dismiss", key=f"dismiss_job_{job_id}", on_click=dismiss_report_job, args=(job_id,), width='stretch')
+        else:
+            col_state.error(f"{job.message}: {job.error}" if job.error else job.message)
+            col_action.button("Dismiss", key=f"dismiss_job_{job_id}", on_click=dismiss_report_job, args=(job_id,), width='stretch')
+    
+    return any_active
+
+@st.fragment(run_every=1.0)
+def poll_report_jobs():
+    """Re-draws only the job list every second while jobs are running."""
+    if not render_report_jobs():
+        st.rerun() # All jobs finished: full rerun stops the polling fragment
+
+def generate_bulk_export_for_download(fmt, start_date, end_date):
+    """Creates a bytes object for the CSV / JSON Lines / Parquet bulk export download button."""
+    try:
+        buffer = io.BytesIO()
+        
+        # Rows are streamed in chunks straight from DataManager into the buffer
+        BulkExporter(dm).export(buffer, fmt, start_date, end_date)
+        
+        return buffer.getvalue()
+    except Exception as e:
+        st.error(f"A fatal error occurred while generating the {fmt} export: {e}")
+        return None
+
+# ----------------------------------------------------
+# PAGE UI: Statistics/Reports (Implemented in attendance_statistics_ctk.py)
+# ----------------------------------------------------
+@st.fragment
+def render_statistics_panel():
+    st.header("📊 Attendance Statistics and Reports")
+    
+    # 1. Select Report Type
+    report_type = st.radio(
+        "Select Report Type",
+        ["Monthly Statistics", "Yearly Statistics", "Overall Statistics"],
+        key='report_type_radio',
+        horizontal=True
+    )
+    
+    # 2. Enter Period
+    current_year = date.today().year
+    current_month = date.today().month
+    
+    year = current_year
+    month = current_month
+    
+    col_type_params, col_empty = st.columns([1, 3])
+    
+    if report_type == "Monthly Statistics":
+        with col_type_params:
+            year = st.number_input("Year", min_value=2020, max_value=2050, value=current_year, key='stat_year')
+            month = st.number_input("Month", min_value=1, max_value=12, value=current_month, key='stat_month')
+            
+    elif report_type == "Yearly Statistics":
+        with col_type_params:
+            year = st.number_input("Year", min_value=2020, max_value=2050, value=current_year, key='stat_year_only')
+            month = None
+    else:
+        year = None
+        month = None
+        
+    # 3. Calculate Statistics Button
+    if st.button("Calculate Statistics and View Chart", key="calculate_stats_btn", type="secondary"):
+        
+        type_map = {"Monthly Statistics": "monthly", "Yearly Statistics": "yearly", "Overall Statistics": "total"}
+        api_type = type_map[report_type]
+        
+        try:
+            # Use StatisticsExporter's internal helper function to set period and calculate
+            df, title_ko, start_date, end_date = se._get_df_for_period(api_type, year, month)
+            
+            st.session_state['stats_df'] = df
+            st.session_state['stats_title'] = title_ko
+            st.session_state['stats_type'] = api_type
+            st.session_state['stats_year'] = year
+            st.session_state['stats_month'] = month
+            
+        except Exception as e:
+            st.error(f"Statistics Calculation Error: {e}")
+            st.session_state['stats_df'] = pd.DataFrame() 
+            
+
+    # 4. Display Results
+    if 'stats_df' in st.session_state and not st.session_state['stats_df'].empty:
+        df_display = st.session_state['stats_df']
+        title_ko = st.session_state['stats_title']
+        
+        st.subheader(f"Result: {title_ko}")
+        st.dataframe(df_display, hide_index=True, use_container_width=True)
+        
+        # 5. Display Chart
+        try:
+            chart_title = title_ko.replace("근태 통계", "Attendance Statistics") 
+            fig = se.create_attendance_chart(df_display.copy(), chart_title)
+            st.pyplot(fig)
+        except Exception as e:
+            st.warning(f"Error occurred during chart creation: {e}. (Can happen if the employee list is empty)")
+            
+        
+        # 6. Export Report Button (Generated by background jobs so the page stays responsive)
+        st.subheader("Export Report (Available after calculating statistics)")
+        
+        col_pdf, col_excel = st.columns(2)
+        
+        type_for_file = st.session_state['stats_type']
+        year_for_file = st.session_state['stats_year']
+        month_for_file = st.session_state['stats_month']
+        
+        # Generate PDF/Excel filename
+        filename_base = f"attendance_report_{year_for_file or 'All'}"
+        if month_for_file:
+            filename_base += f"_{month_for_file:02d}"
+        
+        # PDF Report Job
+        if col_pdf.button("Generate PDF Report", key="generate_pdf_btn", width='stretch'):
+            submit_report_job(
+                ('pdf', type_for_file, year_for_file, month_for_file),
+                f"PDF Report ({filename_base})", f"{filename_base}.pdf", PDF_MIME,
+                lambda job_se, path, progress, t=type_for_file, y=year_for_file, m=month_for_file:
+                    job_se.generate_pdf_summary(path, t, y, m, progress_callback=progress),
+                ".pdf"
+            )
+            
+        # Excel Report Job
+        if col_excel.button("Generate Excel Report", key="generate_excel_btn", width='stretch'):
+            submit_report_job(
+                ('excel', type_for_file, year_for_file, month_for_file),
+                f"Excel Report ({filename_base})", f"{filename_base}.xlsx", XLSX_MIME,
+                lambda job_se, path, progress, t=type_for_file, y=year_for_file, m=month_for_file:
+                    job_se.export_excel_report(path, t, y, m, progress_callback=progress),
+                ".xlsx"
+            )
+
+    # 7. Raw Daily Detail Export (Date x Employee matrix with memos, for audits)
+    st.subheader("Export Raw Daily Detail (Excel)")
+    
+    col_detail_start, col_detail_end, col_detail_btn = st.columns([1, 1, 2])
+    detail_start = col_detail_start.date_input("From", value=date.today().replace(day=1), key='detail_start')
+    detail_end = col_detail_end.date_input("To", value=date.today(), key='detail_end')
+    
+    if col_detail_btn.button("Generate Detail Excel", key="prepare_detail_btn"):
+        if detail_start > detail_end:
+            st.error("The start date must be on or before the end date.")
+        else:
+            detail_name = f"attendance_detail_{detail_start:%Y%m%d}_{detail_end:%Y%m%d}.xlsx"
+            submit_report_job(
+                ('detail', detail_start, detail_end),
+                f"Daily Detail ({detail_start} ~ {detail_end})", detail_name, XLSX_MIME,
+                lambda job_se, path, progress, a=detail_start, b=detail_end:
+                    job_se.export_detail_excel(path, a, b, progress_callback=progress),
+                ".xlsx"
+            )
+
+    # Background report jobs of this session (progress / cancel / download)
+    if st.session_state.get('report_jobs'):
+        st.subheader("Report Jobs")
+        session_jobs = [get_report_job_manager().get(j) for j in st.session_state['report_jobs']]
+        if any(job is not None and not job.finished for job in session_jobs):
+            poll_report_jobs()
+        else:
+            render_report_jobs()
+
+    # 8. Machine-readable Bulk Export (long table for payroll / BI jobs)
+    st.subheader("Bulk Export (CSV / JSON Lines / Parquet)")
+    
+    col_bulk_fmt, col_bulk_start, col_bulk_end, col_bulk_btn = st.columns([1, 1, 1, 1])
+    bulk_fmt = col_bulk_fmt.selectbox("Format", EXPORT_FORMATS, key='bulk_format')
+    bulk_start = col_bulk_start.date_input("From", value=date.today().replace(month=1, day=1), key='bulk_start')
+    bulk_end = col_bulk_end.date_input("To", value=date.today(), key='bulk_end')
+    
+    if col_bulk_btn.button("Prepare Bulk Export", key="prepare_bulk_btn"):
+        if bulk_start > bulk_end:
+            st.error("The start date must be on or before the end date.")
+        else:
+            st.session_state['bulk_export'] = generate_bulk_export_for_download(bulk_fmt, bulk_start, bulk_end)
+            st.session_state['bulk_export_fmt'] = bulk_fmt
+            st.session_state['bulk_export_name'] = f"attendance_{bulk_start:%Y%m%d}_{bulk_end:%Y%m%d}.{bulk_fmt}"
+    
+    if st.session_state.get('bulk_export'):
+        col_bulk_btn.download_button(
+            label=f"Download {st.session_state['bulk_export_fmt'].upper()}",
+            data=st.session_state['bulk_export'],
+            file_name=st.session_state['bulk_export_name'],
+            mime=EXPORT_MIME_TYPES[st.session_state['bulk_export_fmt']],
+            width='stretch'
+        )
+
+render_statistics_panel()
@@ -10,6 +10,8 @@ import matplotlib
 from tkinter import messagebox, filedialog
 import os
 import calendar as pycal # 월/년 날짜 계산을 위해 추가
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 # PDF 생성을 위한 라이브러리 추가
 from reportlab.lib.pagesizes import A4, landscape # landscape가 추가되어야 합니다.
@@ -49,6 +51,7 @@ except Exception as e:
 
 BG_COLOR = "#2E2E2E"
 TEXT_BG_COLOR = "#1E1E1E"
+POLL_INTERVAL_MS = 100 # 작업 스레드 결과 확인 주기
 
 # attendance_statistics_ctk.py 파일 내, StatisticsViewCTK 클래스 위에 다음 내용을 추가합니다.
 
@@ -76,6 +79,14 @@ class StatisticsViewCTK(ctk.CTkFrame):
         # Matplotlib 캔버스 및 Figure 저장 리스트 초기화
         self.chart_canvases = []
         self.chart_figures = []
+
+        # 비동기 통계 계산 (작업 스레드 풀 + after() 폴링)
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="stats-chart")
+        self._results = queue.Queue()
+        self._outstanding = set()
+        self._poll_job = None
+        self._refresh_generation = 0
+        self._chart_state = {} # 섹션('month'/'year'/'all') -> {'key', 'df', 'canvas', 'figure'}
         
         # 1. Grid Layout Configuration (수직으로 3개 섹션 배치)
         self.grid_columnconfigure(0, weight=1)
@@ -116,14 +127,18 @@ class StatisticsViewCTK(ctk.CTkFrame):
         self.overall_section_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
         self.overall_chart_frame = ctk.CTkFrame(self.overall_section, fg_color="transparent") # 차트를 그릴 프레임
         self.overall_chart_frame.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
+
+        self._chart_frames = {
+            'month': self.monthly_chart_frame,
+            'year': self.yearly_chart_frame,
+            'all': self.overall_chart_frame,
+        }
         
         # 초기 통계 표시
         self.refresh_stats()
 
 
     def _clear_charts(self):
-        for fig in self.chart_figures:
-            plt.close(fig)
         for canvas in self.chart_canvases:
             canvas.get_tk_widget().destroy()
         # 기존 chart_display_frame 제거 대신 3개 프레임 모두 초기화
@@ -132,117 +147,133 @@ class StatisticsViewCTK(ctk.CTkFrame):
                 widget.destroy()
         self.chart_canvases = []
         self.chart_figures = []
+        self._chart_state = {}
 
 
+    def _stats_periods(self, today):
+        """섹션별 (차트 프레임, exporter 기간 유형, 연, 월, 한국어 제목)을 반환합니다."""
+        year, month = today.year, today.month
+        return {
+            'month': (self.monthly_chart_frame, 'monthly', year, month, f"{year}년 {month}월 통계"),
+            'year': (self.yearly_chart_frame, 'yearly', year, None, f"{year}년 연간 통계"),
+            'all': (self.overall_chart_frame, 'total', None, None, "전체 기간 통계"),
+        }
 
-    def _display_chart(self, chart_frame, df, title_ko, period_type):
-        """데이터를 기반으로 차트를 생성하고 지정된 프레임에 표시합니다."""
-        
-        # chart_frame의 위젯을 여기서 제거할 필요는 없습니다. 
-        # _clear_charts에서 전체를 제거하고, refresh_stats가 각 차트를 새로운 프레임에 그리도록 설계하는 것이 일반적입니다.
 
-        # --- (코드 흐름 확인) ---
+    def _compute_chart(self, exporter, report_type, year, month, title_ko, previous_df):
+        """
+        [작업 스레드] 기간 통계를 계산하고 차트 Figure를 만듭니다. (Tk 위젯에는 접근하지 않음)
+        exporter는 새로고침 시점의 데이터 복사본(detached_copy) 위에서 동작하므로 Tk 스레드의 저장과 겹쳐도 안전합니다.
+        이전 결과와 데이터가 같으면 Figure를 만들지 않고 reused=True를 반환합니다.
+        """
+        df, _, _, _ = exporter._get_df_for_period(report_type, year, month)
+        if previous_df is not None and df.equals(previous_df):
+            return df, None, True
         if df.empty:
-            ctk.CTkLabel(chart_frame, text=f"표시할 데이터가 없습니다. ({title_ko})", text_color="gray").pack(expand=True, fill="both")
-            return
-            
-        try:
-            # StatisticsExporter의 create_attendance_chart 호출
-            fig = self.statistics_exporter.create_attendance_chart(df.copy(), title_ko, figsize=(5, 3)) 
-        except Exception as e:
-            ctk.CTkLabel(chart_frame, text=f"차트 생성 오류: {e}", text_color="red").pack(expand=True, fill="both")
-            return
+            return df, None, False
+        fig = exporter.create_attendance_chart(df.copy(), title_ko, figsize=(5, 3))
+        return df, fig, False
 
-        # Matplotlib 차트를 CustomTkinter에 임베드
-        canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-        canvas_widget = canvas.get_tk_widget()
-        # ⭐ 핵심: 캔버스 위젯이 프레임 내부에 완전히 채워지도록 설정 확인 ⭐
-        canvas_widget.pack(fill=ctk.BOTH, expand=True, padx=5, pady=5)
-        canvas.draw()
-        
-        # 메모리 관리를 위해 저장
-        self.chart_canvases.append(canvas)
-        self.chart_figures.append(fig)
 
+    def _show_chart_message(self, chart_frame, text, text_color):
+        for widget in chart_frame.winfo_children():
+            widget.destroy()
+        ctk.CTkLabel(chart_frame, text=text, text_color=text_color).pack(expand=True, fill="both")
 
-    def refresh_stats(self):
-        """
-        통계 탭 진입 시 자동으로 월간, 연간, 전체 통계를 모두 표시합니다.
-        """
-        # 1. 기존 차트 삭제
-        self._clear_charts() # 명시적으로 캔버스 위젯까지 제거하도록 _clear_charts 수정
-
-        # 2. 현재 날짜 기준으로 통계 계산 및 표시
-        today = date.today()
-        year = today.year
-        month = today.month
-
-        # 월간 통계
-        self._display_chart(
-                self.monthly_chart_frame,
-                self.data_manager.calculate_attendance_stats('month', year, month),
-                f"{year}년 {month}월 통계", 'month'
-        )
-
-        # 연간 통계
-        self._display_chart(
-                self.yearly_chart_frame,
-                self.data_manager.calculate_attendance_stats('year', year),
-                f"{year}년 연간 통계", 'year'
-        )
-
-        # 전체 통계
-        self._display_chart(
-                self.overall_chart_frame,
-                self.data_manager.calculate_attendance_stats('all'),
-                "전체 기간 통계", 'all'
-        )
-
-
-    def _draw_stats_in_frame(self, period_type, chart_frame):
-        """특정 기간의 통계를 계산하고 주어진 프레임에 차트를 그립니다."""
-        
-        today = date.today()
-        year = today.year
-        month = today.month
 
-        # 기간 유형에 따라 계산 인자 설정
-        calc_year = year if period_type in ['yearly', 'monthly'] else None
-        calc_month = month if period_type == 'monthly' else None
+    def _display_chart(self, period, key, title_ko, future):
+        """[Tk 스레드] 작업 결과를 해당 섹션에 표시합니다. 데이터가 같으면 기존 캔버스를 그대로 둡니다."""
+        chart_frame = self._chart_frames[period]
+        state = self._chart_state.get(period)
 
-        # StatisticsExporter를 통해 데이터프레임 및 제목 가져오기
         try:
-            # statistics_exporter.py에 정의된 _get_df_for_period 메서드를 호출
-            df, title_ko, _, _ = self.statistics_exporter._get_df_for_period(period_type, calc_year, calc_month)
+            df, fig, reused = future.result()
         except Exception as e:
-            ctk.CTkLabel(chart_frame, text=f"데이터 로드 오류: {e}", text_color="red").pack(expand=True, fill="both")
+            print(f"[ERROR] Failed to build {period} statistics chart: {e}")
+            self._chart_state.pop(period, None)
+            self._show_chart_message(chart_frame, f"차트 생성 오류: {e}", "red")
             return
-            
-        # 기존 위젯 제거 (만약을 대비)
+
+        if reused and state and state['canvas'] is not None:
+            state['key'] = key
+            return
+
         for widget in chart_frame.winfo_children():
             widget.destroy()
 
         if df.empty:
+            self._chart_state[period] = {'key': key, 'df': df, 'canvas': None, 'figure': None}
             ctk.CTkLabel(chart_frame, text=f"표시할 데이터가 없습니다. ({title_ko})", text_color="gray").pack(expand=True, fill="both")
             return
-            
-        # 차트 생성 (StatisticsExporter의 create_attendance_chart 재사용)
-        try:
-            # 3가지 통계를 동시에 보여주기 위해 차트 크기를 작게 조정 (figsize=(5, 3))
-            fig = self.statistics_exporter.create_attendance_chart(df.copy(), title_ko, figsize=(5, 3)) 
-        except Exception as e:
-            ctk.CTkLabel(chart_frame, text=f"차트 생성 오류: {e}", text_color="red").pack(expand=True, fill="both")
-            return
 
-        # Matplotlib 차트를 CustomTkinter에 임베드
+        # Matplotlib 차트를 CustomTkinter에 임베드 (Figure는 작업 스레드에서 이미 생성됨)
         canvas = FigureCanvasTkAgg(fig, master=chart_frame)
         canvas_widget = canvas.get_tk_widget()
+        # ⭐ 핵심: 캔버스 위젯이 프레임 내부에 완전히 채워지도록 설정 확인 ⭐
         canvas_widget.pack(fill=ctk.BOTH, expand=True, padx=5, pady=5)
         canvas.draw()
-        
-        # 메모리 관리를 위해 저장
-        self.chart_canvases.append(canvas)
-        self.chart_figures.append(fig)
 
+        self._chart_state[period] = {'key': key, 'df': df, 'canvas': canvas, 'figure': fig}
+        self.chart_canvases = [s['canvas'] for s in self._chart_state.values() if s['canvas'] is not None]
+        self.chart_figures = [s['figure'] for s in self._chart_state.values() if s['figure'] is not None]
 
 
+    def refresh_stats(self):
+        """
+        통계 탭 진입 시 자동으로 월간, 연간, 전체 통계를 모두 표시합니다.
+        계산과 Figure 생성은 작업 스레드 풀에서 실행되고, 각 차트는 준비되는 대로 표시됩니다.
+        데이터(data_version)가 바뀌지 않은 섹션은 다시 계산하지 않고 기존 차트를 재사용합니다.
+        """
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        # 작업 스레드용 데이터 복사본과 그 버전은 Tk 스레드에서 같은 시점에 잡음 (다시 계산할 섹션이 있을 때만)
+        data_version = self.data_manager.data_version
+        exporter = None
+
+        for period, (chart_frame, report_type, year, month, title_ko) in self._stats_periods(date.today()).items():
+            key = (report_type, year, month, data_version)
+            state = self._chart_state.get(period)
+            if state and state['key'] == key:
+                continue # 변경 없음 - 기존 차트 유지
+
+            if not state or state['canvas'] is None:
+                self._show_chart_message(chart_frame, f"통계 계산 중... ({title_ko})", "gray")
+
+            if exporter is None:
+                exporter = StatisticsExporter(self.data_manager.detached_copy())
+            future = self._executor.submit(
+                self._compute_chart, exporter, report_type, year, month, title_ko, state['df'] if state else None
+            )
+            self._outstanding.add(future)
+            # 완료 콜백은 작업 스레드에서 실행되므로 큐에만 넣고, 표시는 Tk 스레드의 after() 폴링에서 처리
+            future.add_done_callback(
+                lambda f, p=period, k=key, t=title_ko, g=generation: self._results.put((g, p, k, t, f))
+            )
+
+        if self._outstanding and self._poll_job is None:
+            self._poll_job = self.after(POLL_INTERVAL_MS, self._poll_results)
+
+
+    def _poll_results(self):
+        """[Tk 스레드] 완료된 작업 결과를 꺼내 차트를 표시합니다. 남은 작업이 있으면 다시 예약합니다."""
+        self._poll_job = None
+        while True:
+            try:
+                generation, period, key, title_ko, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding.discard(future)
+            if generation != self._refresh_generation:
+                continue # 이후 새로고침이 같은 섹션을 다시 요청함
+            self._display_chart(period, key, title_ko, future)
+
+        if self._outstanding:
+            self._poll_job = self.after(POLL_INTERVAL_MS, self._poll_results)
+
+
+    def destroy(self):
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
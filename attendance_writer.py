@@ -0,0 +1,170 @@
+# attendance_writer.py
+# 데스크톱(CTK) 앱용 출석 데이터 저장 작업 스레드: Excel 기록을 Tk 메인 스레드 밖에서 실행하고 연속 저장 요청을 합칩니다.
+
+import atexit
+import threading
+import time
+
+from data_manager import DataManager
+
+# 저장 상태
+WRITER_IDLE = "idle"
+WRITER_SAVING = "saving"
+WRITER_SAVED = "saved"
+WRITER_FAILED = "failed"
+
+
+class AttendanceWriter:
+    """
+    attendance.xlsx 저장을 전담하는 단일 작업 스레드.
+
+    DataManager에 연결되면 _save_attendance_data()는 메모리 데이터의 스냅샷만 넘기고 바로 반환합니다.
+    작업 스레드는 가장 최근 스냅샷만 기록하므로, 기록 중에 쌓인 여러 저장 요청은 한 번의 쓰기로 합쳐집니다.
+    """
+
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self._cond = threading.Condition()
+        self._pending = None     # 아직 기록되지 않은 가장 최근 스냅샷 (attendance_data, employee_cols)
+        self._writing = False
+        self._closed = False
+        self.status = WRITER_IDLE
+        self.last_saved_at = None
+        self.last_error = None
+        self.requests = 0        # 받은 저장 요청 수
+        self.writes = 0          # 실제 파일 기록 수 (requests보다 작으면 그만큼 합쳐진 것)
+
+        self._thread = threading.Thread(target=self._run, name="attendance-writer", daemon=True)
+        self._thread.start()
+        data_manager.attendance_writer = self
+        # 창을 닫지 않고 프로세스가 끝나는 경우에도 대기 중인 저장을 마칩니다.
+        atexit.register(self.close)
+
+    def request_save(self):
+        """[호출 스레드] 현재 데이터의 스냅샷을 저장 대기열에 넣습니다. 이전에 대기 중이던 스냅샷은 대체됩니다."""
+        snapshot = self.data_manager.snapshot_attendance_data()
+        with self._cond:
+            if self._closed:
+                # 작업 스레드가 종료된 뒤에는 호출 스레드에서 직접 기록
+                try:
+                    DataManager.write_attendance_excel(*snapshot)
+                except Exception as e:
+                    print(f"[ERROR] Failed to save attendance data to Excel. Error: {e}")
+                return
+            self._pending = snapshot
+            self.requests += 1
+            self.status = WRITER_SAVING
+            self._cond.notify_all()
+
+    def state(self):
+        """(status, last_saved_at, last_error)를 일관된 시점 기준으로 반환합니다. (UI 폴링용)"""
+        with self._cond:
+            return self.status, self.last_saved_at, self.last_error
+
+    @property
+    def busy(self):
+        with self._cond:
+            return self._writing or self._pending is not None
+
+    def flush(self, timeout=None):
+        """대기 중이거나 기록 중인 저장이 끝날 때까지 기다립니다. 시간 내에 끝나면 True를 반환합니다."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._writing and self._pending is None, timeout)
+
+    def close(self, timeout=None):
+        """남은 저장을 마친 뒤 작업 스레드를 종료하고 DataManager와의 연결을 해제합니다. (여러 번 호출해도 안전)"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            if self._closed:
+                return flushed
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        if self.data_manager.attendance_writer is self:
+            self.data_manager.attendance_writer = None
+        atexit.unregister(self.close)
+        if not flushed:
+            print("[WARNING] Attendance writer closed before pending saves finished.")
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return # 종료 요청 (대기 중인 저장 없음)
+                attendance_data, employee_cols = self._pending
+                self._pending = None
+                self._writing = True
+
+            error = None
+            try:
+                DataManager.write_attendance_excel(attendance_data, employee_cols)
+            except Exception as e:
+                error = e
+                print(f"[ERROR] Failed to save attendance data to Excel. Error: {e}")
+
+            with self._cond:
+                self._writing = False
+                self.writes += 1
+                if error is not None:
+                    self.last_error = str(error)
+                if self._pending is None: # 더 새로운 요청이 있으면 상태는 saving 유지
+                    if error is None:
+                        self.status = WRITER_SAVED
+                        self.last_saved_at = time.time()
+                        self.last_error = None
+                    else:
+                        self.status = WRITER_FAILED
+                self._cond.notify_all()
+
+
+# ----------------------------------------------------
+# Headless self-check
+# ----------------------------------------------------
+
+def _self_check(burst=20):
+    """
+    데스크톱 UI 없이 작업 스레드를 점검합니다. (python attendance_writer.py)
+    합성 데이터셋에 저장 요청을 연달아 보낸 뒤 요청이 합쳐졌는지(requests > writes), flush/close 후 파일이 최신인지 확인합니다.
+    """
+    import tempfile
+    from benchmark import use_dataset
+    from sample_data_generator import write_dataset
+
+    with tempfile.TemporaryDirectory(prefix="attendance_writer_") as data_dir:
+        write_dataset(data_dir, employees=20, years=1)
+        with use_dataset(data_dir):
+            dm = DataManager()
+            writer = AttendanceWriter(dm)
+            dates = sorted(dm.attendance_data)[:burst]
+            employee = dm.get_employee_list()[0]
+
+            start = time.perf_counter()
+            for date_str in dates:
+                dm.save_attendance_record(date_str, employee, 'ANL')
+            queued_ms = (time.perf_counter() - start) * 1000
+
+            assert writer.flush(timeout=60), "flush() timed out"
+            status, last_saved_at, error = writer.state()
+            assert status == WRITER_SAVED and last_saved_at is not None, f"unexpected state: {status} ({error})"
+            assert writer.requests == len(dates), f"{writer.requests} requests for {len(dates)} saves"
+            assert 0 < writer.writes < writer.requests, f"not coalesced: {writer.requests} requests, {writer.writes} writes"
+            saved = dm._load_attendance_data()
+            assert all(saved[d].get(employee) == 'ANL' for d in dates), "file does not hold the latest request"
+
+            # close 후에는 연결이 해제되어 DataManager가 직접 (동기) 저장
+            dm.save_attendance_record(dates[-1], employee, 'SIL')
+            assert writer.close(timeout=30), "close() did not finish the pending save"
+            assert not writer._thread.is_alive() and dm.attendance_writer is None, "close() left the writer running"
+            dm.save_attendance_record(dates[0], employee, 'SIL')
+            saved = dm._load_attendance_data()
+            assert saved[dates[0]].get(employee) == 'SIL' and saved[dates[-1]].get(employee) == 'SIL', \
+                "saves around close() were lost"
+
+    print(f"[INFO] AttendanceWriter OK: {writer.requests} requests -> {writer.writes} writes, "
+          f"{len(dates)} saves queued in {queued_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    _self_check()
@@ -0,0 +1,201 @@
+import customtkinter as ctk
+import tkinter as tk
+from datetime import date, datetime
+import numpy as np
+
+from data_manager import YEAR_STATUS_CODES
+from perf_metrics import timed
+from AttendanceView_calendar_ctk import AttendanceCalendarCTK
+
+# 연간 히트맵: 직원(행) x 날짜(열) 상태를 이미지 한 장으로 만들어 tk.Canvas 하나에 그립니다.
+# (셀마다 위젯을 만들지 않으므로 200명 x 365일도 위젯 수가 늘지 않음)
+
+NAME_MARGIN = 110    # 왼쪽 직원명 영역 폭 (px)
+HEADER_MARGIN = 22   # 위쪽 월 표시 영역 높이 (px)
+WEEKEND_BG = "#1A1A1A" # 기록 없는 주말 칸
+ROW_GAP_COLOR = "#111111" # 직원 행 사이 구분선
+MONTH_LINE_COLOR = "#666666"
+HOVER_OUTLINE = "#FFFFFF"
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+class YearHeatmapViewCTK(ctk.CTkFrame):
+    """
+    12개월 근태 현황 (연간 히트맵). 색상은 AttendanceCalendarCTK.STATUS_COLORS를 사용합니다.
+
+    마우스를 올리면 해당 날짜/직원의 기록을 표시하고, 클릭하면 on_day_selected(date_str)를 호출합니다.
+    (예: on_day_selected=calendar_view.show_date 로 연결하면 월간 달력이 해당 날짜로 이동)
+    """
+
+    def __init__(self, master, data_manager, on_day_selected=None, cell_width=3, cell_height=6):
+        super().__init__(master, corner_radius=10)
+        self.data_manager = data_manager
+        self.on_day_selected = on_day_selected
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.year = date.today().year
+
+        self.matrix = None
+        self._photo = None # tk.PhotoImage는 참조가 사라지면 화면에서 지워지므로 보관
+        self._hover_cell = None
+
+        # 상태 코드 -> RGB 팔레트 (YEAR_STATUS_CODES 순서)
+        colors = AttendanceCalendarCTK.STATUS_COLORS
+        self._palette = np.array(
+            [_hex_to_rgb(colors.get(code, colors["NONE"])) for code in YEAR_STATUS_CODES], dtype=np.uint8
+        )
+        self._weekend_rgb = np.array(_hex_to_rgb(WEEKEND_BG), dtype=np.uint8)
+        self._gap_rgb = np.array(_hex_to_rgb(ROW_GAP_COLOR), dtype=np.uint8)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        self._build_ui()
+        self.refresh()
+
+    # ------------------ UI 구성 ------------------
+    def _build_ui(self):
+        control_frame = ctk.CTkFrame(self, fg_color="transparent")
+        control_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+        control_frame.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkButton(control_frame, text="◀", width=40, command=self._prev_year).grid(row=0, column=0, padx=(0, 5))
+        self.title_label = ctk.CTkLabel(control_frame, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.title_label.grid(row=0, column=1)
+        ctk.CTkButton(control_frame, text="▶", width=40, command=self._next_year).grid(row=0, column=2, padx=(5, 0))
+
+        canvas_frame = ctk.CTkFrame(self, fg_color="transparent")
+        canvas_frame.grid(row=1, column=0, sticky="nsew", padx=10)
+        canvas_frame.grid_columnconfigure(0, weight=1)
+        canvas_frame.grid_rowconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(canvas_frame, bg=AttendanceCalendarCTK.CELL_BG, highlightthickness=0)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        y_scroll = ctk.CTkScrollbar(canvas_frame, orientation="vertical", command=self.canvas.yview)
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll = ctk.CTkScrollbar(canvas_frame, orientation="horizontal", command=self.canvas.xview)
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        self.canvas.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_leave)
+        self.canvas.bind("<Button-1>", self._on_click)
+
+        self.info_label = ctk.CTkLabel(self, text="", anchor="w", text_color="#AAAAAA")
+        self.info_label.grid(row=2, column=0, sticky="ew", padx=10, pady=(5, 10))
+
+    # ------------------ 그리기 ------------------
+    @timed("year_heatmap_ctk.refresh")
+    def refresh(self):
+        """현재 연도의 히트맵을 다시 그립니다. 데이터가 바뀌지 않았으면 DataManager가 캐시된 행렬을 반환합니다."""
+        matrix = self.data_manager.year_status_matrix(self.year)
+        if matrix is self.matrix:
+            return
+        self.matrix = matrix
+        self._hover_cell = None
+
+        self.title_label.configure(text=f"{self.year}년 연간 근태 현황")
+        self.canvas.delete("all")
+
+        codes = matrix.codes
+        if codes.size == 0:
+            self._photo = None
+            self.canvas.create_text(10, 10, anchor="nw", text="표시할 직원이 없습니다.", fill="gray")
+            return
+
+        self._photo = tk.PhotoImage(master=self.canvas, data=self._render_ppm(matrix), format="PPM")
+        self.canvas.create_image(NAME_MARGIN, HEADER_MARGIN, anchor="nw", image=self._photo)
+
+        width = NAME_MARGIN + codes.shape[1] * self.cell_width
+        height = HEADER_MARGIN + codes.shape[0] * self.cell_height
+
+        # 월 경계선 및 월 표시
+        for month in range(1, 13):
+            x = NAME_MARGIN + matrix.dates.index(f"{self.year}-{month:02d}-01") * self.cell_width
+            self.canvas.create_line(x, HEADER_MARGIN - 4, x, height, fill=MONTH_LINE_COLOR)
+            self.canvas.create_text(x + 3, HEADER_MARGIN // 2, anchor="w", text=f"{month}월", fill="#FFFFFF", font=("Malgun Gothic", 9))
+
+        # 직원명 (행 높이가 글자보다 작으면 겹치지 않도록 건너뛰며 표시)
+        label_step = max(1, -(-12 // self.cell_height))
+        for i in range(0, len(matrix.employees), label_step):
+            y = HEADER_MARGIN + i * self.cell_height + self.cell_height // 2
+            self.canvas.create_text(NAME_MARGIN - 6, y, anchor="e", text=matrix.employees[i], fill="#FFFFFF", font=("Malgun Gothic", 8))
+
+        self.hover_rect = self.canvas.create_rectangle(0, 0, 0, 0, outline=HOVER_OUTLINE, state="hidden")
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def _render_ppm(self, matrix):
+        """상태 코드 행렬을 팔레트 조회 + 확대(np.repeat)로 RGB 이미지(PPM 바이트)로 변환합니다."""
+        rgb = self._palette[matrix.codes] # (직원, 날짜, 3)
+
+        # 기록 없는 주말은 어둡게 (토/일 열)
+        weekend = np.array([datetime.strptime(d, "%Y-%m-%d").weekday() >= 5 for d in matrix.dates])
+        empty_weekend = (matrix.codes == 0) & weekend[np.newaxis, :]
+        rgb[empty_weekend] = self._weekend_rgb
+
+        image = np.repeat(np.repeat(rgb, self.cell_height, axis=0), self.cell_width, axis=1)
+        if self.cell_height >= 3:
+            image[self.cell_height - 1::self.cell_height] = self._gap_rgb
+
+        height, width = image.shape[:2]
+        return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(image).tobytes()
+
+    # ------------------ 마우스 (hit-testing) ------------------
+    def _hit_test(self, event):
+        """이벤트 좌표를 (직원 index, 날짜 index)로 변환합니다. 히트맵 밖이면 None."""
+        if self.matrix is None or self.matrix.codes.size == 0:
+            return None
+        x = self.canvas.canvasx(event.x) - NAME_MARGIN
+        y = self.canvas.canvasy(event.y) - HEADER_MARGIN
+        if x < 0 or y < 0:
+            return None
+        row, col = int(y // self.cell_height), int(x // self.cell_width)
+        rows, cols = self.matrix.codes.shape
+        if row >= rows or col >= cols:
+            return None
+        return row, col
+
+    def _on_motion(self, event):
+        cell = self._hit_test(event)
+        if cell == self._hover_cell:
+            return
+        self._hover_cell = cell
+        if cell is None:
+            self._on_leave(event)
+            return
+
+        row, col = cell
+        x0 = NAME_MARGIN + col * self.cell_width
+        y0 = HEADER_MARGIN + row * self.cell_height
+        self.canvas.coords(self.hover_rect, x0 - 1, y0 - 1, x0 + self.cell_width, y0 + self.cell_height)
+        self.canvas.itemconfigure(self.hover_rect, state="normal")
+
+        date_str = self.matrix.dates[col]
+        employee = self.matrix.employees[row]
+        record = self.data_manager.attendance_data.get(date_str, {}).get(employee) or "-"
+        weekday = datetime.strptime(date_str, "%Y-%m-%d").strftime("%a")
+        self.info_label.configure(text=f"{date_str} ({weekday})  {employee}: {record}")
+
+    def _on_leave(self, event):
+        self._hover_cell = None
+        if self.matrix is not None and self.matrix.codes.size:
+            self.canvas.itemconfigure(self.hover_rect, state="hidden")
+        self.info_label.configure(text="")
+
+    def _on_click(self, event):
+        cell = self._hit_test(event)
+        if cell is None or self.on_day_selected is None:
+            return
+        self.on_day_selected(self.matrix.dates[cell[1]])
+
+    # ------------------ 연도 이동 ------------------
+    def _prev_year(self):
+        self.year -= 1
+        self.refresh()
+
+    def _next_year(self):
+        self.year += 1
+        self.refresh()
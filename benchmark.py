@@ -0,0 +1,205 @@
+# benchmark.py
+# 성능 벤치마크: 합성 데이터셋(sample_data_generator)으로 주요 경로의 실행 시간을 측정하고 표/JSON으로 보고합니다.
+#
+#   python benchmark.py --employees 50 --years 2 --json results.json
+#   python benchmark.py --employees 50 --years 2 --compare results.json   # 이전 결과 대비 변화율
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from data_manager import DataManager
+from sample_data_generator import write_dataset
+
+DEFAULT_REPEAT = 3
+
+
+@contextmanager
+def use_dataset(data_dir):
+    """DataManager의 파일 경로를 data_dir의 settings.json / attendance.xlsx로 잠시 바꿉니다."""
+    original = (DataManager.SETTINGS_FILE_PATH, DataManager.ATTENDANCE_FILE_PATH)
+    DataManager.SETTINGS_FILE_PATH = os.path.join(data_dir, os.path.basename(original[0]))
+    DataManager.ATTENDANCE_FILE_PATH = os.path.join(data_dir, os.path.basename(original[1]))
+    try:
+        yield
+    finally:
+        DataManager.SETTINGS_FILE_PATH, DataManager.ATTENDANCE_FILE_PATH = original
+
+
+def measure(func, repeat, warmup=0):
+    """func를 (warmup번 실행한 뒤) repeat번 실행하고 실행 시간(ms) 통계를 반환합니다. 예외가 나면 error만 기록합니다."""
+    samples = []
+    for i in range(warmup + repeat):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        if i >= warmup:
+            samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "runs": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def build_benchmarks(dm, out_dir):
+    """(이름, 호출 가능 객체[, warmup 횟수]) 목록. 호출 순서대로 실행되며 같은 DataManager 인스턴스를 공유합니다."""
+    # 통계/내보내기 의존성(matplotlib, reportlab)은 여기서만 로드
+    from statistics_exporter import StatisticsExporter
+    se = StatisticsExporter(dm)
+
+    dates = sorted(dm.attendance_data)
+    last_year, last_month = int(dates[-1][:4]), int(dates[-1][5:7])
+    employees = dm.get_employee_list()
+    base_time = dm.settings.get('attendance_time', '09:00')
+    h, m = map(int, base_time.split(':'))
+    alternate_time = f"{h + (m + 30) // 60:02d}:{(m + 30) % 60:02d}"
+
+    times = {'next': alternate_time}
+    def recalculate():
+        # 기준 시간을 번갈아 바꿔 매번 ATT/LATE가 실제로 바뀌도록 함 (변경 시 Excel 저장 포함)
+        dm.recalculate_all_attendance(times['next'])
+        times['next'] = base_time if times['next'] == alternate_time else alternate_time
+
+    save_target = {'i': 0}
+    def save_single_record():
+        date_str = dates[save_target['i'] % len(dates)]
+        save_target['i'] += 1
+        dm.save_attendance_record(date_str, employees[0], 'ANL')
+
+    months = [(last_year, month) for month in range(1, 13)]
+    build_target = {'i': 0}
+    def build_month_view():
+        year, month = months[build_target['i'] % len(months)]
+        build_target['i'] += 1
+        dm._build_month_view(year, month)
+
+    pdf_path = os.path.join(out_dir, "benchmark_report.pdf")
+    xlsx_path = os.path.join(out_dir, "benchmark_report.xlsx")
+    detail_path = os.path.join(out_dir, "benchmark_detail.xlsx")
+
+    return [
+        ("load_workbook", dm._load_attendance_data),
+        ("save_single_record", save_single_record),
+        ("recalculate_all_attendance", recalculate),
+        ("stats_monthly", lambda: dm.calculate_attendance_stats(f"{last_year}-{last_month:02d}-01", dates[-1])),
+        ("stats_yearly", lambda: dm.calculate_attendance_stats(f"{last_year}-01-01", f"{last_year}-12-31")),
+        ("stats_total", lambda: dm.calculate_attendance_stats(is_total=True)),
+        ("month_view_build", build_month_view),
+        ("month_view_cached", lambda: dm.month_view(last_year, last_month), 1), # 첫 호출(캐시 채우기)은 제외
+        ("export_pdf_yearly", lambda: se.generate_pdf_summary(pdf_path, 'yearly', last_year)),
+        ("export_excel_yearly", lambda: se.export_excel_report(xlsx_path, 'yearly', last_year)),
+        ("export_detail_excel", lambda: se.export_detail_excel(detail_path, f"{last_year}-01-01", f"{last_year}-12-31")),
+    ]
+
+
+def run(employees, years, repeat=DEFAULT_REPEAT, data_dir=None, only=None, seed=0):
+    """데이터셋을 준비하고 모든 벤치마크를 실행하여 결과 dict를 반환합니다."""
+    with tempfile.TemporaryDirectory(prefix="attendance_bench_") as work_dir:
+        if data_dir is None:
+            data_dir = os.path.join(work_dir, "data")
+            start = time.perf_counter()
+            write_dataset(data_dir, employees=employees, years=years, seed=seed)
+            print(f"[INFO] Generated {employees} employees x {years} years in {time.perf_counter() - start:.1f} s",
+                  file=sys.stderr)
+
+        with use_dataset(data_dir):
+            dm = DataManager()
+            record_count = sum(1 for day_map in dm.attendance_data.values() for key in day_map if key != '__MEMO__')
+            results = {}
+            for name, func, *warmup in build_benchmarks(dm, work_dir):
+                if only and name not in only:
+                    continue
+                print(f"[INFO] {name} ...", file=sys.stderr)
+                results[name] = measure(func, repeat, *warmup)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "employees": len(dm.get_employee_list()),
+            "days": len(dm.attendance_data),
+            "records": record_count,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def format_table(report, baseline=None):
+    """결과를 고정 폭 표 문자열로 만듭니다. baseline이 있으면 median 기준 변화율 열을 추가합니다."""
+    meta = report["meta"]
+    lines = [
+        f"Dataset: {meta['employees']} employees, {meta['days']} days, {meta['records']} records (repeat={meta['repeat']})",
+        "",
+    ]
+    header = f"{'benchmark':<28}{'median ms':>12}{'min ms':>12}{'max ms':>12}"
+    if baseline:
+        header += f"{'baseline':>12}{'change':>10}"
+    lines += [header, "-" * len(header)]
+
+    base_results = (baseline or {}).get("results", {})
+    for name, result in report["results"].items():
+        if "error" in result:
+            lines.append(f"{name:<28}  ERROR {result['error']}")
+            continue
+        line = f"{name:<28}{result['median_ms']:>12.2f}{result['min_ms']:>12.2f}{result['max_ms']:>12.2f}"
+        if baseline:
+            base = base_results.get(name, {}).get("median_ms")
+            if base:
+                line += f"{base:>12.2f}{(result['median_ms'] - base) / base * 100:>+9.1f}%"
+            else:
+                line += f"{'-':>12}{'-':>10}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------
+# Command-line entry point
+# ----------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark load/save/recalculation/statistics/export paths.")
+    parser.add_argument("--employees", type=int, default=20, help="Synthetic dataset: number of employees (default: 20)")
+    parser.add_argument("--years", type=int, default=1, help="Synthetic dataset: number of years (default: 1)")
+    parser.add_argument("--data-dir", help="Use an existing directory with settings.json + attendance.xlsx instead "
+                                           "(files are modified by the save benchmarks - use a copy)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Runs per benchmark (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--only", nargs="+", help="Run only these benchmarks")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic dataset")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file from an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = run(args.employees, args.years, args.repeat, args.data_dir, args.only, args.seed)
+    print(format_table(report, baseline))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO] Results written to {args.json}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
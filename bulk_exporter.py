@@ -0,0 +1,160 @@
+# bulk_exporter.py
+# 급여/BI 작업용 기계 판독 가능한 대량 내보내기 (CSV, JSON Lines, Parquet)
+
+import argparse
+import csv
+import io
+import json
+import sys
+from itertools import islice
+
+from data_manager import DataManager
+
+# long 형식 테이블의 컬럼 (DataManager.iter_attendance_rows와 순서 동일)
+LONG_COLUMNS = ["date", "employee", "status", "check_in_minutes", "memo"]
+EXPORT_FORMATS = ["csv", "jsonl", "parquet"]
+EXPORT_MIME_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class BulkExporter:
+    """근태 기록을 long 형식 (date, employee, status, check_in_minutes, memo) 테이블로 스트리밍 내보냅니다.
+
+    전체 테이블을 메모리에 만들지 않고, DataManager의 행 제너레이터를 chunk_size 단위로 잘라서 기록합니다.
+    """
+
+    def __init__(self, data_manager, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.data_manager = data_manager
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self, start_date=None, end_date=None):
+        """기간 내 행들을 chunk_size 크기의 리스트로 나누어 반환합니다. (제너레이터)"""
+        rows = self.data_manager.iter_attendance_rows(start_date, end_date)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def export(self, target, fmt, start_date=None, end_date=None):
+        """지정된 형식으로 내보내고, 기록된 행 수를 반환합니다.
+
+        Args:
+            target (str/file): 파일 경로 또는 바이너리 파일 객체 (예: io.BytesIO).
+            fmt (str): 'csv', 'jsonl', 'parquet' 중 하나.
+        """
+        if fmt == "csv":
+            return self.export_csv(target, start_date, end_date)
+        elif fmt == "jsonl":
+            return self.export_jsonl(target, start_date, end_date)
+        elif fmt == "parquet":
+            return self.export_parquet(target, start_date, end_date)
+        raise ValueError(f"Unsupported export format: {fmt}. Expected one of {EXPORT_FORMATS}.")
+
+    def export_csv(self, target, start_date=None, end_date=None):
+        """long 형식 테이블을 CSV로 스트리밍 기록합니다."""
+        with _open_text(target) as f:
+            writer = csv.writer(f)
+            writer.writerow(LONG_COLUMNS)
+            count = 0
+            for chunk in self.iter_chunks(start_date, end_date):
+                writer.writerows(
+                    (d, emp, status, "" if minutes is None else minutes, memo)
+                    for d, emp, status, minutes, memo in chunk
+                )
+                count += len(chunk)
+        return count
+
+    def export_jsonl(self, target, start_date=None, end_date=None):
+        """long 형식 테이블을 JSON Lines (한 줄에 레코드 하나)로 스트리밍 기록합니다."""
+        with _open_text(target) as f:
+            count = 0
+            for chunk in self.iter_chunks(start_date, end_date):
+                f.writelines(
+                    json.dumps(dict(zip(LONG_COLUMNS, row)), ensure_ascii=False) + "\n"
+                    for row in chunk
+                )
+                count += len(chunk)
+        return count
+
+    def export_parquet(self, target, start_date=None, end_date=None):
+        """long 형식 테이블을 Parquet로 기록합니다. (chunk 하나당 row group 하나, pyarrow 필요)"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires the 'pyarrow' package (pip install pyarrow).")
+
+        schema = pa.schema([
+            ("date", pa.string()),
+            ("employee", pa.string()),
+            ("status", pa.string()),
+            ("check_in_minutes", pa.int32()),
+            ("memo", pa.string()),
+        ])
+        count = 0
+        with pq.ParquetWriter(target, schema) as writer:
+            for chunk in self.iter_chunks(start_date, end_date):
+                columns = list(zip(*chunk))
+                writer.write_batch(pa.record_batch(
+                    [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+                    schema=schema
+                ))
+                count += len(chunk)
+        return count
+
+
+class _open_text:
+    """파일 경로 또는 바이너리 파일 객체를 UTF-8 텍스트 스트림으로 엽니다. (전달받은 파일 객체는 닫지 않음)"""
+
+    def __init__(self, target):
+        self.target = target
+        self.stream = None
+
+    def __enter__(self):
+        if isinstance(self.target, str):
+            self.stream = open(self.target, "w", encoding="utf-8", newline="")
+        else:
+            self.stream = io.TextIOWrapper(self.target, encoding="utf-8", newline="", write_through=True)
+        return self.stream
+
+    def __exit__(self, exc_type, exc, tb):
+        if isinstance(self.target, str):
+            self.stream.close()
+        else:
+            self.stream.flush()
+            self.stream.detach()
+        return False
+
+
+# ----------------------------------------------------
+# Command-line entry point
+# ----------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export attendance records as a long (date, employee, status, check_in_minutes, memo) table."
+    )
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="Output format (default: csv)")
+    parser.add_argument("--start", help="Start date (YYYY-MM-DD). Defaults to the oldest record.")
+    parser.add_argument("--end", help="End date (YYYY-MM-DD). Defaults to the newest record.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per write chunk")
+    parser.add_argument("-o", "--output", help="Output file path. CSV/JSON Lines go to stdout if omitted.")
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet" and not args.output:
+        parser.error("--output is required for parquet exports.")
+
+    exporter = BulkExporter(DataManager(), chunk_size=args.chunk_size)
+    target = args.output or sys.stdout.buffer
+    count = exporter.export(target, args.format, args.start, args.end)
+    print(f"[INFO] Exported {count} rows ({args.format}).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+# calendar_component/__init__.py
+# 월간 달력 그리드 Streamlit 컴포넌트 (index.html을 정적 경로로 제공)
+
+import os
+
+import streamlit.components.v1 as components
+
+# Single-HTML calendar grid component (see index.html in this folder).
+# Declared in an importable module so that page scripts run by st.navigation can use it.
+calendar_grid = components.declare_component(
+    "calendar_grid",
+    path=os.path.dirname(os.path.abspath(__file__))
+)
@@ -1,14 +1,97 @@
 # data_manager.py (수정 및 보강)
 
+import copy
 import json
 import os
 import re
+import threading
 from datetime import datetime, date, timedelta
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
 import pandas as pd
 import shutil
 import calendar as pycal # 캘린더 계산을 위해 추가
 
+from perf_metrics import timed, increment
+
+# ----------------------------------------------------
+# 기록 문자열 파싱 헬퍼
+# ----------------------------------------------------
+
+def parse_attendance_record(record_str):
+    """
+    근태 기록 문자열을 (상태, 출근 시각(분)) 튜플로 분리합니다.
+    예: 'ATT(8:25)' -> ('ATT', 505), 'ANL' -> ('ANL', None)
+    """
+    if not isinstance(record_str, str) or not record_str.strip():
+        return None, None
+
+    status = record_str.split('(')[0].strip().upper()
+    minutes = None
+    match = re.search(r'\((\d{1,2}):(\d{2})\)', record_str)
+    if match:
+        minutes = int(match.group(1)) * 60 + int(match.group(2))
+    return status, minutes
+
+# 시간(HH:MM) 외에 직접 입력할 수 있는 근태 TYPE
+ENTRY_TYPES = ["WO", "PEL", "ANL", "HAL", "SIL", "SPL", "EVL"]
+
+def classify_attendance_inputs(values, standard_time="09:00"):
+    """
+    입력값(HH:MM 또는 TYPE) Series를 저장할 기록 문자열로 한 번에 변환합니다.
+    규칙은 app의 save_multi_attendance와 같습니다: 기준 시간 이하 -> 'ATT(HH:MM)', 초과 -> 'LATE(HH:MM)', TYPE은 그대로.
+
+    Returns:
+        (records, invalid): records는 같은 index의 기록 문자열 Series (빈 입력은 ""),
+        invalid는 시간도 TYPE도 아닌 입력을 표시하는 bool Series.
+    """
+    values = values.fillna("").astype(str).str.strip().str.upper()
+
+    parts = values.str.extract(r'^(\d{1,2}):(\d{2})$')
+    hours = pd.to_numeric(parts[0])
+    minutes = pd.to_numeric(parts[1])
+    is_time = hours.notna() & (hours <= 23) & (minutes <= 59)
+
+    std_h, std_m = map(int, standard_time.split(':'))
+    on_time = (hours * 60 + minutes) <= (std_h * 60 + std_m)
+    is_type = values.isin(ENTRY_TYPES)
+
+    records = pd.Series("", index=values.index, dtype=object)
+    records[is_type] = values[is_type]
+    records[is_time & on_time] = "ATT(" + values[is_time & on_time] + ")"
+    records[is_time & ~on_time] = "LATE(" + values[is_time & ~on_time] + ")"
+
+    invalid = (values != "") & ~is_time & ~is_type
+    return records, invalid
+
+# ----------------------------------------------------
+# 월간 뷰 모델 (Streamlit / CTK 달력 공용, 불변 구조)
+# ----------------------------------------------------
+
+# 하루의 직원별 기록 한 줄: record는 원본 문자열, status는 파싱된 상태 코드,
+# display는 상태 부분만 대문자로 바꾼 표시용 문자열 (예: 'Late(08:40)' -> 'LATE(08:40)')
+DayRecord = namedtuple('DayRecord', ['employee', 'record', 'status', 'display'])
+
+# 달력 셀 하나. summary_status는 웹 달력 배경색 기준(LATE > PEL > ANL > ATT),
+# dominant_status는 데스크톱 달력 기준(LATE > ATT > EVL > ... > WO) 대표 상태입니다.
+DayView = namedtuple('DayView', [
+    'date_str', 'day', 'in_month', 'weekday', 'holiday_name', 'memo',
+    'records', 'status_counts', 'summary_status', 'dominant_status'
+])
+
+# weeks: 일요일 시작 주 단위의 DayView 튜플들 (인접 월 날짜는 in_month=False)
+MonthView = namedtuple('MonthView', ['year', 'month', 'data_version', 'weeks'])
+
+# 연간 히트맵용 직원 x 날짜 상태 행렬. codes[i, j]는 employees[i]의 dates[j] 상태를 YEAR_STATUS_CODES의 index로 표시합니다.
+YearMatrix = namedtuple('YearMatrix', ['year', 'data_version', 'dates', 'employees', 'codes'])
+
+# 프로세스 공용 스토어 스냅샷: 마지막으로 로드/저장한 상태와 그때의 파일 상태 ((경로, mtime, 크기) x 2)
+# month_views: {(year, month): MonthView} (미리 만든 월간 뷰 모델)
+StoreSnapshot = namedtuple('StoreSnapshot', ['file_key', 'settings', 'attendance_data', 'month_views'])
+YEAR_STATUS_CODES = ["NONE", "ATT", "LATE", "WO", "PEL", "ANL", "HAL", "SIL", "SPL", "EVL"]
+
+SUMMARY_STATUS_PRIORITY = ["LATE", "PEL", "ANL", "ATT"]
+DOMINANT_STATUS_PRIORITY = ["LATE", "ATT", "EVL", "SPL", "SIL", "HAL", "ANL", "PEL", "WO"]
+
 # ----------------------------------------------------
 # DataManager Class
 # ----------------------------------------------------
@@ -22,11 +105,22 @@ class DataManager:
     
     # Constants
     ALL_STATUS_COLS = ["ATT", "LATE", "WO", "PEL", "ANL", "HAL", "SIL", "SPL", "EVL"]
+    MONTH_VIEW_CACHE_SIZE = 24
+
+    # 설정/출석 파일이 그대로면 새 인스턴스(예: Streamlit 새 세션)는 Excel 파싱과 재계산 대신 이 스냅샷의 복사본으로 시작합니다.
+    _shared_snapshot = None
+    _shared_snapshot_lock = threading.Lock()
 
 
     def __init__(self):
         """DataManager를 초기화하고 파일 경로를 설정합니다."""
         
+        self._init_runtime_state()
+        
+        # 0. 파일이 마지막 로드/저장 이후 바뀌지 않았으면 공용 스냅샷 사용 (1~3 생략)
+        if self._adopt_shared_snapshot():
+            return
+
         # 1. 설정 로드 (settings.json)
         self.settings = self._load_settings()
         
@@ -38,6 +132,75 @@ class DataManager:
         if current_time:
             self.recalculate_all_attendance(current_time)
 
+        self.publish_snapshot()
+
+    def _init_runtime_state(self):
+        # 데이터(출석 기록/설정)가 변경될 때마다 증가하는 버전 (뷰 모델 캐시 무효화용)
+        self.data_version = 0
+        self._month_view_cache = OrderedDict()
+        self._month_view_lock = threading.Lock() # 달력의 백그라운드 prefetch 스레드와 공유
+        self._year_matrix = None # 마지막으로 계산한 YearMatrix (year, data_version이 같으면 재사용)
+        # 지정되면 Excel 저장을 이 작업 스레드(AttendanceWriter)에 맡깁니다. (데스크톱 UI 응답성 유지용)
+        self.attendance_writer = None
+
+    def detached_copy(self):
+        """
+        현재 설정/출석 데이터의 복사본을 가진 새 DataManager를 반환합니다. 파일은 읽지 않습니다.
+        백그라운드 보고서 작업처럼 다른 스레드에서 읽기만 할 때 사용합니다. (UI 스레드의 저장과 dict를 공유하지 않음)
+        """
+        copy_dm = DataManager.__new__(DataManager)
+        copy_dm._init_runtime_state()
+        copy_dm.settings = copy.deepcopy(self.settings)
+        copy_dm.attendance_data, _ = self.snapshot_attendance_data()
+        return copy_dm
+
+    # ----------------------------------------------------
+    # --- 프로세스 공용 스토어 스냅샷 ---
+    # ----------------------------------------------------
+
+    @staticmethod
+    def _store_file_key():
+        """설정/출석 파일의 (절대 경로, mtime, 크기). 파일이 없으면 mtime/크기는 None."""
+        key = []
+        for path in (DataManager.SETTINGS_FILE_PATH, DataManager.ATTENDANCE_FILE_PATH):
+            try:
+                stat = os.stat(path)
+                key.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                key.append((os.path.abspath(path), None, None))
+        return tuple(key)
+
+    def _adopt_shared_snapshot(self):
+        """공용 스냅샷이 현재 파일 상태와 같으면 그 복사본으로 상태를 채우고 True를 반환합니다."""
+        with DataManager._shared_snapshot_lock:
+            snapshot = DataManager._shared_snapshot
+        if snapshot is None or snapshot.file_key != self._store_file_key():
+            increment("data_manager.store_snapshot.miss")
+            return False
+
+        increment("data_manager.store_snapshot.hit")
+        self.settings = copy.deepcopy(snapshot.settings)
+        self.attendance_data = {date_str: dict(day_map) for date_str, day_map in snapshot.attendance_data.items()}
+        # MonthView는 불변(namedtuple)이므로 그대로 공유
+        for (year, month), view in snapshot.month_views.items():
+            self._month_view_cache[(year, month, self.data_version)] = view._replace(data_version=self.data_version)
+        return True
+
+    def publish_snapshot(self):
+        """
+        현재 상태(설정, 출석 데이터, 현재 버전의 월간 뷰)를 공용 스냅샷으로 등록합니다.
+        로드/동기 저장 직후에 호출되며, 캐시 예열(warmup.py)은 월간 뷰를 만든 뒤 다시 호출합니다.
+        """
+        with self._month_view_lock:
+            month_views = {
+                (year, month): view for (year, month, version), view in self._month_view_cache.items()
+                if version == self.data_version
+            }
+        attendance_data, _ = self.snapshot_attendance_data()
+        snapshot = StoreSnapshot(self._store_file_key(), copy.deepcopy(self.settings), attendance_data, month_views)
+        with DataManager._shared_snapshot_lock:
+            DataManager._shared_snapshot = snapshot
+
     # ----------------------------------------------------
     # --- 헬퍼: 파일 I/O (JSON - Settings용) ---
     # ----------------------------------------------------
@@ -70,11 +233,13 @@ class DataManager:
         except Exception as e:
             print(f"[ERROR] Failed to save {file_path}. Error: {e}")
 
+    @timed("data_manager.load_settings")
     def _load_settings(self):
         """설정 데이터를 로드합니다. (settings.json 사용)"""
         default_settings = {
             'employees': [], 
             'attendance_time': '09:00',
+            'badges': {}, # 출입 카드 번호 -> 직원명 (펀치 로그 가져오기용)
             'appearance_mode': 'dark',
             'color_theme': 'blue',
             'font_size': 12
@@ -85,6 +250,7 @@ class DataManager:
     # --- [핵심 수정] 헬퍼: 파일 I/O (Excel - Attendance Data용) ---
     # ----------------------------------------------------
 
+    @timed("data_manager.load_attendance")
     def _load_attendance_data(self):
         """
         출석 데이터를 attendance.xlsx 파일에서 로드하고, 내부 포맷(Dict[str, Dict[str, str]])으로 변환합니다.
@@ -137,27 +303,53 @@ class DataManager:
 
 
 
+    @timed("data_manager.save_attendance")
     def _save_attendance_data(self):
         """
         내부 출석 데이터를 DataFrame으로 변환하여 attendance.xlsx 파일에 저장합니다.
+        attendance_writer가 지정된 경우 현재 데이터의 스냅샷만 넘기고 바로 반환합니다. (실제 저장은 작업 스레드)
+        """
+        self.data_version += 1 # 저장 = 데이터 변경 (캐시된 월간 뷰 무효화)
+
+        if self.attendance_writer is not None:
+            self.attendance_writer.request_save()
+            return
+
+        try:
+            self.write_attendance_excel(self.attendance_data, self.get_employee_list())
+        except Exception as e:
+            print(f"[ERROR] Failed to save attendance data to Excel. Error: {e}")
+            return
+        self.publish_snapshot()
+
+    def snapshot_attendance_data(self):
+        """저장용 스냅샷 (출석 데이터 복사본, 직원 목록 복사본)을 반환합니다. 작업 스레드에 넘겨도 안전합니다."""
+        attendance_data = {date_str: dict(day_map) for date_str, day_map in self.attendance_data.items()}
+        return attendance_data, list(self.get_employee_list())
+
+    @staticmethod
+    @timed("data_manager.write_attendance_excel")
+    def write_attendance_excel(attendance_data, employee_cols):
+        """
+        출석 데이터(Dict[str, Dict[str, str]])를 attendance.xlsx 파일에 기록합니다. 실패 시 예외를 그대로 전달합니다.
+        (self 상태에 접근하지 않으므로 AttendanceWriter 작업 스레드에서 스냅샷으로 호출됩니다)
         """
         file_path = DataManager.ATTENDANCE_FILE_PATH
         
         # 1. 내부 딕셔너리를 DataFrame으로 변환
-        if not self.attendance_data:
+        if not attendance_data:
             # ⭐ 수정: 빈 DataFrame 생성 시 'MEMO' 컬럼 포함
-            columns = self.get_employee_list() + ['MEMO']
+            columns = employee_cols + ['MEMO']
             df = pd.DataFrame(columns=columns)
         else:
             # orient='index'로 변환하여 날짜가 Index로 오도록 함
-            df = pd.DataFrame.from_dict(self.attendance_data, orient='index')
+            df = pd.DataFrame.from_dict(attendance_data, orient='index')
         
         # ⭐ 핵심 수정 1: '__MEMO__' 컬럼 이름을 'MEMO'로 변경
         if '__MEMO__' in df.columns:
             df = df.rename(columns={'__MEMO__': 'MEMO'})
             
         # ⭐ 핵심 수정 2: 직원 컬럼과 MEMO 컬럼 순서를 재정렬
-        employee_cols = self.get_employee_list()
         final_cols = []
         
         # 1. 직원 컬럼 추가 (settings에 정의된 순서 유지)
@@ -181,12 +373,8 @@ class DataManager:
         # Index 이름을 'Date'로 설정
         df.index.name = 'Date'
         
-        # 2. Excel 파일 저장
-        try:
-            # openpyxl 엔진을 명시하여 저장
-            df.to_excel(file_path, engine='openpyxl')
-        except Exception as e:
-            print(f"[ERROR] Failed to save attendance data to Excel. Error: {e}")
+        # 2. Excel 파일 저장 (openpyxl 엔진을 명시하여 저장)
+        df.to_excel(file_path, engine='openpyxl')
 
 # data_manager.py (기존 함수들 사이에 추가)
 
@@ -211,6 +399,78 @@ class DataManager:
         """
         self._save_attendance_data()
 
+    def apply_attendance_changes(self, changes):
+        """
+        여러 날짜/직원의 기록 변경을 메모리에 반영한 뒤 Excel 파일을 한 번만 저장합니다. (월간 일괄 입력용)
+
+        Args:
+            changes (dict): {date_str: {직원명 또는 '__MEMO__': 기록 문자열}}. 값이 None이나 빈 문자열이면 삭제합니다.
+        Returns:
+            int: 실제로 바뀐 항목 수
+        """
+        changed = 0
+        for date_str, day_changes in changes.items():
+            day_map = self.attendance_data.get(date_str, {})
+            for key, value in day_changes.items():
+                if value:
+                    if day_map.get(key) != value:
+                        day_map[key] = value
+                        changed += 1
+                elif key in day_map:
+                    del day_map[key]
+                    changed += 1
+
+            if day_map:
+                self.attendance_data[date_str] = day_map
+            else:
+                self.attendance_data.pop(date_str, None)
+
+        if changed:
+            self._save_attendance_data()
+        return changed
+
+    def apply_status_range(self, employees, status, start_date, end_date, skip_weekends=True, skip_holidays=True, overwrite=True):
+        """
+        여러 직원에게 기간 내 같은 근태 TYPE(예: 2주 ANL)을 한 번에 적용하고 Excel 파일을 한 번만 저장합니다.
+
+        Args:
+            employees (list): 적용할 직원명 목록.
+            status (str): ENTRY_TYPES 중 하나 (WO, PEL, ANL, HAL, SIL, SPL, EVL).
+            start_date, end_date (str/date): 기간 (양 끝 포함).
+            skip_weekends (bool): 토/일요일 제외.
+            skip_holidays (bool): settings.json의 holidays 제외.
+            overwrite (bool): False이면 이미 기록이 있는 날은 건너뜁니다.
+        Returns:
+            (int, list): 변경된 기록 수, 적용 대상이 된 날짜 목록
+        """
+        status = str(status).strip().upper()
+        if status not in ENTRY_TYPES:
+            raise ValueError(f"Unsupported status '{status}'. Expected one of {ENTRY_TYPES}.")
+        if isinstance(start_date, str):
+            start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+        if isinstance(end_date, str):
+            end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+        if start_date > end_date:
+            raise ValueError("The start date must be on or before the end date.")
+
+        holiday_map = self.get_holiday_map() if skip_holidays else {}
+        dates = []
+        current = start_date
+        while current <= end_date:
+            date_str = current.strftime('%Y-%m-%d')
+            if not (skip_weekends and current.weekday() >= 5) and date_str not in holiday_map:
+                dates.append(date_str)
+            current += timedelta(days=1)
+
+        changes = {}
+        for date_str in dates:
+            day_map = self.attendance_data.get(date_str, {})
+            for emp in employees:
+                if overwrite or not day_map.get(emp):
+                    changes.setdefault(date_str, {})[emp] = status
+
+        return self.apply_attendance_changes(changes), dates
+
 
 
     # ----------------------------------------------------
@@ -221,6 +481,13 @@ class DataManager:
         """현재 직원 목록을 반환합니다."""
         return self.settings.get('employees', [])
 
+    def get_badge_map(self):
+        """settings.json의 'badges'를 {카드 번호(str): 직원명} 형태로 반환합니다."""
+        badges = self.settings.get('badges', {})
+        if not isinstance(badges, dict):
+            return {}
+        return {str(badge).strip(): emp for badge, emp in badges.items()}
+
     def save_attendance_record(self, date_str, employee_name, status, time_str=None):
         """단일 근태 기록을 저장하고 Excel 파일을 업데이트합니다."""
         
@@ -249,6 +516,7 @@ class DataManager:
         
         # 1. 설정 저장 (JSON)
         self.settings.update(new_settings)
+        self.data_version += 1 # 직원 목록/공휴일 변경도 월간 뷰에 반영되어야 함
         self._save_json(self.settings, DataManager.SETTINGS_FILE_PATH)
         
         # 2. 기준 시간이 변경되었거나 직원 목록이 변경된 경우
@@ -262,6 +530,9 @@ class DataManager:
         if old_time != new_time:
             self.recalculate_all_attendance(new_time) 
 
+        self.publish_snapshot() # settings.json이 바뀌었으므로 공용 스냅샷도 갱신
+
+    @timed("data_manager.recalculate")
     def recalculate_all_attendance(self, new_attendance_time):
         """
         기준 출근 시간을 기반으로 모든 '출석' 및 '지각' 기록을 재계산하고 Excel을 저장합니다.
@@ -302,8 +573,204 @@ class DataManager:
         if recalculated_count > 0:
             self._save_attendance_data()
 
+    def iter_daily_records(self, start_date=None, end_date=None):
+        """
+        지정된 기간의 모든 날짜에 대해 (date, day_map)을 날짜 순서대로 하나씩 반환합니다. (제너레이터)
+        기록이 없는 날짜는 빈 딕셔너리로 반환되며, 전체 데이터를 DataFrame으로 만들지 않습니다.
+
+        Args:
+            start_date (str/date/None): 시작 날짜. None이면 가장 오래된 기록 날짜.
+            end_date (str/date/None): 종료 날짜. None이면 가장 최근 기록 날짜.
+        """
+        if isinstance(start_date, str):
+            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+        if isinstance(end_date, str):
+            end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+
+        if start_date is None or end_date is None:
+            recorded = []
+            for date_str in self.attendance_data:
+                try:
+                    recorded.append(datetime.strptime(date_str, "%Y-%m-%d").date())
+                except ValueError:
+                    continue
+            if not recorded:
+                return
+            start_date = start_date or min(recorded)
+            end_date = end_date or max(recorded)
+
+        current = start_date
+        while current <= end_date:
+            yield current, self.attendance_data.get(current.strftime("%Y-%m-%d"), {})
+            current += timedelta(days=1)
+
+    def iter_attendance_rows(self, start_date=None, end_date=None):
+        """
+        지정된 기간의 기록을 long 형식 행 (date, employee, status, check_in_minutes, memo)으로
+        하나씩 반환합니다. (제너레이터, 날짜 순서)
+        메모만 있는 날짜는 employee/status가 빈 값인 행 하나로 반환됩니다.
+        """
+        for day, day_map in self.iter_daily_records(start_date, end_date):
+            if not day_map:
+                continue
+            date_str = day.strftime("%Y-%m-%d")
+            memo = day_map.get('__MEMO__', "")
+            has_record = False
+            for emp, record in day_map.items():
+                if emp == '__MEMO__':
+                    continue
+                status, minutes = parse_attendance_record(record)
+                if status is None:
+                    continue
+                has_record = True
+                yield date_str, emp, status, minutes, memo
+            if not has_record and memo:
+                yield date_str, "", "", None, memo
+
+    # --- 월간 뷰 모델 (달력 UI 공용) ---
+
+    def get_month_entry_grid(self, year, month):
+        """
+        월간 일괄 입력 표를 반환합니다. (행: 날짜, 열: 직원 + 'Memo')
+        값은 입력 폼과 같은 형식입니다: 'ATT(09:00)' -> '09:00', 'ANL' -> 'ANL', 기록 없음 -> ''.
+        """
+        employees = self.get_employee_list()
+        dates = [f"{year}-{month:02d}-{day:02d}" for day in range(1, pycal.monthrange(year, month)[1] + 1)]
+
+        rows = []
+        for date_str in dates:
+            day_map = self.attendance_data.get(date_str, {})
+            row = []
+            for emp in employees:
+                record = str(day_map.get(emp) or "").strip()
+                if '(' in record and ')' in record:
+                    record = record.split('(')[-1].strip(')')
+                row.append(record)
+            row.append(day_map.get('__MEMO__', ""))
+            rows.append(row)
+
+        return pd.DataFrame(rows, index=pd.Index(dates, name='Date'), columns=employees + ['Memo'])
+
+    def get_holiday_map(self):
+        """settings.json의 holidays를 {'YYYY-MM-DD': 이름} 형태로 정규화하여 반환합니다."""
+        holiday_map = {}
+        raw_holidays = self.settings.get("holidays", {})
+        if isinstance(raw_holidays, dict):
+            for h_str, h_name in raw_holidays.items():
+                try:
+                    d = datetime.strptime(h_str.strip(), '%Y-%m-%d').date()
+                    holiday_map[d.strftime('%Y-%m-%d')] = h_name
+                except ValueError:
+                    pass
+        return holiday_map
+
+    def month_view(self, year, month):
+        """
+        지정된 월의 달력 뷰 모델(MonthView)을 반환합니다.
+        (year, month, data_version) 단위로 LRU 캐시되므로, 데이터가 바뀌지 않은 월을 다시 그릴 때는 파싱을 건너뜁니다.
+        백그라운드 스레드(인접 월 prefetch)에서도 호출할 수 있습니다.
+        """
+        with self._month_view_lock:
+            cache_key = (year, month, self.data_version)
+            view = self._month_view_cache.get(cache_key)
+            if view is not None:
+                self._month_view_cache.move_to_end(cache_key)
+                increment("data_manager.month_view.cache_hit")
+                return view
+
+            increment("data_manager.month_view.cache_miss")
+            view = self._build_month_view(year, month)
+            self._month_view_cache[cache_key] = view
+            while len(self._month_view_cache) > self.MONTH_VIEW_CACHE_SIZE:
+                self._month_view_cache.popitem(last=False)
+            return view
+
+    def prefetch_month_views(self, months):
+        """[(year, month), ...]의 뷰 모델을 미리 만들어 캐시에 넣습니다. (백그라운드 스레드용, 실패는 무시)"""
+        for year, month in months:
+            try:
+                self.month_view(year, month)
+            except Exception as e:
+                # 저장 중 데이터가 바뀌는 등 일시적인 실패: 필요할 때 메인 스레드에서 다시 계산됩니다.
+                print(f"[WARNING] Month view prefetch for {year}-{month:02d} skipped: {e}")
+
+    @timed("data_manager.build_month_view")
+    def _build_month_view(self, year, month):
+        employees = self.get_employee_list()
+        holiday_map = self.get_holiday_map()
+        cal = pycal.Calendar(pycal.SUNDAY)
+
+        weeks = []
+        for week in cal.monthdatescalendar(year, month):
+            days = []
+            for weekday, day_dt in enumerate(week):
+                date_str = day_dt.strftime("%Y-%m-%d")
+                day_map = self.attendance_data.get(date_str, {}) if day_dt.month == month else {}
+
+                # 설정된 직원 순서대로, 이어서 목록에 없는 (이전) 직원의 기록
+                names = [emp for emp in employees if emp in day_map]
+                names += [key for key in day_map if key != '__MEMO__' and key not in employees]
+
+                records = []
+                status_counts = defaultdict(int)
+                for emp in names:
+                    record = str(day_map[emp])
+                    status, _ = parse_attendance_record(record)
+                    status_part, paren, time_part = record.partition('(')
+                    records.append(DayRecord(emp, record, status, f"{status_part.strip().upper()}{paren}{time_part}"))
+                    if status:
+                        status_counts[status] += 1
+
+                summary_status = next((st for st in SUMMARY_STATUS_PRIORITY if status_counts.get(st)), "NONE")
+                dominant_status = next((st for st in DOMINANT_STATUS_PRIORITY if status_counts.get(st)), "NONE")
+
+                days.append(DayView(
+                    date_str=date_str,
+                    day=day_dt.day,
+                    in_month=day_dt.month == month,
+                    weekday=weekday, # 0 = 일요일
+                    holiday_name=holiday_map.get(date_str),
+                    memo=day_map.get('__MEMO__', ""),
+                    records=tuple(records),
+                    status_counts=tuple(sorted(status_counts.items())),
+                    summary_status=summary_status,
+                    dominant_status=dominant_status,
+                ))
+            weeks.append(tuple(days))
+
+        return MonthView(year, month, self.data_version, tuple(weeks))
+
     # --- 통계 계산 헬퍼 (기존 로직 유지) ---
     
+    # --- 연간 상태 행렬 (연간 히트맵용) ---
+
+    @timed("data_manager.year_status_matrix")
+    def year_status_matrix(self, year):
+        """
+        한 해의 직원 x 날짜 상태 코드 행렬(YearMatrix)을 반환합니다.
+        기록 문자열 파싱은 pandas 문자열 연산으로 한 번에 처리되며, (year, data_version)이 같으면 이전 결과를 재사용합니다.
+        """
+        cached = self._year_matrix
+        if cached is not None and cached.year == year and cached.data_version == self.data_version:
+            return cached
+
+        data_version = self.data_version
+        employees = list(self.get_employee_list())
+        dates = [d.strftime("%Y-%m-%d") for d in pd.date_range(f"{year}-01-01", f"{year}-12-31")]
+
+        year_data = {d: self.attendance_data[d] for d in dates if d in self.attendance_data}
+        df = pd.DataFrame.from_dict(year_data, orient='index') if year_data else pd.DataFrame()
+        df = df.reindex(index=dates, columns=employees)
+
+        # 'ATT(8:25)' -> 'ATT', 'anl' -> 'ANL'. 알 수 없는 상태/빈 칸은 NONE(0)
+        statuses = pd.Series(df.to_numpy().ravel(), dtype="string").str.extract(r'^\s*([A-Za-z]+)', expand=False).str.upper()
+        codes = pd.Categorical(statuses, categories=YEAR_STATUS_CODES[1:]).codes + 1
+        codes = codes.reshape(len(dates), len(employees)).T.astype('int8')
+
+        matrix = YearMatrix(year, data_version, tuple(dates), tuple(employees), codes)
+        self._year_matrix = matrix
+        return matrix
+
     def _get_start_end_dates(self, period_type, year=None, month=None):
         """주어진 기간 유형에 해당하는 시작일과 종료일을 반환합니다."""
         if period_type == 'total':
@@ -331,6 +798,7 @@ class DataManager:
 # ... (다른 메서드들)
 
     # ⭐ 수정 1: 인자(매개변수)를 통계 뷰의 호출 방식에 맞게 변경합니다. ⭐
+    @timed("data_manager.calculate_stats")
     def calculate_attendance_stats(self, start_date=None, end_date=None, is_total=False):
         """지정된 기간에 대한 직원별 근태 통계를 DataFrame으로 반환합니다.
         
@@ -343,10 +811,9 @@ class DataManager:
         if not employees:
             return pd.DataFrame()
             
-        df = pd.DataFrame({'Employee': employees})
-        
-        for col in self.ALL_STATUS_COLS:
-            df[col] = 0
+        # 직원별/상태별 카운트를 먼저 딕셔너리에 누적한 뒤 마지막에 DataFrame으로 변환합니다.
+        # (셀마다 df.loc 갱신 시 직원 수에 비례한 비용이 반복되어 대규모 직원 목록에서 매우 느려짐)
+        counts = {emp: dict.fromkeys(self.ALL_STATUS_COLS, 0) for emp in employees}
             
         # ⭐ 수정 2: start_date, end_date 인자를 datetime.date 객체로 변환합니다. ⭐
         start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
@@ -372,14 +839,16 @@ class DataManager:
                 
             for emp in employees:
                 v = emp_map.get(emp)
-                status = None
                 
                 if isinstance(v, str):
                     raw = v.split('(')[0].strip().upper()
-                    if raw in df.columns:
+                    emp_counts = counts[emp]
+                    if raw in emp_counts:
                         # 통계 업데이트 로직 (기존 로직 유지)
-                        df.loc[df['Employee'] == emp, raw] += 1
+                        emp_counts[raw] += 1
                         
-        return df
+        df = pd.DataFrame.from_dict(counts, orient='index', columns=self.ALL_STATUS_COLS)
+        df.insert(0, 'Employee', employees)
+        return df.reset_index(drop=True)
 
 # ⭐ 참고: 이제 _get_start_end_dates 메서드는 사용되지 않으므로, 삭제하거나 주석 처리할 수 있습니다. ⭐
\ No newline at end of file
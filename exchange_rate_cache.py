@@ -0,0 +1,154 @@
+# exchange_rate_cache.py
+# 프로세스 공용 환율 캐시 (디스크 저장 + TTL + stale-while-revalidate)
+# Streamlit 세션과 CTK 환율 뷰가 같은 스냅샷을 공유하며, 외부 API 호출은 한 번에 하나의 백그라운드 갱신으로 제한됩니다.
+
+import json
+import os
+import threading
+import time
+
+import requests
+
+DEFAULT_API_URL = "https://open.er-api.com/v6/latest/USD"
+API_URL_ENV = "EXCHANGE_RATE_API_URL" # 테스트 등에서 로컬 대체 서버를 가리킬 때 사용
+CACHE_FILE_PATH = "exchange_rates_cache.json"
+DEFAULT_TTL = 6 * 60 * 60        # 제공처는 하루 한 번 갱신되므로 6시간이면 충분히 신선합니다.
+MIN_REFRESH_INTERVAL = 60        # 갱신 시도 간 최소 간격 (강제 갱신/오프라인 재시도 포함)
+
+
+class ExchangeRateCache:
+    """
+    환율 스냅샷을 메모리와 디스크(JSON)에 보관합니다.
+
+    get()은 항상 즉시 마지막 스냅샷을 반환하고 (오래되었더라도), TTL이 지났으면 백그라운드 갱신을 시작합니다.
+    갱신은 동시에 하나만 실행되며, 실패해도 마지막 스냅샷은 그대로 사용할 수 있습니다. (오프라인 지원)
+
+    스냅샷 형식: {'base', 'rates', 'time_last_update_utc', 'fetched_at'}
+    """
+
+    def __init__(self, api_url=None, cache_path=CACHE_FILE_PATH, ttl=DEFAULT_TTL, timeout=10):
+        self.api_url = api_url or os.environ.get(API_URL_ENV) or DEFAULT_API_URL
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.last_error = None
+
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self._last_attempt = 0.0
+        self._snapshot = self._load_snapshot()
+
+    # --- 조회 ---
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    def is_stale(self, snapshot=None):
+        snapshot = snapshot or self._snapshot
+        return snapshot is None or time.time() - snapshot.get('fetched_at', 0) > self.ttl
+
+    @property
+    def refreshing(self):
+        thread = self._refresh_thread
+        return thread is not None and thread.is_alive()
+
+    def get(self, wait_if_empty=False, timeout=None):
+        """
+        마지막 스냅샷을 반환합니다. 오래되었으면 백그라운드 갱신을 시작합니다. (stale-while-revalidate)
+
+        Args:
+            wait_if_empty (bool): 스냅샷이 아직 하나도 없으면 진행 중인 갱신이 끝날 때까지 기다립니다.
+        Returns:
+            dict or None: 스냅샷 (한 번도 가져오지 못했으면 None)
+        """
+        snapshot = self._snapshot
+        if self.is_stale(snapshot):
+            thread = self.refresh_async()
+            if snapshot is None and wait_if_empty and thread is not None:
+                thread.join(timeout if timeout is not None else self.timeout + 1)
+                snapshot = self._snapshot
+        return snapshot
+
+    # --- 갱신 ---
+
+    def refresh_async(self, force=False):
+        """
+        백그라운드 갱신을 시작하고 해당 스레드를 반환합니다.
+        이미 갱신 중이면 그 스레드를 반환하고, 갱신이 필요 없으면 None을 반환합니다.
+        force=True여도 마지막 시도 후 MIN_REFRESH_INTERVAL 이내면 다시 호출하지 않습니다. (오프라인일 때 재시도 폭주 방지)
+        """
+        with self._lock:
+            if self.refreshing:
+                return self._refresh_thread
+
+            now = time.time()
+            if now - self._last_attempt < MIN_REFRESH_INTERVAL:
+                return None
+            if not force and not self.is_stale():
+                return None
+
+            self._last_attempt = now
+            self._refresh_thread = threading.Thread(target=self._refresh, name="exchange-rate-refresh", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def _refresh(self):
+        try:
+            response = requests.get(self.api_url, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+
+            if data.get('result') != 'success' or 'rates' not in data:
+                raise ValueError(f"API response failed or was in a different format than expected: {data.get('error-type', 'unknown')}")
+
+            snapshot = {
+                'base': data.get('base_code', data.get('base', 'USD')),
+                'rates': data['rates'],
+                'time_last_update_utc': data.get('time_last_update_utc', ''),
+                'fetched_at': time.time(),
+            }
+            self._snapshot = snapshot
+            self.last_error = None
+            self._save_snapshot(snapshot)
+        except Exception as e:
+            # 마지막 스냅샷은 유지합니다. (오프라인이어도 계속 표시)
+            print(f"[ERROR] Exchange rate refresh failed: {e}")
+            self.last_error = e
+
+    # --- 디스크 ---
+
+    def _load_snapshot(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, dict) and isinstance(snapshot.get('rates'), dict):
+                return snapshot
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to load exchange rate cache '{self.cache_path}': {e}")
+        return None
+
+    def _save_snapshot(self, snapshot):
+        # 임시 파일에 쓴 뒤 교체하여, 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 합니다.
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"[ERROR] Failed to save exchange rate cache '{self.cache_path}': {e}")
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """프로세스 전체에서 공유하는 ExchangeRateCache를 반환합니다. (URL은 EXCHANGE_RATE_API_URL 환경 변수로 변경 가능)"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ExchangeRateCache()
+        return _shared_cache
@@ -2,15 +2,15 @@ import customtkinter as ctk # 파일의 첫 줄은 이 코드가 되어야 합
 import json
 import os
 from tkinter import messagebox
-import requests # ⭐ 이 줄을 추가해야 합니다! ⭐
+
+from exchange_rate_cache import get_shared_cache
 
 class ExchangeRateViewer(ctk.CTkFrame):
     """
     환율 정보를 표시하는 뷰입니다.
     데이터는 외부 JSON 파일 또는 API를 통해 로드될 수 있습니다.
     """
-    # 기준 통화는 USD로 고정됩니다.
-    API_URL = "https://open.er-api.com/v6/latest/USD"
+    # 기준 통화는 USD로 고정됩니다. (API 주소는 exchange_rate_cache에서 설정)
     
     # 표시할 주요 통화 (요청 사항 반영)
     TARGET_CURRENCIES = [
@@ -32,9 +32,14 @@ class ExchangeRateViewer(ctk.CTkFrame):
         "SGD": "Singapore Dollar"
     }
 
+    # 백그라운드 갱신 완료 여부를 확인하는 주기 (메인 스레드는 기다리지 않음)
+    POLL_INTERVAL_MS = 200
+
     def __init__(self, master):
         super().__init__(master, corner_radius=10, fg_color="transparent")
         self.rates = {} # 환율 데이터 저장 딕셔너리
+        self.rate_labels = {} # 통화별 (이름 레이블, 값 레이블) - 한 번만 만들고 텍스트만 갱신
+        self._poll_job = None
         
         self.grid_columnconfigure(0, weight=1)
         
@@ -60,6 +65,25 @@ class ExchangeRateViewer(ctk.CTkFrame):
         self.rate_display_frame.grid_columnconfigure(0, weight=1)
         self.rate_display_frame.grid_columnconfigure(1, weight=1)
 
+        # 통화별 레이블 (환율이 도착하기 전에는 숨겨 둠)
+        for row, currency in enumerate(self.TARGET_CURRENCIES):
+            name_label = ctk.CTkLabel(
+                self.rate_display_frame, 
+                text=f"{self.CURRENCY_NAMES.get(currency, currency)} ({currency})", 
+                anchor="w"
+            )
+            value_label = ctk.CTkLabel(
+                self.rate_display_frame, 
+                text="",
+                anchor="e",
+                font=ctk.CTkFont(weight="bold")
+            )
+            name_label.grid(row=row, column=0, padx=10, pady=3, sticky="w")
+            value_label.grid(row=row, column=1, padx=10, pady=3, sticky="e")
+            name_label.grid_remove()
+            value_label.grid_remove()
+            self.rate_labels[currency] = (name_label, value_label)
+
         # 상태 표시 레이블
         self.status_label = ctk.CTkLabel(
             self, 
@@ -73,81 +97,75 @@ class ExchangeRateViewer(ctk.CTkFrame):
 
     def load_rates_data(self):
         """
-        ExchangeRate-API의 무료 엔드포인트를 호출하여 환율 데이터를 로드합니다.
+        공용 환율 캐시(exchange_rate_cache)에서 환율 데이터를 로드합니다.
+        디스크에 저장된 마지막 스냅샷을 바로 표시하고, API 호출은 캐시의 백그라운드 스레드에서만 실행됩니다.
+        Tk 메인 스레드는 기다리지 않고 after()로 갱신 완료를 확인한 뒤 결과를 반영합니다.
         """
         self.status_label.configure(text="Status: Loading exchange rate data...", text_color="yellow")
 
-        try:
-            # 1. API 호출
-            # requests 라이브러리가 설치되어 있어야 합니다 (pip install requests)
-            response = requests.get(self.API_URL, timeout=10) 
-            response.raise_for_status() # HTTP 오류 발생 시 예외 처리
-
-            data = response.json()
-            
-            # 2. 데이터 유효성 검사 및 저장
-            if data.get('result') == 'success' and 'rates' in data:
-                self.rates = data['rates']
-                update_time = data.get('time_last_update_utc', 'No time information')
-                
-                status_text = f"Status: {data.get('base', 'USD')} based on, {update_time} Updated"
-
-                self.status_label.configure(text=status_text, text_color="white")
-            else:
-                raise ValueError(f"API response failed or was in a different format than expected: {data.get('error-type', 'unknown')}")
-
-        except requests.exceptions.RequestException as e:
-            # "API 호출 중 네트워크 오류가 발생했습니다. 인터넷 연결을 확인하세요: {e}"
-            messagebox.showerror("Network Error", f"A network error occurred during the API call. Please check your internet connection: {e}")
-            
-            # "상태: 네트워크 오류"
-            self.status_label.configure(text="Status: Network Error", text_color="red")
-            return
-        
-        except ValueError as e:
-            # "환율 데이터 처리 오류: {e}"
-            messagebox.showerror("Data Error", f"Currency data processing error: {e}")
-            
-            # "상태: 데이터 처리 오류"
-            self.status_label.configure(text="Status: Data Processing Error", text_color="red")
+        cache = get_shared_cache()
+        snapshot = cache.get() # 즉시 반환 (오래되었으면 백그라운드 갱신 시작)
+
+        if snapshot is not None:
+            self._apply_snapshot(snapshot, cache)
+
+        if cache.refreshing:
+            self._schedule_poll()
+        elif snapshot is None:
+            self._show_load_error(cache)
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            self._poll_job = self.after(self.POLL_INTERVAL_MS, self._poll_refresh)
+
+    def _poll_refresh(self):
+        """(메인 스레드) 백그라운드 갱신이 끝났는지 확인하고, 끝났으면 새 스냅샷을 표시합니다."""
+        self._poll_job = None
+        cache = get_shared_cache()
+        if cache.refreshing:
+            self._schedule_poll()
             return
-        
-        except Exception as e:
-            # "예기치 않은 오류가 발생했습니다: {e}"
-            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
-            
-            # "상태: 알 수 없는 오류"
-            self.status_label.configure(text="Status: Unknown Error", text_color="red")
-            return            
+
+        if cache.snapshot is not None:
+            self._apply_snapshot(cache.snapshot, cache)
+        else:
+            self._show_load_error(cache)
+
+    def _apply_snapshot(self, snapshot, cache):
+        self.rates = snapshot['rates']
+        update_time = snapshot.get('time_last_update_utc') or 'No time information'
+        status_text = f"Status: {snapshot.get('base', 'USD')} based on, {update_time} Updated"
+        if cache.refreshing:
+            status_text += " (refreshing...)"
+        elif cache.last_error:
+            status_text += " (offline cache)"
+        self.status_label.configure(text=status_text, text_color="white")
+
         # 3. UI 업데이트
         self._update_display()
 
+    def _show_load_error(self, cache):
+        # "API 호출 중 네트워크 오류가 발생했습니다. 인터넷 연결을 확인하세요: {e}"
+        messagebox.showerror("Network Error", f"A network error occurred during the API call. Please check your internet connection: {cache.last_error}")
         
+        # "상태: 네트워크 오류"
+        self.status_label.configure(text="Status: Network Error", text_color="red")
+
     def _update_display(self):
-        """로드된 환율 데이터를 UI에 표시합니다."""
-        # 기존 위젯 제거
-        for widget in self.rate_display_frame.winfo_children():
-            widget.destroy()
-            
-        row = 0
-        for currency in self.TARGET_CURRENCIES:
-            if currency in self.rates:
-                rate = self.rates[currency]
-                name = self.CURRENCY_NAMES.get(currency, currency)
-                
-                # 통화 이름 (좌측)
-                ctk.CTkLabel(
-                    self.rate_display_frame, 
-                    text=f"{name} ({currency})", 
-                    anchor="w"
-                ).grid(row=row, column=0, padx=10, pady=3, sticky="w")
-                
-                # 환율 값 (우측)
-                ctk.CTkLabel(
-                    self.rate_display_frame, 
-                    text=f"{rate:,.2f}", # 소수점 둘째 자리, 쉼표 구분
-                    anchor="e",
-                    font=ctk.CTkFont(weight="bold")
-                ).grid(row=row, column=1, padx=10, pady=3, sticky="e")
-                
-                row += 1
+        """로드된 환율 데이터를 UI에 표시합니다. (미리 만든 레이블의 텍스트만 변경)"""
+        for currency, (name_label, value_label) in self.rate_labels.items():
+            rate = self.rates.get(currency)
+            if rate is None:
+                name_label.grid_remove()
+                value_label.grid_remove()
+                continue
+
+            value_label.configure(text=f"{rate:,.2f}") # 소수점 둘째 자리, 쉼표 구분
+            name_label.grid()
+            value_label.grid()
+
+    def destroy(self):
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+        super().destroy()
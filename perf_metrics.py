@@ -0,0 +1,153 @@
+# perf_metrics.py
+# 핫 패스 실행 시간 계측: @timed(...) 데코레이터 또는 with timed(...) 블록으로 감싼 구간의
+# 호출 수, 오류 수, 실행 시간 히스토그램과 카운터를 프로세스 단위로 모읍니다. (Streamlit 'Diagnostics' 페이지에서 조회)
+
+import functools
+import json
+import threading
+import time
+from collections import deque
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 (+Inf)
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+RECENT_SAMPLES = 512 # 백분위수 계산용으로 보관하는 최근 측정값 수
+
+
+class TimingStats:
+    """계측 구간 하나의 누적 통계."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, elapsed_ms, failed=False):
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent.append(elapsed_ms)
+        for i, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= upper:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, p):
+        """최근 측정값 기준 백분위수 (ms). 측정값이 없으면 None."""
+        if not self.recent:
+            return None
+        samples = sorted(self.recent)
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def to_dict(self):
+        labels = [f"<={upper}ms" for upper in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": None if self.min_ms is None else round(self.min_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": _round_or_none(self.percentile(50)),
+            "p95_ms": _round_or_none(self.percentile(95)),
+            "p99_ms": _round_or_none(self.percentile(99)),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+def _round_or_none(value):
+    return None if value is None else round(value, 3)
+
+
+class MetricsRegistry:
+    """구간별 TimingStats와 이름별 카운터를 보관합니다. (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+        self._counters = {}
+        self.started_at = time.time()
+
+    def record(self, name, elapsed_ms, failed=False):
+        with self._lock:
+            stats = self._timings.get(name)
+            if stats is None:
+                stats = self._timings[name] = TimingStats()
+            stats.add(elapsed_ms, failed)
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self):
+        """현재까지의 계측 결과를 JSON 직렬화 가능한 dict로 반환합니다."""
+        with self._lock:
+            return {
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "timings": {name: stats.to_dict() for name, stats in sorted(self._timings.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+            self.started_at = time.time()
+
+
+# 프로세스 전체에서 공유하는 기본 레지스트리
+METRICS = MetricsRegistry()
+
+
+class timed:
+    """
+    구간 실행 시간을 METRICS에 기록합니다. 예외가 발생한 호출은 errors로도 집계됩니다.
+
+        @timed("data_manager.load_attendance")
+        def _load_attendance_data(self): ...
+
+        with timed("calendar.render"):
+            ...
+    """
+
+    def __init__(self, name, registry=None):
+        self.name = name
+        self.registry = registry or METRICS
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        self.registry.record(self.name, elapsed_ms, failed=exc_type is not None)
+        return False
+
+    def __call__(self, func):
+        name, registry = self.name, self.registry
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # 호출마다 새 timed를 사용하므로 여러 스레드에서 동시에 호출해도 안전
+            with timed(name, registry):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def increment(name, value=1):
+    """METRICS의 카운터를 증가시킵니다. (예: 캐시 hit/miss)"""
+    METRICS.increment(name, value)
@@ -0,0 +1,195 @@
+# punch_importer.py
+# 출입 카드 리더기의 펀치 로그(CSV, 카드 태그 1회 = 1행)를 읽어 직원별/일별 첫 출근 기록으로 가져옵니다.
+
+import argparse
+import sys
+
+import pandas as pd
+
+from data_manager import DataManager, classify_attendance_inputs, parse_attendance_record
+
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_BADGE_COLUMN = "badge_id"
+DEFAULT_TIME_COLUMN = "timestamp"
+# "mixed": 행마다 형식을 추론 (예: '2025-10-15 08:08:00'과 '2025-10-15 07:59'가 섞인 로그)
+# 형식이 고정된 큰 로그는 strftime 형식(예: '%Y-%m-%d %H:%M:%S')을 지정하면 더 빠릅니다.
+DEFAULT_TIME_FORMAT = "mixed"
+MAX_REPORTED_INVALID_TIMES = 20 # 미리보기/CLI에 표시할 잘못된 타임스탬프 예시 수
+
+# 가져오기 결과(diff)의 컬럼과 action 값
+DIFF_COLUMNS = ["date", "employee", "current", "punch", "action"]
+ACTION_ADD = "add"            # 기록이 없던 날 -> 추가
+ACTION_UPDATE = "update"      # 기존 ATT/LATE 기록 -> 펀치 기준으로 교체
+ACTION_KEEP_LEAVE = "keep"    # 수동 입력된 휴가/외근 코드 (ANL, SIL 등) -> 유지 (덮어쓰지 않음)
+
+
+class PunchLogImporter:
+    """펀치 로그 CSV를 chunk 단위로 스트리밍하여, 직원별 하루 중 가장 이른 태그 시각을 ATT/LATE 기록으로 변환합니다.
+
+    카드 번호 -> 직원 매핑은 settings.json의 'badges' ({"카드 번호": "직원명"})를 사용합니다.
+    """
+
+    def __init__(self, data_manager, chunk_size=DEFAULT_CHUNK_SIZE,
+                 badge_column=DEFAULT_BADGE_COLUMN, time_column=DEFAULT_TIME_COLUMN, time_format=DEFAULT_TIME_FORMAT):
+        self.data_manager = data_manager
+        self.chunk_size = chunk_size
+        self.badge_column = badge_column
+        self.time_column = time_column
+        self.time_format = time_format or DEFAULT_TIME_FORMAT
+        self.stats = {}
+
+    def first_punches(self, source):
+        """
+        로그 전체에서 (date, employee)별 첫 태그 시각을 구합니다.
+        chunk마다 부분 최솟값만 남기므로 메모리 사용량은 로그 크기가 아니라 직원 수 x 일수에 비례합니다.
+
+        Args:
+            source (str/file): CSV 파일 경로 또는 파일 객체 (예: Streamlit 업로드 파일).
+        Returns:
+            pd.Series: index (date 'YYYY-MM-DD', employee), 값은 Timestamp.
+        """
+        badge_map = self.data_manager.get_badge_map()
+        if not badge_map:
+            raise ValueError("No badge IDs are configured. Add a 'badges' mapping ({\"badge id\": \"employee\"}) to settings.json.")
+
+        self.stats = {"rows": 0, "unknown_badge_rows": 0, "invalid_time_rows": 0}
+        unknown_badges = set()
+        invalid_times = [] # (CSV 줄 번호, 원래 값) 예시
+        firsts = None
+
+        reader = pd.read_csv(
+            source,
+            usecols=[self.badge_column, self.time_column],
+            dtype={self.badge_column: str, self.time_column: str},
+            chunksize=self.chunk_size
+        )
+        for chunk in reader:
+            self.stats["rows"] += len(chunk)
+
+            badges = chunk[self.badge_column].str.strip()
+            employees = badges.map(badge_map)
+            raw_times = chunk[self.time_column].str.strip()
+            times = pd.to_datetime(raw_times, format=self.time_format, errors="coerce")
+
+            unknown = employees.isna()
+            invalid = times.isna() & ~unknown
+            self.stats["unknown_badge_rows"] += int(unknown.sum())
+            self.stats["invalid_time_rows"] += int(invalid.sum())
+            unknown_badges.update(badges[unknown].dropna())
+            if invalid.any() and len(invalid_times) < MAX_REPORTED_INVALID_TIMES:
+                # chunk index는 파일 전체의 데이터 행 번호 (0부터) -> 헤더를 포함한 CSV 줄 번호로 변환
+                for row_index, value in raw_times[invalid].head(MAX_REPORTED_INVALID_TIMES - len(invalid_times)).items():
+                    invalid_times.append((int(row_index) + 2, "" if pd.isna(value) else value))
+
+            valid = ~(unknown | invalid)
+            punches = pd.DataFrame({
+                "date": times[valid].dt.strftime("%Y-%m-%d"),
+                "employee": employees[valid],
+                "time": times[valid],
+            })
+            chunk_firsts = punches.groupby(["date", "employee"])["time"].min()
+            firsts = chunk_firsts if firsts is None else pd.concat([firsts, chunk_firsts]).groupby(level=[0, 1]).min()
+
+        self.stats["unknown_badges"] = sorted(unknown_badges)
+        self.stats["invalid_times"] = invalid_times
+        if firsts is None:
+            return pd.Series(dtype="datetime64[ns]", index=pd.MultiIndex.from_tuples([], names=["date", "employee"]))
+        return firsts
+
+    def build_diff(self, source):
+        """
+        펀치 로그를 현재 근태 기록과 비교한 diff(DataFrame, DIFF_COLUMNS)를 반환합니다. 파일에는 쓰지 않습니다. (dry-run)
+        기존 기록과 같은 항목은 포함되지 않습니다.
+        """
+        firsts = self.first_punches(source)
+        if firsts.empty:
+            return pd.DataFrame(columns=DIFF_COLUMNS)
+
+        standard_time = self.data_manager.settings.get("attendance_time", "09:00")
+        # 저장소와 같은 H:MM 형식 (예: 'ATT(8:08)', 앞자리 0 없음)
+        punch_times = firsts.dt.hour.astype(str) + ":" + firsts.dt.strftime("%M")
+        punch_records, _ = classify_attendance_inputs(punch_times, standard_time)
+
+        attendance_data = self.data_manager.attendance_data
+        rows = []
+        for (date_str, emp), punch in punch_records.items():
+            current = attendance_data.get(date_str, {}).get(emp)
+            if not current:
+                action = ACTION_ADD
+            elif str(current).split('(')[0].strip().upper() in ("ATT", "LATE"):
+                # 문자열이 아니라 파싱된 (상태, 분)으로 비교 ('ATT(08:08)'과 'ATT(8:08)'은 같은 기록)
+                if parse_attendance_record(current) == parse_attendance_record(punch):
+                    continue
+                action = ACTION_UPDATE
+            else:
+                action = ACTION_KEEP_LEAVE
+            rows.append((date_str, emp, current or "", punch, action))
+
+        return pd.DataFrame(rows, columns=DIFF_COLUMNS).sort_values(["date", "employee"], ignore_index=True)
+
+    def apply_diff(self, diff):
+        """build_diff 결과 중 add/update 항목을 DataManager에 한 번에 저장하고, 변경된 항목 수를 반환합니다."""
+        changes = {}
+        for row in diff[diff["action"].isin([ACTION_ADD, ACTION_UPDATE])].itertuples(index=False):
+            changes.setdefault(row.date, {})[row.employee] = row.punch
+        return self.data_manager.apply_attendance_changes(changes)
+
+    def import_log(self, source, dry_run=False):
+        """diff를 만들고, dry_run이 아니면 적용합니다. (diff, 저장된 항목 수)를 반환합니다."""
+        diff = self.build_diff(source)
+        applied = 0 if dry_run else self.apply_diff(diff)
+        return diff, applied
+
+
+# ----------------------------------------------------
+# Command-line entry point
+# ----------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Import first-in punches from a badge reader CSV log as ATT/LATE attendance records."
+    )
+    parser.add_argument("log", help="Punch log CSV file (one row per badge swipe)")
+    parser.add_argument("--dry-run", action="store_true", help="Only print the diff; do not write attendance.xlsx")
+    parser.add_argument("--badge-column", default=DEFAULT_BADGE_COLUMN, help=f"Badge ID column (default: {DEFAULT_BADGE_COLUMN})")
+    parser.add_argument("--time-column", default=DEFAULT_TIME_COLUMN, help=f"Timestamp column (default: {DEFAULT_TIME_COLUMN})")
+    parser.add_argument("--time-format", default=DEFAULT_TIME_FORMAT,
+                        help=f"Timestamp format, e.g. '%%Y-%%m-%%d %%H:%%M:%%S' (default: {DEFAULT_TIME_FORMAT}, inferred per row)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per read chunk")
+    args = parser.parse_args(argv)
+
+    importer = PunchLogImporter(
+        DataManager(), chunk_size=args.chunk_size,
+        badge_column=args.badge_column, time_column=args.time_column, time_format=args.time_format
+    )
+    try:
+        diff, applied = importer.import_log(args.log, dry_run=args.dry_run)
+    except (ValueError, OSError) as e:
+        print(f"[ERROR] Punch log import failed: {e}", file=sys.stderr)
+        return 1
+
+    if not diff.empty:
+        print(diff.to_string(index=False))
+    counts = diff["action"].value_counts()
+    stats = importer.stats
+    print(
+        f"[INFO] {stats['rows']} punches read, {stats['unknown_badge_rows']} with unknown badges, "
+        f"{stats['invalid_time_rows']} with invalid timestamps.",
+        file=sys.stderr
+    )
+    if stats["unknown_badges"]:
+        print(f"[WARNING] Unknown badge IDs: {', '.join(stats['unknown_badges'][:20])}", file=sys.stderr)
+    if stats["invalid_times"]:
+        examples = ", ".join(f"line {line}: '{value}'" for line, value in stats["invalid_times"])
+        print(f"[WARNING] Skipped rows with unreadable timestamps ({examples})", file=sys.stderr)
+    print(
+        f"[INFO] add: {counts.get(ACTION_ADD, 0)}, update: {counts.get(ACTION_UPDATE, 0)}, "
+        f"kept leave codes: {counts.get(ACTION_KEEP_LEAVE, 0)}. "
+        + ("Dry run: nothing written." if args.dry_run else f"{applied} records written."),
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
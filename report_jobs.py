@@ -0,0 +1,194 @@
+# report_jobs.py
+# 보고서(PDF/Excel) 생성을 백그라운드 스레드 풀에서 실행하는 작업 관리자
+
+import functools
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from data_manager import DataManager
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+class JobCancelled(Exception):
+    """작업이 취소되었을 때 진행률 콜백에서 발생하여 내보내기 로직을 중단시킵니다."""
+
+
+class ReportJob:
+    """백그라운드 보고서 작업 하나의 상태(진행률, 결과, 오류)를 보관합니다."""
+
+    def __init__(self, key, label, file_name, mime):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.label = label
+        self.file_name = file_name
+        self.mime = mime
+        self.status = JOB_QUEUED
+        self.progress = 0.0
+        self.message = "Waiting for a worker..."
+        self.result = None # 완료 시 파일 내용 (bytes)
+        self.error = None
+        self.subscribers = set() # 같은 작업을 기다리는 구독자(세션) 토큰 (single-flight)
+        self.created_at = time.time()
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def report_progress(self, fraction, message=""):
+        """내보내기 로직의 progress_callback으로 전달됩니다. 취소 요청 시 JobCancelled를 발생시킵니다."""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+        self.progress = max(0.0, min(1.0, float(fraction)))
+        if message:
+            self.message = message
+
+
+class ReportJobManager:
+    """
+    보고서 작업을 제한된 크기의 스레드 풀에서 실행합니다.
+    동일한 요청(같은 key + 같은 데이터 파일 상태)이 여러 세션에서 동시에 들어오면 작업 하나로 합쳐집니다.
+    """
+
+    def __init__(self, max_workers=2, max_finished_jobs=50, result_ttl=600):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-job")
+        self._lock = threading.Lock()
+        self._jobs = {}       # job_id -> ReportJob
+        self._by_key = {}     # single-flight key -> job_id
+        self.max_finished_jobs = max_finished_jobs
+        self.result_ttl = result_ttl
+
+    @staticmethod
+    def data_fingerprint():
+        """출석/설정 파일의 수정 시각과 크기. 데이터가 바뀌면 이전 결과를 재사용하지 않도록 key에 포함됩니다."""
+        fingerprint = []
+        for path in (DataManager.ATTENDANCE_FILE_PATH, DataManager.SETTINGS_FILE_PATH):
+            try:
+                stat = os.stat(path)
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def submit(self, key, label, file_name, mime, target, suffix="", subscriber=None, prepare=None):
+        """
+        작업을 등록하고 job_id를 반환합니다.
+
+        Args:
+            key (tuple): 요청을 식별하는 값 (예: ('pdf', 'monthly', 2025, 11)). 데이터 fingerprint가 자동으로 추가됩니다.
+            target (callable): target(file_path, progress_callback) 형태로 호출되어 파일을 생성하는 함수.
+            suffix (str): 임시 파일 확장자 (예: '.pdf').
+            subscriber (str): 요청한 세션의 토큰. 같은 세션이 같은 작업을 여러 번 요청해도 구독자 하나로 셉니다.
+                (None이면 호출마다 별도의 구독자)
+            prepare (callable): 새 작업을 만들 때만 호출 스레드에서 한 번 호출되며, 반환값이 target의 첫 번째 인자가 됩니다.
+                (target(prepared, file_path, progress_callback)) 기존 작업을 공유하는 요청에서는 호출되지 않습니다.
+        """
+        key = (key, self.data_fingerprint())
+        subscriber = subscriber if subscriber is not None else uuid.uuid4().hex
+        with self._lock:
+            self._prune()
+            job_id = self._by_key.get(key)
+            job = self._jobs.get(job_id)
+            if job and job.status not in (JOB_FAILED, JOB_CANCELLED):
+                # single-flight: 진행 중이거나 이미 완료된 동일 작업을 공유
+                job.subscribers.add(subscriber)
+                return job.id
+
+            job = ReportJob(key, label, file_name, mime)
+            job.subscribers.add(subscriber)
+            self._jobs[job.id] = job
+            self._by_key[key] = job.id
+
+        if prepare is not None:
+            # 예: 데이터 복사본 생성. 락 밖에서 실행하므로 다른 세션의 요청을 막지 않음
+            try:
+                target = functools.partial(target, prepare())
+            except Exception as e:
+                print(f"[ERROR] Report job {job.id} ({job.label}) failed: {e}")
+                job.error = str(e)
+                with self._lock:
+                    self._finish(job, JOB_FAILED, "Failed")
+                return job.id
+
+        self._executor.submit(self._run, job, target, suffix)
+        return job.id
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id, subscriber=None):
+        """
+        작업 구독을 취소합니다. 마지막 구독자가 취소하면 실제로 작업이 중단됩니다.
+        subscriber가 None이면 모든 구독자를 대신하여 작업을 중단합니다.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job.finished:
+                return
+            if subscriber is None:
+                job.subscribers.clear()
+            else:
+                job.subscribers.discard(subscriber)
+            if not job.subscribers:
+                job._cancel_event.set()
+                if job.status == JOB_QUEUED:
+                    self._finish(job, JOB_CANCELLED, "Cancelled")
+
+    def _run(self, job, target, suffix):
+        if job._cancel_event.is_set():
+            return
+        job.status = JOB_RUNNING
+        job.message = "Started"
+
+        fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix="report_job_")
+        os.close(fd)
+        try:
+            target(temp_path, job.report_progress)
+            with open(temp_path, "rb") as f:
+                job.result = f.read()
+            job.progress = 1.0
+            with self._lock:
+                self._finish(job, JOB_DONE, "Ready to download")
+        except JobCancelled:
+            with self._lock:
+                self._finish(job, JOB_CANCELLED, "Cancelled")
+        except Exception as e:
+            print(f"[ERROR] Report job {job.id} ({job.label}) failed: {e}")
+            job.error = str(e)
+            with self._lock:
+                self._finish(job, JOB_FAILED, "Failed")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _finish(self, job, status, message):
+        job.status = status
+        job.message = message
+        job.finished_at = time.time()
+
+    def _prune(self):
+        """오래된 완료 작업을 정리합니다. (락을 잡은 상태에서 호출)"""
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.finished_at
+        )
+        expired = [job for job in finished if now - job.finished_at > self.result_ttl]
+        overflow = finished[:max(0, len(finished) - self.max_finished_jobs)]
+        for job in expired + overflow:
+            self._jobs.pop(job.id, None)
+            if self._by_key.get(job.key) == job.id:
+                del self._by_key[job.key]
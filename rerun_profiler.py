@@ -0,0 +1,166 @@
+# rerun_profiler.py
+# 프로파일링 모드: Streamlit 스크립트 rerun마다 cProfile + tracemalloc 결과를 폴더에 기록합니다.
+# run_app.py --profile [DIR] 로 켜며 (환경 변수 ATTENDANCE_PROFILE_DIR), 꺼져 있으면 아무 일도 하지 않습니다.
+#
+# rerun 하나당 기록되는 파일:
+#   <시각>-<번호>-<페이지>.prof  : pstats 덤프 (python -m pstats, snakeviz 등으로 열기)
+#   <시각>-<번호>-<페이지>.txt   : 누적/자체 시간 상위 N개 함수 + 메모리 할당 증가 상위 N개 위치
+#   reruns.tsv                  : rerun별 한 줄 요약 (시각, 번호, 페이지, 실행 시간, 최대 메모리, 파일명)
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+PROFILE_DIR_ENV = "ATTENDANCE_PROFILE_DIR"
+PROFILE_TOP_ENV = "ATTENDANCE_PROFILE_TOP"
+PROFILE_MEMORY_ENV = "ATTENDANCE_PROFILE_MEMORY" # "0"이면 tracemalloc 스냅샷 생략
+DEFAULT_TOP = 30
+TRACEMALLOC_FRAMES = 5
+INDEX_FILE = "reruns.tsv"
+
+# 동시에 진행되는 rerun(여러 브라우저 세션)은 하나만 프로파일링합니다.
+# tracemalloc은 프로세스 전체를 추적하고, Python 3.12+의 cProfile은 한 번에 하나만 활성화할 수 있기 때문
+_active_lock = threading.Lock()
+_sequence_lock = threading.Lock()
+_sequence = 0
+
+
+def profile_dir():
+    """프로파일 출력 폴더. 프로파일링 모드가 아니면 None."""
+    return os.environ.get(PROFILE_DIR_ENV) or None
+
+
+def _next_sequence():
+    global _sequence
+    with _sequence_lock:
+        _sequence += 1
+        return _sequence
+
+
+class RerunProfile:
+    """스크립트 rerun 한 번의 프로파일. start() ~ finish() 구간을 측정합니다. (finish는 여러 번 호출해도 안전)"""
+
+    def __init__(self, out_dir=None, top=None, memory=None):
+        self.out_dir = out_dir if out_dir is not None else profile_dir()
+        self.top = top or int(os.environ.get(PROFILE_TOP_ENV) or DEFAULT_TOP)
+        self.memory = memory if memory is not None else os.environ.get(PROFILE_MEMORY_ENV, "1") != "0"
+        self.label = "app"
+        self._profiler = None
+        self._snapshot_before = None
+        self._started = None
+
+    @property
+    def enabled(self):
+        return self.out_dir is not None
+
+    @property
+    def active(self):
+        return self._profiler is not None
+
+    def start(self):
+        if not self.enabled or self.active:
+            return self
+        if not _active_lock.acquire(blocking=False):
+            return self # 다른 세션의 rerun을 프로파일링 중 -> 이번 rerun은 건너뜀
+
+        try:
+            if self.memory:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start(TRACEMALLOC_FRAMES)
+                tracemalloc.reset_peak()
+                self._snapshot_before = tracemalloc.take_snapshot()
+            self._profiler = cProfile.Profile()
+            self._started = time.perf_counter()
+            self._profiler.enable()
+        except Exception as e:
+            print(f"[WARNING] Failed to start rerun profiling: {e}")
+            self._profiler = None
+            _active_lock.release()
+        return self
+
+    def set_label(self, label):
+        """파일명/요약에 쓰일 이름 (예: 실행되는 페이지의 url_path)."""
+        if label:
+            self.label = label
+
+    def finish(self):
+        if not self.active:
+            return
+        profiler, self._profiler = self._profiler, None
+        try:
+            profiler.disable()
+            elapsed_ms = (time.perf_counter() - self._started) * 1000
+            snapshot_after = None
+            peak_bytes = None
+            if self.memory and tracemalloc.is_tracing():
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                snapshot_after = tracemalloc.take_snapshot()
+            self._write(profiler, elapsed_ms, peak_bytes, snapshot_after)
+        except Exception as e:
+            print(f"[WARNING] Failed to write rerun profile: {e}")
+        finally:
+            self._snapshot_before = None
+            _active_lock.release()
+
+    # ------------------ 출력 ------------------
+    def _write(self, profiler, elapsed_ms, peak_bytes, snapshot_after):
+        os.makedirs(self.out_dir, exist_ok=True)
+        now = datetime.now()
+        safe_label = re.sub(r"[^A-Za-z0-9_-]+", "_", self.label).strip("_") or "app"
+        base_name = f"{now:%Y%m%d-%H%M%S}-{_next_sequence():04d}-{safe_label}"
+        base_path = os.path.join(self.out_dir, base_name)
+
+        profiler.dump_stats(base_path + ".prof")
+
+        lines = [
+            f"Rerun:    {self.label}",
+            f"Time:     {now:%Y-%m-%d %H:%M:%S}",
+            f"Duration: {elapsed_ms:.1f} ms",
+        ]
+        if peak_bytes is not None:
+            lines.append(f"Peak traced memory: {peak_bytes / 1024 / 1024:.1f} MiB (process-wide)")
+        lines.append("")
+
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top)
+            lines += [f"===== Top {self.top} functions by {title} =====", stream.getvalue().strip(), ""]
+
+        if snapshot_after is not None and self._snapshot_before is not None:
+            filters = [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+            diff = snapshot_after.filter_traces(filters).compare_to(
+                self._snapshot_before.filter_traces(filters), "lineno"
+            )
+            lines.append(f"===== Top {self.top} allocation changes during the rerun (by line) =====")
+            lines += [str(entry) for entry in diff[:self.top]]
+            lines.append("")
+
+        with open(base_path + ".txt", 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+
+        index_path = os.path.join(self.out_dir, INDEX_FILE)
+        write_header = not os.path.exists(index_path)
+        with open(index_path, 'a', encoding='utf-8') as f:
+            if write_header:
+                f.write("time\tlabel\tduration_ms\tpeak_mib\tfile\n")
+            peak = "" if peak_bytes is None else f"{peak_bytes / 1024 / 1024:.1f}"
+            f.write(f"{now:%Y-%m-%d %H:%M:%S}\t{self.label}\t{elapsed_ms:.1f}\t{peak}\t{base_name}\n")
+
+
+def start_rerun_profile():
+    """
+    이번 스크립트 rerun의 프로파일링을 시작합니다. (app.py 맨 위에서 호출)
+    프로파일링 모드가 아니면 아무것도 하지 않는 RerunProfile을 반환하므로 항상 finish()를 호출하면 됩니다.
+    """
+    return RerunProfile().start()
@@ -1,19 +1,61 @@
 # run_app.py
 
+import argparse
 import subprocess
 import sys
 import os
 
+from rerun_profiler import PROFILE_DIR_ENV, PROFILE_TOP_ENV, PROFILE_MEMORY_ENV, DEFAULT_TOP
+from warmup import READY_FILE_PATH
+
 APP_FILE = 'app.py'
+WARMUP_FILE = 'warmup.py' # 캐시 예열 후 같은 프로세스에서 Streamlit 서버 시작
+DEFAULT_PORT = 8501
+DEFAULT_PROFILE_DIR = 'profiles'
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Launch the attendance Streamlit app.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Server port (default: {DEFAULT_PORT})")
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_PROFILE_DIR, metavar="DIR",
+                        help="Profiling mode: write a cProfile dump + top-N summary for every script rerun "
+                             f"to DIR (default: {DEFAULT_PROFILE_DIR})")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_TOP,
+                        help=f"Number of functions/allocation sites in each summary (default: {DEFAULT_TOP})")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="Profiling mode without tracemalloc snapshots (lower overhead)")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Start Streamlit directly, without pre-warming caches (no ready file)")
+    parser.add_argument("--ready-file", default=READY_FILE_PATH,
+                        help=f"Readiness file written once the warmed-up server is serving (default: {READY_FILE_PATH})")
+    return parser.parse_args(argv)
+
+def run_streamlit_app(args):
+    if args.no_warmup:
+        cmd = [
+            sys.executable,
+            "-m", "streamlit", "run",
+            APP_FILE,
+            "--server.port", str(args.port), 
+            "--browser.gatherUsageStats", "False",
+        ]
+    else:
+        # 데이터/월간 뷰/환율 캐시를 준비한 뒤 서버를 열고, 헬스 체크가 응답하면 ready 파일 기록
+        cmd = [
+            sys.executable,
+            WARMUP_FILE,
+            "--port", str(args.port),
+            "--ready-file", args.ready_file,
+            "--browser.gatherUsageStats", "False",
+        ]
 
-def run_streamlit_app():
-    cmd = [
-        sys.executable,
-        "-m", "streamlit", "run",
-        APP_FILE,
-        "--server.port", "8501", 
-        "--browser.gatherUsageStats", "False",
-    ]
+    # 프로파일링 모드 설정은 환경 변수로 서버 프로세스(app.py -> rerun_profiler)에 전달
+    env = os.environ.copy()
+    if args.profile:
+        profile_dir = os.path.abspath(args.profile)
+        env[PROFILE_DIR_ENV] = profile_dir
+        env[PROFILE_TOP_ENV] = str(args.profile_top)
+        env[PROFILE_MEMORY_ENV] = "0" if args.no_tracemalloc else "1"
+        print(f"Profiling mode: per-rerun profiles will be written to {profile_dir}")
     
     print(f"Executing command: {' '.join(cmd)}")
     
@@ -21,7 +63,7 @@ def run_streamlit_app():
     try:
         # Popen을 사용하여 서브프로세스를 시작합니다.
         # stderr=subprocess.PIPE를 사용하여 오류 출력을 캡처할 수 있습니다.
-        process = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True)
+        process = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True, env=env)
         # 서브프로세스가 완료될 때까지 기다리고(이 경우 Streamlit 서버가 종료될 때까지),
         # 오류가 발생하면 stderr를 확인합니다.
         
@@ -38,4 +80,4 @@ def run_streamlit_app():
 
 
 if __name__ == "__main__":
-    run_streamlit_app()
\ No newline at end of file
+    run_streamlit_app(parse_args())
\ No newline at end of file
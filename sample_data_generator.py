@@ -0,0 +1,164 @@
+# sample_data_generator.py
+# 벤치마크/부하 테스트용 합성 데이터 생성기: N명 x M년 분량의 attendance.xlsx와 settings.json을 만듭니다.
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+from data_manager import DataManager
+
+FIRST_NAMES = ["Ray", "Eza", "Rezy", "Etno", "Alex", "Budi", "Sari", "Dewi", "Agus", "Rina",
+               "Joko", "Putri", "Hana", "Min", "Jun", "Yuna", "Ken", "Mia", "Leo", "Nina"]
+LAST_NAMES = ["Kim", "Lee", "Park", "Choi", "Santoso", "Wijaya", "Pratama", "Halim", "Tan", "Lim"]
+
+# 매년 같은 날짜의 공휴일 (이동 공휴일은 회사 행사일로 대체)
+FIXED_HOLIDAYS = {
+    "01-01": "New Year's Day",
+    "05-01": "Labour Day",
+    "06-01": "Pancasila Day",
+    "08-17": "Independence Day",
+    "12-25": "Christmas Day",
+}
+
+# 평일 근태 구성비 (합계 1.0). 'TIME'은 출근 시각 기록 -> 기준 시간과 비교해 ATT/LATE로 저장
+WEEKDAY_STATUS_MIX = [
+    ("TIME", 0.870),
+    ("ANL", 0.040),
+    ("WO", 0.025),
+    ("HAL", 0.015),
+    ("SIL", 0.015),
+    ("PEL", 0.010),
+    ("SPL", 0.005),
+    ("EVL", 0.005),
+    (None, 0.015), # 기록 없음
+]
+WEEKEND_WORK_RATE = 0.03 # 주말 근무(WO) 비율
+MEMO_RATE = 0.05         # 메모가 있는 날의 비율
+MEMOS = ["Team meeting", "Client visit", "System maintenance", "Quarterly review", "Training day",
+         "Office closed early", "Audit", "Payroll cutoff"]
+
+
+def employee_names(count):
+    """중복 없는 직원명 count개를 만듭니다."""
+    names = [f"{first} {last}" for last in LAST_NAMES for first in FIRST_NAMES]
+    if count <= len(names):
+        return names[:count]
+    return names + [f"Employee {i:04d}" for i in range(len(names), count)]
+
+
+def generate_dataset(employees=20, years=1, start_year=None, attendance_time="09:00", seed=0):
+    """
+    합성 데이터셋을 메모리에 만듭니다.
+
+    Returns:
+        (settings, attendance_data): settings.json 내용(dict)과 DataManager 내부 형식의 출석 데이터
+        ({'YYYY-MM-DD': {직원명 또는 '__MEMO__': 기록}}).
+    """
+    rng = random.Random(seed)
+    start_year = start_year or date.today().year - years + 1
+    names = employee_names(employees)
+    std_h, std_m = map(int, attendance_time.split(':'))
+    std_minutes = std_h * 60 + std_m
+
+    holidays = {}
+    for year in range(start_year, start_year + years):
+        for month_day, name in FIXED_HOLIDAYS.items():
+            holidays[f"{year}-{month_day}"] = name
+
+    statuses = [status for status, _ in WEEKDAY_STATUS_MIX]
+    weights = [weight for _, weight in WEEKDAY_STATUS_MIX]
+
+    attendance_data = {}
+    current = date(start_year, 1, 1)
+    end = date(start_year + years - 1, 12, 31)
+    while current <= end:
+        date_str = current.strftime("%Y-%m-%d")
+        day_map = {}
+        if date_str not in holidays:
+            weekend = current.weekday() >= 5
+            for name in names:
+                if weekend:
+                    if rng.random() < WEEKEND_WORK_RATE:
+                        day_map[name] = "WO"
+                    continue
+
+                status = rng.choices(statuses, weights)[0]
+                if status == "TIME":
+                    # 기준 시간 20분 전후로 몰리는 출근 시각 (일부는 늦게 도착)
+                    minutes = int(rng.gauss(std_minutes - 15, 12))
+                    time_str = f"{minutes // 60}:{minutes % 60:02d}"
+                    day_map[name] = f"{'ATT' if minutes <= std_minutes else 'LATE'}({time_str})"
+                elif status is not None:
+                    day_map[name] = status
+
+        if rng.random() < MEMO_RATE:
+            day_map['__MEMO__'] = rng.choice(MEMOS)
+        if day_map:
+            attendance_data[date_str] = day_map
+        current += timedelta(days=1)
+
+    settings = {
+        'employees': names,
+        'attendance_time': attendance_time,
+        'holidays': holidays,
+        'badges': {f"B{i:05d}": name for i, name in enumerate(names)},
+        'appearance_mode': 'dark',
+        'color_theme': 'blue',
+        'font_size': 12,
+    }
+    return settings, attendance_data
+
+
+def write_dataset(out_dir, employees=20, years=1, start_year=None, attendance_time="09:00", seed=0):
+    """
+    out_dir에 settings.json과 attendance.xlsx를 기록하고 (settings_path, attendance_path)를 반환합니다.
+    attendance.xlsx는 앱과 같은 DataManager.write_attendance_excel로 기록되므로 형식이 동일합니다.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    settings, attendance_data = generate_dataset(employees, years, start_year, attendance_time, seed)
+
+    settings_path = os.path.join(out_dir, os.path.basename(DataManager.SETTINGS_FILE_PATH))
+    attendance_path = os.path.join(out_dir, os.path.basename(DataManager.ATTENDANCE_FILE_PATH))
+
+    with open(settings_path, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=4, ensure_ascii=False)
+
+    original_path = DataManager.ATTENDANCE_FILE_PATH
+    DataManager.ATTENDANCE_FILE_PATH = attendance_path
+    try:
+        DataManager.write_attendance_excel(attendance_data, settings['employees'])
+    finally:
+        DataManager.ATTENDANCE_FILE_PATH = original_path
+
+    return settings_path, attendance_path
+
+
+# ----------------------------------------------------
+# Command-line entry point
+# ----------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic attendance.xlsx + settings.json for N employees over M years."
+    )
+    parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument("--employees", type=int, default=20, help="Number of employees (default: 20)")
+    parser.add_argument("--years", type=int, default=1, help="Number of years (default: 1)")
+    parser.add_argument("--start-year", type=int, help="First year (default: so that the last year is this year)")
+    parser.add_argument("--attendance-time", default="09:00", help="Standard check-in time HH:MM (default: 09:00)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed = same dataset)")
+    args = parser.parse_args(argv)
+
+    settings_path, attendance_path = write_dataset(
+        args.output, args.employees, args.years, args.start_year, args.attendance_time, args.seed
+    )
+    print(f"[INFO] Wrote {settings_path} and {attendance_path} ({args.employees} employees x {args.years} years).",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
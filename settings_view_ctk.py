@@ -29,8 +29,6 @@ class SettingsViewCTK(ctk.CTkFrame):
 
         self.statistics_exporter = statistics_exporter # Store PDF export object
         self.theme_callback = theme_callback # New: Store theme change callback
-
-        print(f"[DEBUG] SettingsViewCTK init - statistics_exporter type: {type(self.statistics_exporter)}")
         
         # 2-column layout settings
         self.grid_columnconfigure(0, weight=0) # Left Panel (Time/Buttons) fixed
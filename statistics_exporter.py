@@ -1,10 +1,11 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib
 import os
 from datetime import datetime, date
 import calendar as pycal 
 import io
+import itertools
+
+from perf_metrics import timed
 
 # ReportLab PDF 생성을 위한 라이브러리 유지
 from reportlab.lib.pagesizes import A4, landscape 
@@ -13,6 +14,10 @@ from reportlab.lib import colors
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfbase.pdfmetrics import registerFont, registerFontFamily
 from reportlab.pdfbase.ttfonts import TTFont
+# 벡터 차트 (matplotlib 래스터 이미지 대신 PDF 벡터로 직접 출력)
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
 
 # ⭐⭐ 핵심 수정: 이 줄을 추가해야 합니다. ⭐⭐
 import pathlib
@@ -20,11 +25,10 @@ import pathlib
 import xlsxwriter 
 
 # ----------------------------------------------------
-# ⭐ 폰트 및 Matplotlib 설정 (PDF 보고서 한글 지원을 위해 유지) ⭐
+# ⭐ 폰트 설정 (PDF 보고서 한글 지원을 위해 유지) ⭐
 # 웹 서버 환경에 따라 FONT_PATH는 다를 수 있습니다. (배포 시 서버에 폰트 파일 포함 필수)
-matplotlib.use("Agg")  # GUI 백엔드 비활성화
-matplotlib.rc('font', family='Malgun Gothic') 
-matplotlib.rcParams['axes.unicode_minus'] = False
+# Matplotlib은 래스터 차트(create_attendance_chart)를 처음 만들 때 _load_matplotlib()에서 로드/설정합니다.
+# (기본 벡터 PDF 경로는 ReportLab만 사용)
 
 # 웹 환경에서는 폰트 경로를 상대 경로로 관리하는 것이 좋습니다.
 # 여기서는 윈도우 경로를 유지하되, 경고 처리 추가
@@ -54,8 +58,28 @@ STATUS_COLORS = {
     "PEL": "#FFC107", "ANL": "#00BCD4", "HAL": "#8BC34A", 
     "SIL": "#9C27B0", "SPL": "#FF5722", "EVL": "#607D8B"
 }
+
+# PDF 레이아웃 상수 (대규모 직원 목록 대응)
+PDF_TABLE_CHUNK_ROWS = 35      # 요약 테이블 하나당 최대 직원 수 (가로 A4 한 페이지 분량)
+PDF_LARGE_ROSTER = 40          # 이 인원을 넘으면 직원별 요약을 문단 대신 표로 출력
+PDF_CHART_GROUP_SIZE = 20      # 차트 하나에 표시할 최대 직원 수 (small multiples)
 # ----------------------------------------------------
 
+_matplotlib_ready = False
+
+def _load_matplotlib():
+    """Matplotlib을 (처음 한 번만) 임포트/설정하고 (Figure 클래스, font_manager 모듈)을 반환합니다."""
+    global _matplotlib_ready
+    import matplotlib
+    from matplotlib import font_manager
+    from matplotlib.figure import Figure
+    if not _matplotlib_ready:
+        matplotlib.use("Agg")  # GUI 백엔드 비활성화
+        matplotlib.rc('font', family='Malgun Gothic') 
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        _matplotlib_ready = True
+    return Figure, font_manager
+
 class StatisticsExporter:
     """통계 데이터 내보내기 (PDF, Excel) 로직을 전담합니다."""
     
@@ -63,6 +87,13 @@ class StatisticsExporter:
         # DataManager 객체를 주입받아 통계 데이터를 계산합니다.
         self.data_manager = data_manager
 
+    @staticmethod
+    def _report_progress(progress_callback, fraction, message=""):
+        """진행률 콜백이 지정된 경우 (0.0 ~ 1.0, 메시지)를 전달합니다. (백그라운드 작업 취소 시 콜백이 예외를 발생시킴)"""
+        if progress_callback:
+            progress_callback(fraction, message)
+
+    @timed("exporter.get_df_for_period")
     def _get_df_for_period(self, report_type, year, month=None):
         """지정된 기간의 통계 데이터프레임을 DataManager로부터 가져옵니다."""
         
@@ -94,23 +125,28 @@ class StatisticsExporter:
         
         return df, title, start_date, end_date
 
+    @timed("exporter.create_attendance_chart")
     def create_attendance_chart(self, df, chart_title, figsize=(10, 5)):
         """
         [GUI 독립] 통계 데이터프레임으로 Matplotlib 막대 그래프를 생성하고 Figure 객체를 반환합니다.
         (기존 attendance_statistics_ctk.py의 _plot_chart 메서드 로직)
+        pyplot 전역 상태를 쓰지 않고 Figure를 직접 만들므로 작업 스레드에서 호출해도 안전합니다.
         """
+        Figure, font_manager = _load_matplotlib()
         
         if df.empty or 'Employee' not in df.columns:
             # 빈 Figure 반환
-            fig, ax = plt.subplots(figsize=figsize)
+            fig = Figure(figsize=figsize)
+            ax = fig.subplots()
             ax.text(0.5, 0.5, "No data available", ha='center', va='center', fontsize=12)
             return fig
             
         # Employee 컬럼을 제외한 통계 컬럼만 선택
         plot_cols = [col for col in ALL_STATUS_COLS if col in df.columns]
 
-        # Matplotlib Figure 생성
-        fig, ax = plt.subplots(figsize=figsize)
+        # Matplotlib Figure 생성 (pyplot 미사용 - 스레드 안전)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
         
         # 바 차트 생성 (stacked=True 제거됨, 막대 카운트 표시 로직 추가됨)
         # 웹 환경에서는 Dark Mode 컬러 대신 기본 Plotly를 사용할 수 있지만, 
@@ -120,7 +156,7 @@ class StatisticsExporter:
         df_plot.plot(kind='bar', stacked=False, ax=ax, color=[STATUS_COLORS.get(col, '#CCCCCC') for col in plot_cols])
 
         # 그래프 제목 및 축 라벨 설정
-        ax.set_title(chart_title, color='black', fontsize=12, fontweight='bold', fontproperties=matplotlib.font_manager.FontProperties(fname=FONT_PATH))
+        ax.set_title(chart_title, color='black', fontsize=12, fontweight='bold', fontproperties=font_manager.FontProperties(fname=FONT_PATH))
         ax.set_xlabel("Employee", color='black')
         ax.set_ylabel("Count", color='black')
 
@@ -143,13 +179,99 @@ class StatisticsExporter:
         max_val = df_plot.sum(axis=1).max()
         ax.set_ylim(0, max_val * 1.2 if max_val > 0 else 10) 
 
-        plt.tight_layout()
+        fig.tight_layout()
         
         return fig # Figure 객체 반환
 
-    def generate_pdf_summary(self, file_path, report_type, year, month=None):
-        """월별 또는 년별 통계 리포트를 PDF로 내보냅니다. (파일 경로는 필수 인자)"""
+    @timed("exporter.create_vector_chart")
+    def create_vector_chart(self, df, chart_title, width=720, height=400):
+        """
+        [GUI 독립] 통계 데이터프레임으로 ReportLab 벡터 막대 그래프(Drawing)를 생성합니다.
+        create_attendance_chart와 같은 데이터/색상(STATUS_COLORS)을 사용하며, PDF에 벡터로 그대로 삽입됩니다.
+        """
+        drawing = Drawing(width, height)
+        drawing.add(String(width / 2, height - 16, chart_title, fontName=KOREAN_FONT,
+                           fontSize=12, textAnchor='middle'))
+
+        if df.empty or 'Employee' not in df.columns:
+            drawing.add(String(width / 2, height / 2, "No data available", fontName=KOREAN_FONT,
+                               fontSize=12, textAnchor='middle'))
+            return drawing
+
+        plot_cols = [col for col in ALL_STATUS_COLS if col in df.columns]
+
+        chart = VerticalBarChart()
+        chart.x = 40
+        chart.y = 40
+        chart.width = width - 140 # 우측 범례 공간 확보
+        chart.height = height - 80
+
+        # 상태별 시리즈 (막대 그룹 = 직원)
+        chart.data = [[int(v) for v in df[col].tolist()] for col in plot_cols]
+        chart.categoryAxis.categoryNames = [str(emp) for emp in df['Employee'].tolist()]
+        chart.categoryAxis.labels.fontName = KOREAN_FONT
+        chart.categoryAxis.labels.fontSize = 8
+        chart.valueAxis.labels.fontName = KOREAN_FONT
+        chart.valueAxis.labels.fontSize = 9
+
+        # y축의 범위 조정 (matplotlib 차트와 동일)
+        max_val = df[plot_cols].sum(axis=1).max()
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueMax = max_val * 1.2 if max_val > 0 else 10
+
+        for i, col in enumerate(plot_cols):
+            chart.bars[i].fillColor = colors.HexColor(STATUS_COLORS.get(col, '#CCCCCC'))
+            chart.bars[i].strokeColor = colors.black # WO(흰색) 막대도 보이도록 외곽선 표시
+            chart.bars[i].strokeWidth = 0.25
+
+        # 막대 상단에 숫자 카운터 표시 (0은 생략)
+        chart.barLabelFormat = lambda v: str(int(v)) if v else ''
+        chart.barLabels.fontName = KOREAN_FONT
+        chart.barLabels.fontSize = 6
+        chart.barLabels.nudge = 5
+        drawing.add(chart)
+
+        # 범례
+        legend = Legend()
+        legend.x = width - 90
+        legend.y = height - 40
+        legend.fontName = KOREAN_FONT
+        legend.fontSize = 7
+        legend.alignment = 'right'
+        legend.columnMaximum = len(plot_cols)
+        legend.colorNamePairs = [(colors.HexColor(STATUS_COLORS.get(col, '#CCCCCC')), col) for col in plot_cols]
+        drawing.add(legend)
+
+        return drawing
+
+    def _chart_flowable(self, df, chart_title, vector_chart, width, height):
+        """PDF에 삽입할 차트 Flowable(벡터 Drawing 또는 Matplotlib PNG Image)을 생성합니다."""
+        if vector_chart:
+            # ReportLab 벡터 차트 (Matplotlib 렌더링 없음)
+            chart_image = self.create_vector_chart(df, chart_title, width=width, height=height)
+        else:
+            # Matplotlib 차트 생성 및 메모리(BytesIO)에 저장
+            fig = self.create_attendance_chart(df, chart_title, figsize=(width / 72, height / 72))
+            
+            img_data = io.BytesIO()
+            fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
+            img_data.seek(0)
+            chart_image = Image(img_data, width=width, height=height)
+        chart_image.hAlign = 'CENTER'
+        return chart_image
+
+    @timed("exporter.generate_pdf_summary")
+    def generate_pdf_summary(self, file_path, report_type, year, month=None, vector_chart=True, chart_top_n=None,
+                             progress_callback=None):
+        """월별 또는 년별 통계 리포트를 PDF로 내보냅니다. (파일 경로는 필수 인자)
+
+        vector_chart=True(기본값)이면 ReportLab 벡터 차트를, False이면 기존 Matplotlib PNG 차트를 삽입합니다.
+        직원 수가 많으면 요약 테이블은 헤더가 반복되는 여러 개의 표로, 차트는 PDF_CHART_GROUP_SIZE명 단위의
+        small multiples로 나누어 출력합니다. chart_top_n을 지정하면 기록 일수 상위 N명만 차트로 그립니다.
+        progress_callback(fraction, message)을 지정하면 단계별 진행률을 전달합니다.
+        """
         
+        self._report_progress(progress_callback, 0.0, "Calculating statistics")
         df, title_ko, _, _ = self._get_df_for_period(report_type, year, month)
         
         if df.empty:
@@ -163,15 +285,6 @@ class StatisticsExporter:
         else:
             title_en = f"Attendance Report - All Time"
 
-        # 1. Matplotlib 차트 생성 및 메모리(BytesIO)에 저장
-        # PDF 인쇄를 위해 figsize 조정
-        fig = self.create_attendance_chart(df.copy(), title_en, figsize=(10, 5)) 
-        
-        img_data = io.BytesIO()
-        fig.savefig(img_data, format='png', bbox_inches='tight', dpi=150)
-        img_data.seek(0)
-        plt.close(fig) # Figure 닫기
-        
         # 2. ReportLab PDF 문서 생성
         doc = SimpleDocTemplate(file_path, pagesize=landscape(A4),
                                  leftMargin=30, rightMargin=30, 
@@ -189,24 +302,18 @@ class StatisticsExporter:
         )
         
         # 3. PDF 요소 구성
+        self._report_progress(progress_callback, 0.1, "Building tables")
         elements = []
+        avail_width = doc.width
         
         # 제목
         elements.append(Paragraph(f"<b>{title_en}</b>", heading_style))
         elements.append(Spacer(1, 12))
         
         # 데이터 요약 테이블
-        summary_df = df.copy()
-        data_cols_order = ALL_STATUS_COLS
-        data_cols = [col for col in data_cols_order if col in summary_df.columns]
-        data = [["Employee"] + data_cols] 
-        
-        for index, row in summary_df.iterrows():
-            row_data = [row['Employee']]
-            for col in data_cols:
-                count = int(row.get(col, 0))
-                row_data.append(str(count) if count > 0 else '-')
-            data.append(row_data)
+        data_cols = [col for col in ALL_STATUS_COLS if col in df.columns]
+        employees = df['Employee'].astype(str).tolist()
+        counts = df[data_cols].fillna(0).astype(int).to_numpy()
 
         # ReportLab Table 스타일 (다크 모드 색상은 제거하고 밝은 색상 유지)
         table_style = TableStyle([
@@ -221,93 +328,231 @@ class StatisticsExporter:
             ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
         ])
 
-        col_widths = [120] + [60] * len(data_cols)
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(table_style)
+        # 열 너비를 용지 폭에 맞게 계산 (기존 120/60 고정 폭은 최대값으로 유지)
+        status_col_width = min(60, (avail_width - 120) / max(len(data_cols), 1))
+        col_widths = [120] + [status_col_width] * len(data_cols)
+        header = ["Employee"] + data_cols
         
         elements.append(Paragraph(f"<b>Summary ({len(df)} Employees)</b>", data_header_style)) 
         elements.append(Spacer(1, 6))
-        elements.append(table)
-        elements.append(Spacer(1, 12)) 
+
+        # 큰 표 하나를 페이지마다 분할하면 분할 비용이 누적되므로, 페이지 분량씩 잘라 여러 표로 출력합니다.
+        # (repeatRows=1: 표가 페이지를 넘어가도 헤더 반복)
+        for start in range(0, len(employees), PDF_TABLE_CHUNK_ROWS):
+            data = [header]
+            for emp, row_counts in zip(employees[start:start + PDF_TABLE_CHUNK_ROWS],
+                                       counts[start:start + PDF_TABLE_CHUNK_ROWS]):
+                data.append([emp] + [str(c) if c > 0 else '-' for c in row_counts])
+            table = Table(data, colWidths=col_widths, repeatRows=1)
+            table.setStyle(table_style)
+            elements.append(table)
+            elements.append(Spacer(1, 6))
+        elements.append(Spacer(1, 6)) 
         
         # 직원별 상세 요약 생성 로직 (영문으로 변경된 로직 유지)
         elements.append(Paragraph(f"<b>Per-Employee Detailed Summary</b>", data_header_style))
         elements.append(Spacer(1, 6))
 
-        for index, row in summary_df.iterrows():
-            employee_name = row['Employee']
-            existing_cols = [col for col in ALL_STATUS_COLS if col in summary_df.columns]
-            total_days = row[existing_cols].sum()
-            att_count = row.get('ATT', 0)
-            late_count = row.get('LATE', 0)
-            wo_count = row.get('WO', 0)
-            total_leave_count = row[[col for col in LEAVE_COLS if col in summary_df.columns]].sum()
-            
-            if total_days > 0:
-                att_rate = (att_count / total_days) * 100
-                late_rate = (late_count / total_days) * 100 
-            else:
-                att_rate = 0
-                late_rate = 0
-                
-            summary_text = (
-                f"<b>{employee_name}:</b> "
-                f"Attendance Rate <b>{att_rate:.1f}%</b>, "
-                f"Lateness <b>{int(late_count)} times</b>, "
-                f"Work Outside <b>{int(wo_count)} times</b>, "
-                f"Total Leave ({len(LEAVE_COLS)} types) <b>{int(total_leave_count)} days</b>."
-            )
-            elements.append(Paragraph(summary_text, summary_body_style))
+        leave_idx = [data_cols.index(col) for col in LEAVE_COLS if col in data_cols]
+        summary_rows = []
+        for emp, row_counts in zip(employees, counts):
+            total_days = int(row_counts.sum())
+            att_count = int(row_counts[data_cols.index('ATT')]) if 'ATT' in data_cols else 0
+            late_count = int(row_counts[data_cols.index('LATE')]) if 'LATE' in data_cols else 0
+            wo_count = int(row_counts[data_cols.index('WO')]) if 'WO' in data_cols else 0
+            total_leave_count = int(row_counts[leave_idx].sum()) if leave_idx else 0
+            att_rate = (att_count / total_days) * 100 if total_days > 0 else 0
+            summary_rows.append((emp, att_rate, late_count, wo_count, total_leave_count))
+
+        if len(summary_rows) <= PDF_LARGE_ROSTER:
+            for emp, att_rate, late_count, wo_count, total_leave_count in summary_rows:
+                summary_text = (
+                    f"<b>{emp}:</b> "
+                    f"Attendance Rate <b>{att_rate:.1f}%</b>, "
+                    f"Lateness <b>{late_count} times</b>, "
+                    f"Work Outside <b>{wo_count} times</b>, "
+                    f"Total Leave ({len(LEAVE_COLS)} types) <b>{total_leave_count} days</b>."
+                )
+                elements.append(Paragraph(summary_text, summary_body_style))
+        else:
+            # 대규모 직원 목록: 직원마다 문단을 만드는 대신 페이지 분량씩 나눈 표로 출력
+            detail_header = ["Employee", "Attendance Rate", "Lateness", "Work Outside",
+                             f"Total Leave ({len(LEAVE_COLS)} types)"]
+            detail_widths = [120] + [(avail_width - 120) / 4 * 0.6] * 4
+            for start in range(0, len(summary_rows), PDF_TABLE_CHUNK_ROWS):
+                data = [detail_header]
+                for emp, att_rate, late_count, wo_count, total_leave_count in summary_rows[start:start + PDF_TABLE_CHUNK_ROWS]:
+                    data.append([emp, f"{att_rate:.1f}%", late_count, wo_count, total_leave_count])
+                table = Table(data, colWidths=detail_widths, repeatRows=1)
+                table.setStyle(table_style)
+                elements.append(table)
+                elements.append(Spacer(1, 6))
 
         elements.append(Spacer(1, 24))
         
-        # 차트 이미지
+        # 차트 (직원 수가 많으면 그룹별 small multiples, chart_top_n 지정 시 상위 N명)
         chart_width = 720 # 가로 용지에 맞춤
         chart_height = 400 
         elements.append(Paragraph("<b>Per-Employee Attendance Chart</b>", heading_style)) 
         elements.append(Spacer(1, 12))
+
+        self._report_progress(progress_callback, 0.3, "Drawing charts")
+        chart_df = df
+        if chart_top_n:
+            chart_df = df.assign(_total=df[data_cols].sum(axis=1)) \
+                         .nlargest(chart_top_n, '_total').drop(columns='_total')
+            title_en = f"{title_en} (Top {len(chart_df)} by recorded days)"
+
+        if len(chart_df) <= PDF_CHART_GROUP_SIZE:
+            elements.append(self._chart_flowable(chart_df.copy(), title_en, vector_chart, chart_width, chart_height))
+        else:
+            group_height = chart_height * 0.6 # 페이지당 차트 2개
+            for start in range(0, len(chart_df), PDF_CHART_GROUP_SIZE):
+                group_df = chart_df.iloc[start:start + PDF_CHART_GROUP_SIZE]
+                group_title = f"{title_en} ({start + 1}-{start + len(group_df)} of {len(chart_df)})"
+                elements.append(self._chart_flowable(group_df.copy(), group_title, vector_chart, chart_width, group_height))
+                elements.append(Spacer(1, 12))
         
-        chart_image = Image(img_data, width=chart_width, height=chart_height)
-        chart_image.hAlign = 'CENTER'
-        elements.append(chart_image)
-        
-        # 4. PDF 빌드
+        # 4. PDF 빌드 (레이아웃 진행률을 0.4 ~ 1.0 구간으로 전달)
+        if progress_callback:
+            total_flowables = [len(elements)]
+            def on_build_progress(typ, value):
+                if typ == 'SIZE_EST':
+                    total_flowables[0] = max(value, 1)
+                elif typ == 'PROGRESS':
+                    self._report_progress(progress_callback, 0.4 + 0.6 * value / total_flowables[0], "Laying out pages")
+            doc.setProgressCallBack(on_build_progress)
         doc.build(elements)
+        self._report_progress(progress_callback, 1.0, "Done")
             
-    def export_excel_report(self, file_path, report_type, year, month=None):
+    @timed("exporter.export_excel_report")
+    def export_excel_report(self, file_path, report_type, year, month=None, progress_callback=None):
         """[GUI 독립] 통계 데이터와 차트를 Excel 파일로 내보냅니다. (파일 경로는 필수 인자)"""
         
+        self._report_progress(progress_callback, 0.0, "Calculating statistics")
         df, title_ko, _, _ = self._get_df_for_period(report_type, year, month)
         
         if df.empty:
             raise Exception(f"No data to export for the period: {title_ko}.")
 
+        self._report_progress(progress_callback, 0.5, "Writing workbook")
         try:
-            # 1. Matplotlib 그림을 임시 파일로 저장
-            fig = self.create_attendance_chart(df.copy(), title_ko, figsize=(8, 5))
-            img_path = 'temp_chart.png'
-            fig.savefig(img_path)
-            plt.close(fig) 
-
-            # 2. ExcelWriter를 xlsxwriter 엔진으로 생성 및 데이터 저장
+            # 1. ExcelWriter를 xlsxwriter 엔진으로 생성 및 데이터 저장
             writer = pd.ExcelWriter(file_path, engine='xlsxwriter')
             sheet_name = 'Attendance Stats'
             df.to_excel(writer, sheet_name=sheet_name, index=False)
             workbook = writer.book
             worksheet = writer.sheets[sheet_name]
 
-            # 3. 엑셀 시트에 이미지 삽입 (G2 셀에 삽입)
-            worksheet.insert_image('G2', img_path) 
+            # 2. 서식: 헤더 강조 및 열 너비 조정
+            header_format = workbook.add_format({
+                'bold': True, 'font_color': 'white', 'bg_color': '#4FC3F7',
+                'align': 'center', 'border': 1
+            })
+            for col_idx, col_name in enumerate(df.columns):
+                worksheet.write(0, col_idx, col_name, header_format)
+            worksheet.set_column(0, 0, 20)
+            worksheet.set_column(1, len(df.columns) - 1, 8)
+            worksheet.freeze_panes(1, 1)
+
+            # 3. xlsxwriter 네이티브 차트 생성 (통계 표의 셀을 직접 참조하므로 Excel에서 편집 가능)
+            last_row = len(df)
+            chart = workbook.add_chart({'type': 'column'})
+            for col_idx, col_name in enumerate(df.columns):
+                if col_name not in ALL_STATUS_COLS:
+                    continue
+                color = STATUS_COLORS.get(col_name, '#CCCCCC')
+                chart.add_series({
+                    'name': [sheet_name, 0, col_idx],
+                    'categories': [sheet_name, 1, 0, last_row, 0],
+                    'values': [sheet_name, 1, col_idx, last_row, col_idx],
+                    'fill': {'color': color},
+                    'border': {'color': 'black', 'width': 0.25},
+                })
+            chart.set_title({'name': title_ko})
+            chart.set_x_axis({'name': 'Employee'})
+            chart.set_y_axis({'name': 'Count', 'min': 0})
+            chart.set_legend({'position': 'right'})
+            chart.set_size({'width': 720, 'height': 400})
+
+            # 4. 차트를 통계 표 오른쪽에 삽입 (표와 겹치지 않도록 한 열 띄움)
+            worksheet.insert_chart(1, len(df.columns) + 1, chart)
 
-            # 4. ExcelWriter 닫기 (파일 저장)
+            # 5. ExcelWriter 닫기 (파일 저장)
             writer.close()
             
-            # 5. 임시 이미지 파일 삭제
-            os.remove(img_path)
-            
         except Exception as e:
-            if os.path.exists('temp_chart.png'):
-                os.remove('temp_chart.png')
-
             raise Exception(f"Excel export error: {e}")
 
+        # try 밖에서 호출: 취소(JobCancelled)가 Excel 오류로 감싸지지 않도록
+        self._report_progress(progress_callback, 1.0, "Done")
+
+    @timed("exporter.export_detail_excel")
+    def export_detail_excel(self, file_path, start_date=None, end_date=None, progress_callback=None):
+        """
+        [GUI 독립] 날짜 × 직원 일별 원본 기록(메모 포함)을 Excel 파일로 내보냅니다. (감사용)
+        xlsxwriter의 constant_memory 모드로 행을 순서대로 스트리밍하므로, 기간이 길어도
+        전체 데이터를 DataFrame으로 만들지 않습니다. 상태 색상은 조건부 서식으로 적용됩니다.
+        """
+        employees = self.data_manager.get_employee_list()
+        if not employees:
+            raise Exception("No employees registered. Please check the settings.")
+
+        # 기간은 한 번만 해석 (문자열 'YYYY-MM-DD'도 진행률 계산에 사용)
+        if isinstance(start_date, str):
+            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+        if isinstance(end_date, str):
+            end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+
+        # 첫 행을 미리 꺼내 보고, 내보낼 날짜가 없으면 파일을 만들기 전에 중단
+        records = self.data_manager.iter_daily_records(start_date, end_date)
+        first_record = next(records, None)
+        if first_record is None:
+            raise Exception("No attendance records to export.")
+        first_day = first_record[0]
+        total_days = (end_date - first_day).days + 1 if end_date is not None else None
+
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+        try:
+            sheet_name = 'Daily Detail'
+            worksheet = workbook.add_worksheet(sheet_name)
+
+            header_format = workbook.add_format({
+                'bold': True, 'font_color': 'white', 'bg_color': '#4FC3F7',
+                'align': 'center', 'border': 1
+            })
+            headers = ["Date", "Weekday"] + employees + ["MEMO"]
+            worksheet.set_column(0, 0, 12)
+            worksheet.set_column(1, 1, 9)
+            worksheet.set_column(2, len(employees) + 1, 14)
+            worksheet.set_column(len(employees) + 2, len(employees) + 2, 40)
+            worksheet.freeze_panes(1, 2)
+            worksheet.write_row(0, 0, headers, header_format)
+
+            # 상태 색상: 셀마다 서식을 지정하지 않고 직원 열 전체에 조건부 서식을 한 번만 등록
+            # (행 수를 모르므로 Excel 최대 행까지 적용)
+            first_emp_col = 2
+            last_emp_col = len(employees) + 1
+            for status in ALL_STATUS_COLS:
+                status_format = workbook.add_format({'bg_color': STATUS_COLORS.get(status, '#CCCCCC')})
+                worksheet.conditional_format(1, first_emp_col, 1048575, last_emp_col, {
+                    'type': 'text',
+                    'criteria': 'begins with',
+                    'value': status,
+                    'format': status_format,
+                })
+
+            # constant_memory 모드에서는 반드시 행 순서대로 기록해야 합니다.
+            row_idx = 1
+            for day, day_map in itertools.chain([first_record], records):
+                if total_days and row_idx % 100 == 0:
+                    self._report_progress(progress_callback, row_idx / total_days, "Writing daily rows")
+                row = [day.strftime("%Y-%m-%d"), day.strftime("%a")]
+                row += [day_map.get(emp, "") for emp in employees]
+                row.append(day_map.get('__MEMO__', ""))
+                worksheet.write_row(row_idx, 0, row)
+                row_idx += 1
+        finally:
+            workbook.close()
+
+        self._report_progress(progress_callback, 1.0, "Done")
@@ -0,0 +1,178 @@
+# warmup.py
+# 캐시 예열 후 같은 프로세스에서 Streamlit 서버를 시작합니다. (run_app.py가 실행)
+#
+# 서버가 포트를 열기 전에 무거운 모듈 임포트, 출석 데이터 로드/재계산(공용 스토어 스냅샷),
+# 이번 달 월간 뷰 모델, 환율 캐시를 미리 준비하므로 재시작 직후 첫 방문자도 평소와 같은 속도로 페이지를 엽니다.
+# 준비 여부: Streamlit 헬스 체크(/_stcore/health)가 응답한 뒤 ready 파일(JSON)을 기록하고, 종료 시 삭제합니다.
+#
+#   python warmup.py --port 8501 --ready-file app_ready.json [추가 streamlit 옵션...]
+
+import argparse
+import atexit
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from datetime import date, datetime
+
+from perf_metrics import timed
+
+APP_FILE = 'app.py'
+DEFAULT_PORT = 8501
+READY_FILE_PATH = 'app_ready.json'
+HEALTH_PATH = '/_stcore/health'
+READY_TIMEOUT = 120       # 서버 시작 대기 최대 시간 (초)
+READY_POLL_INTERVAL = 0.2
+
+# 페이지에서만 로드되는 무거운 모듈 (matplotlib, reportlab, openpyxl, requests 등)
+WARM_IMPORTS = [
+    "calendar_component",
+    "statistics_exporter",
+    "matplotlib.pyplot", # statistics_exporter는 matplotlib을 지연 로드하지만, 통계 페이지는 항상 차트를 그림 (st.pyplot)
+    "bulk_exporter",
+    "report_jobs",
+    "punch_importer",
+    "exchange_rate_cache",
+]
+
+
+def _import_modules():
+    for name in WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"[WARNING] Warm-up import of {name} failed: {e}")
+
+
+def _load_data_store(state):
+    from data_manager import DataManager
+    # Excel 파싱 + 기준 시간 재계산 후 공용 스토어 스냅샷 등록 (새 세션은 이 복사본으로 시작)
+    state['dm'] = DataManager()
+
+
+def _build_month_views(state, today):
+    dm = state.get('dm')
+    if dm is None:
+        return
+    # 첫 화면(이번 달)과 가장 자주 여는 지난달의 달력 뷰 모델
+    previous = (today.year - 1, 12) if today.month == 1 else (today.year, today.month - 1)
+    dm.prefetch_month_views([(today.year, today.month), previous])
+    dm.publish_snapshot()
+
+
+def _prime_exchange_rates():
+    from exchange_rate_cache import get_shared_cache
+    cache = get_shared_cache()
+    cache.get(wait_if_empty=True)
+    # 디스크 스냅샷이 오래되었으면 (get이 시작한) 백그라운드 갱신이 끝날 때까지 기다림
+    thread = cache.refresh_async() if cache.is_stale() else None
+    if thread is not None:
+        thread.join(cache.timeout + 1)
+
+
+def warm_up(today=None):
+    """
+    서버 시작 전 예열 단계를 차례로 실행하고 {단계: 소요 시간(ms)}을 반환합니다.
+    단계가 실패해도 서버 시작은 계속됩니다. (해당 캐시는 첫 사용 시 평소처럼 채워짐)
+    """
+    today = today or date.today()
+    state = {}
+    steps = [
+        ("imports", _import_modules),
+        ("data_store", lambda: _load_data_store(state)),
+        ("month_views", lambda: _build_month_views(state, today)),
+        ("exchange_rates", _prime_exchange_rates),
+    ]
+
+    timings = {}
+    for name, func in steps:
+        start = time.perf_counter()
+        try:
+            with timed(f"warmup.{name}"):
+                func()
+        except Exception as e:
+            print(f"[WARNING] Warm-up step '{name}' failed: {e}")
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        print(f"[INFO] Warm-up {name}: {timings[name]:.0f} ms")
+    return timings
+
+
+# ----------------------------------------------------
+# Readiness file
+# ----------------------------------------------------
+
+def _remove_ready_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"[WARNING] Failed to remove ready file {path}: {e}")
+
+
+def wait_until_ready(port, ready_file, warmup_timings, timeout=READY_TIMEOUT):
+    """헬스 체크가 'ok'를 반환할 때까지 기다린 뒤 ready 파일을 기록합니다. (백그라운드 스레드용)"""
+    url = f"http://127.0.0.1:{port}{HEALTH_PATH}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    break
+        except OSError:
+            pass
+        time.sleep(READY_POLL_INTERVAL)
+    else:
+        print(f"[WARNING] Server did not answer {url} within {timeout} s; ready file not written.")
+        return False
+
+    info = {
+        "status": "ready",
+        "pid": os.getpid(),
+        "port": port,
+        "url": f"http://localhost:{port}",
+        "health_url": url,
+        "ready_at": datetime.now().isoformat(timespec="seconds"),
+        "warmup_ms": warmup_timings,
+    }
+    # 임시 파일에 쓴 뒤 교체하여, 읽는 쪽이 절반만 기록된 파일을 보지 않도록 함
+    temp_path = ready_file + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+    os.replace(temp_path, ready_file)
+    print(f"[INFO] Server ready: {info['url']} (ready file: {ready_file})")
+    return True
+
+
+# ----------------------------------------------------
+# Command-line entry point
+# ----------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up caches, then run the Streamlit app in this process.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Server port (default: {DEFAULT_PORT})")
+    parser.add_argument("--ready-file", default=READY_FILE_PATH,
+                        help=f"Written once the server answers its health check (default: {READY_FILE_PATH})")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    ready_file = os.path.abspath(args.ready_file)
+    _remove_ready_file(ready_file) # 이전 실행이 남긴 파일은 '준비됨'으로 오인될 수 있음
+    atexit.register(_remove_ready_file, ready_file)
+
+    timings = warm_up()
+
+    threading.Thread(
+        target=wait_until_ready, args=(args.port, ready_file, timings), name="ready-file", daemon=True
+    ).start()
+
+    # python -m streamlit run ... 과 같지만 예열된 모듈/캐시가 있는 이 프로세스에서 실행
+    from streamlit.web import cli as stcli
+    sys.argv = ["streamlit", "run", APP_FILE, "--server.port", str(args.port), *streamlit_args]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
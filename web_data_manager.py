@@ -12,6 +12,8 @@ import gspread
 from gspread_dataframe import set_with_dataframe, get_as_dataframe
 from oauth2client.service_account import ServiceAccountCredentials
 
+from perf_metrics import timed
+
 SETTINGS_FILE = 'settings.json'
 
 
@@ -44,6 +46,7 @@ class DataManager:
             self.recalculate_all_attendance(standard_time_from_settings)
 
 # ⭐ Sheets 클라이언트 연결 메서드 ⭐
+    @timed("sheets.authorize")
     def _get_gsheet_client(self):
         # 1. secrets에서 받은 JSON 문자열을 파이썬 딕셔너리로 변환
         #    GSHEETS_CREDENTIALS는 st.secrets에서 로드된 JSON 문자열입니다.
@@ -90,6 +93,7 @@ class DataManager:
         except ValueError:
             return old_status_str # 시간 포맷 오류 시 원본 반환
 
+    @timed("sheets.recalculate")
     def recalculate_all_attendance(self, new_standard_time: str):
         """
         출근 기준 시간이 변경되었을 때, 기존의 모든 ATT/LATE 기록을 새 기준에 맞게 재계산합니다.
@@ -119,6 +123,7 @@ class DataManager:
     # -------------------------------
     # 설정 로드 / 저장
 # -------------------------------
+    @timed("sheets.load_settings")
     def _load_settings(self):
         try:
             if os.path.exists(SETTINGS_FILE):
@@ -130,6 +135,7 @@ class DataManager:
         except Exception:
             return {"attendance_time": "8:30", "employees": [], "holidays": {}}
 
+    @timed("sheets.save_settings")
     def _save_settings(self):
         try:
             with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
@@ -144,6 +150,7 @@ class DataManager:
         """
         return self.settings.get('holidays', {}).get(date_str)
 
+    @timed("sheets.load_attendance")
     def _load_attendance_data(self):
         """Google Sheets에서 출석 데이터를 로드합니다."""
         try:
@@ -197,6 +204,7 @@ class DataManager:
             return {}
 
 
+    @timed("sheets.save_attendance")
     def _save_attendance_data(self):
         """Google Sheets에 현재 출석 데이터를 저장합니다."""
         try:
@@ -263,6 +271,7 @@ class DataManager:
 
 # ... (DataManager 클래스 내부)
 
+    @timed("sheets.calculate_stats")
     def calculate_stats(self, start_date=None, end_date=None):
         """
         직원별 통계 계산.